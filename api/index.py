@@ -11,6 +11,16 @@ try:
 except ImportError:
     create_client = None
 
+# Reused across warm invocations so its HTTP connections stay alive
+_supabase = None
+
+def get_supabase_client(url, key):
+    """Return the module-level Supabase client, creating it on first use."""
+    global _supabase
+    if _supabase is None:
+        _supabase = create_client(url, key)
+    return _supabase
+
 class handler(BaseHTTPRequestHandler):
     """Handle HTTP requests for Vercel serverless."""
 
@@ -37,7 +47,7 @@ class handler(BaseHTTPRequestHandler):
 
         try:
             # Connect to Supabase
-            supabase = create_client(supabase_url, supabase_key)
+            supabase = get_supabase_client(supabase_url, supabase_key)
 
             # Get pending videos
             response = supabase.table('videos').select(
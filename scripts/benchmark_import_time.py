@@ -0,0 +1,136 @@
+"""Guard CLI cold start: measure module import time with ``python -X importtime``.
+
+Each entry-point module is imported in a fresh interpreter (several times,
+keeping the fastest run). The script reports its cumulative import time and
+heaviest top-level dependencies, and fails if a module goes over the budget
+or imports a heavy library that should only load on first use.
+
+Usage:
+    python scripts/benchmark_import_time.py                     # default modules
+    python scripts/benchmark_import_time.py src.jobs.backfill   # specific modules
+    python scripts/benchmark_import_time.py --budget-ms 150 --runs 5
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+PROJECT_ROOT = Path(__file__).parent.parent
+
+# CLI entry points whose cold start we care about
+DEFAULT_MODULES = [
+    "src.database.supabase_client",
+    "src.processors.script_generator",
+    "src.processors.story_selector",
+    "src.generators.tts_engine",
+    "src.generators.video_generator",
+    "src.jobs.rescore_stories",
+]
+
+# Libraries that must be imported lazily (network clients, media stacks)
+DEFERRED_PACKAGES = {"supabase", "moviepy", "PIL", "anthropic", "edge_tts", "gtts"}
+
+DEFAULT_BUDGET_MS = 250.0
+
+def measure_import(module: str) -> Tuple[float, Dict[str, float]]:
+    """Import a module in a fresh interpreter and parse -X importtime output.
+
+    Args:
+        module: Dotted module name
+
+    Returns:
+        (cumulative import time of the module in ms,
+         cumulative ms of every top-level package it pulled in)
+
+    Raises:
+        RuntimeError: If the import fails
+    """
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(filter(None, [str(PROJECT_ROOT), os.environ.get("PYTHONPATH")])))
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=PROJECT_ROOT, env=env, capture_output=True, text=True
+    )
+    if result.returncode != 0:
+        raise RuntimeError(f"import {module} failed:\n{result.stderr.splitlines()[-1]}")
+
+    total_ms = 0.0
+    top_level: Dict[str, float] = {}
+
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "[us]" in line:
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        cumulative_ms = int(cumulative) / 1000
+        package = name.rstrip()
+
+        if package == " site":
+            # Interpreter startup ends with site; only count what the module pulled in
+            top_level = {}
+            continue
+        if package.strip() == module:
+            total_ms = cumulative_ms
+        # Largest cumulative time per top-level package (its outermost import)
+        root = package.strip().split(".")[0]
+        top_level[root] = max(top_level.get(root, 0.0), cumulative_ms)
+
+    return total_ms, top_level
+
+def benchmark(modules: List[str], runs: int, budget_ms: float) -> bool:
+    """Measure every module and print a report.
+
+    Args:
+        modules: Dotted module names
+        runs: Fresh-interpreter runs per module (fastest is kept)
+        budget_ms: Maximum cumulative import time per module
+
+    Returns:
+        True if every module is within budget and defers the heavy libraries
+    """
+    ok = True
+
+    for module in modules:
+        try:
+            samples = [measure_import(module) for _ in range(runs)]
+        except RuntimeError as e:
+            print(f"❌ {e}")
+            ok = False
+            continue
+
+        total_ms, packages = min(samples, key=lambda sample: sample[0])
+        eager = sorted(DEFERRED_PACKAGES & packages.keys())
+        heaviest = sorted(
+            ((ms, name) for name, ms in packages.items() if name not in ("src", module.split(".")[0])),
+            reverse=True
+        )[:5]
+
+        within_budget = total_ms <= budget_ms
+        status = "✅" if within_budget and not eager else "❌"
+        print(f"{status} {module:36s} {total_ms:8.1f} ms")
+        print("     heaviest: " + ", ".join(f"{name} {ms:.0f}ms" for ms, name in heaviest))
+        if eager:
+            print(f"     imported at load (should be deferred): {', '.join(eager)}")
+
+        ok = ok and within_budget and not eager
+
+    return ok
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark CLI module import time")
+    parser.add_argument("modules", nargs="*", help="Modules to measure (default: CLI entry points)")
+    parser.add_argument("--runs", type=int, default=3, help="Runs per module (fastest is kept)")
+    parser.add_argument("--budget-ms", type=float, default=DEFAULT_BUDGET_MS, help="Per-module budget")
+    args = parser.parse_args()
+
+    modules = args.modules or DEFAULT_MODULES
+    print(f"Import time budget: {args.budget_ms:.0f} ms per module, best of {args.runs} runs\n")
+
+    if not benchmark(modules, args.runs, args.budget_ms):
+        print("\n❌ Import time check failed")
+        sys.exit(1)
+    print("\n✅ All modules within budget")
+
+if __name__ == "__main__":
+    main()
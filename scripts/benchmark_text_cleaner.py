@@ -0,0 +1,150 @@
+"""Micro-benchmark the compiled text cleaner against the original multi-pass version.
+
+Runs both implementations over a corpus of story files, checks that they
+produce identical output and reports throughput.
+
+Usage:
+    python scripts/benchmark_text_cleaner.py                 # uses ./draft
+    python scripts/benchmark_text_cleaner.py stories/        # one story per file
+    python scripts/benchmark_text_cleaner.py --fuzz 20000    # plus random inputs
+"""
+
+import random
+import re
+import sys
+import time
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.processors.text_cleaner import (
+    CONTRACTIONS,
+    clean_reddit_markdown,
+    fix_formatting_for_tts,
+)
+
+# ============================================================================
+# REFERENCE IMPLEMENTATION (original one-regex-per-rule passes)
+# ============================================================================
+
+def legacy_clean_reddit_markdown(text: str) -> str:
+    """Original markdown cleaner."""
+    text = re.sub(r'\*\*(.+?)\*\*', r'\1', text)
+    text = re.sub(r'\*(.+?)\*', r'\1', text)
+    text = re.sub(r'~~(.+?)~~', r'\1', text)
+    text = re.sub(r'`(.+?)`', r'\1', text)
+    text = re.sub(r'\[(.+?)\]\(.+?\)', r'\1', text)
+    text = re.sub(r'>\s?.+', '', text)
+    text = re.sub(r'#+\s+', '', text)
+    return text
+
+def legacy_fix_formatting_for_tts(text: str) -> str:
+    """Original TTS formatter."""
+    for contraction, expansion in CONTRACTIONS.items():
+        pattern = re.compile(re.escape(contraction), re.IGNORECASE)
+        text = pattern.sub(expansion, text)
+
+    text = re.sub(r'\n\n+', '. ', text)
+    text = re.sub(r'\n', ' ', text)
+    text = re.sub(r'http\S+', '', text)
+    text = re.sub(r'www\.\S+', '', text)
+    text = re.sub(r'\s+', ' ', text)
+    text = re.sub(r'\.{2,}', '.', text)
+    text = re.sub(r'!{2,}', '!', text)
+    text = re.sub(r'\?{2,}', '?', text)
+    text = re.sub(r'[^\w\s.,!?;\'-]', '', text)
+    return text.strip()
+
+# ============================================================================
+# CORPUS
+# ============================================================================
+
+FUZZ_TOKENS = [
+    "word", "I", "She's", "SHE'S", "don't", "It's", "they'd", "can't", "won't",
+    "**bold**", "*it*", "~~x~~", "`code`", "[link](http://x.y)", "> quote",
+    "# Header", "http://example.com/a?b=c", "www.reddit.com", "...", "!!", "??",
+    "—", "…", "’", "\n", "\n\n", "\n\n\n", " ", "  ", "\t", "#", "*", "'", "😀",
+]
+
+def load_corpus(paths):
+    """Load story texts, one story per file (directories contribute every file inside)."""
+    stories = []
+    for path in map(Path, paths):
+        files = sorted(p for p in path.rglob("*") if p.is_file()) if path.is_dir() else [path]
+        for file in files:
+            stories.append(file.read_text(encoding="utf-8"))
+    return stories
+
+def fuzz_corpus(count: int, seed: int = 7):
+    """Generate random texts mixing markdown, URLs, contractions and whitespace."""
+    rng = random.Random(seed)
+    return [
+        "".join(rng.choice(FUZZ_TOKENS) + rng.choice(["", " "]) for _ in range(rng.randint(1, 40)))
+        for _ in range(count)
+    ]
+
+def clean_new(text: str) -> str:
+    return fix_formatting_for_tts(clean_reddit_markdown(text))
+
+def clean_legacy(text: str) -> str:
+    return legacy_fix_formatting_for_tts(legacy_clean_reddit_markdown(text))
+
+def check_identical(stories) -> int:
+    """Return the number of stories where the two implementations differ."""
+    mismatches = 0
+    for story in stories:
+        expected = clean_legacy(story)
+        actual = clean_new(story)
+        if expected != actual:
+            mismatches += 1
+            if mismatches <= 5:
+                print(f"❌ Mismatch for input {story[:80]!r}")
+                print(f"   legacy: {expected[:120]!r}")
+                print(f"   new:    {actual[:120]!r}")
+    return mismatches
+
+def benchmark(func, stories, min_seconds: float = 1.0) -> float:
+    """Return throughput in MB/s."""
+    total_bytes = sum(len(s.encode("utf-8")) for s in stories)
+    rounds = 0
+    start = time.perf_counter()
+    while True:
+        for story in stories:
+            func(story)
+        rounds += 1
+        elapsed = time.perf_counter() - start
+        if elapsed >= min_seconds:
+            return (total_bytes * rounds) / elapsed / (1024 * 1024)
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Benchmark the text cleaner")
+    parser.add_argument("files", nargs="*", help="Story files or directories of them, one story per file (default: ./draft)")
+    parser.add_argument("--fuzz", type=int, default=0, help="Also check N random inputs for identical output")
+    parser.add_argument("--seconds", type=float, default=1.0, help="Minimum time per benchmark")
+    args = parser.parse_args()
+
+    files = args.files or [str(Path(__file__).parent.parent / "draft")]
+    stories = load_corpus(files)
+
+    print(f"Corpus: {len(stories)} stories, {sum(len(s) for s in stories)} characters")
+
+    mismatches = check_identical(stories)
+    if args.fuzz:
+        fuzz = fuzz_corpus(args.fuzz)
+        print(f"Fuzz: {len(fuzz)} random inputs")
+        mismatches += check_identical(fuzz)
+
+    if mismatches:
+        print(f"\n❌ {mismatches} input(s) produced different output")
+        sys.exit(1)
+    print("✅ Output identical to original implementation")
+
+    legacy_rate = benchmark(clean_legacy, stories, args.seconds)
+    new_rate = benchmark(clean_new, stories, args.seconds)
+
+    print(f"\nOriginal: {legacy_rate:8.2f} MB/s")
+    print(f"Compiled: {new_rate:8.2f} MB/s")
+    print(f"Speedup:  {new_rate / legacy_rate:8.2f}x")
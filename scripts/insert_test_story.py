@@ -9,7 +9,7 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from dotenv import load_dotenv
-from src.database.supabase_client import db
+from src.database.repository import db
 from src.utils.logger import get_logger
 
 load_dotenv()
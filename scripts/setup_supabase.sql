@@ -12,6 +12,7 @@ CREATE EXTENSION IF NOT EXISTS "uuid-ossp";
 CREATE TABLE IF NOT EXISTS stories (
     id UUID PRIMARY KEY DEFAULT uuid_generate_v4(),
     reddit_id VARCHAR(20) UNIQUE NOT NULL,
+    subreddit VARCHAR(50),
     title TEXT NOT NULL,
     body TEXT NOT NULL,
     author VARCHAR(100),
@@ -20,10 +21,16 @@ CREATE TABLE IF NOT EXISTS stories (
     comments INT DEFAULT 0,
     upvote_ratio FLOAT DEFAULT 0,
     awards INT DEFAULT 0,
+    word_count INT,
     virality_score FLOAT DEFAULT 0,
     sentiment_score FLOAT DEFAULT 0,
+    minhash TEXT,
+    duplicate_of UUID REFERENCES stories(id) ON DELETE SET NULL,
     status VARCHAR(50) DEFAULT 'scraped',
     scraped_at TIMESTAMP DEFAULT NOW(),
+    metrics_updated_at TIMESTAMP,
+    claimed_by VARCHAR(100),
+    lease_expires_at TIMESTAMP,
 
     CONSTRAINT valid_status CHECK (status IN ('scraped', 'selected', 'processed', 'rejected'))
 );
@@ -32,6 +39,72 @@ CREATE TABLE IF NOT EXISTS stories (
 CREATE INDEX IF NOT EXISTS idx_stories_status ON stories(status);
 CREATE INDEX IF NOT EXISTS idx_stories_virality_score ON stories(virality_score DESC);
 CREATE INDEX IF NOT EXISTS idx_stories_scraped_at ON stories(scraped_at DESC);
+-- Keyset pagination by status (get_stories_by_status)
+CREATE INDEX IF NOT EXISTS idx_stories_status_virality ON stories(status, virality_score DESC, id DESC);
+
+-- Columns added after the initial release (safe to re-run on existing databases)
+ALTER TABLE stories ADD COLUMN IF NOT EXISTS word_count INT;
+ALTER TABLE stories ADD COLUMN IF NOT EXISTS subreddit VARCHAR(50);
+ALTER TABLE stories ADD COLUMN IF NOT EXISTS metrics_updated_at TIMESTAMP;
+ALTER TABLE stories ADD COLUMN IF NOT EXISTS minhash TEXT;
+ALTER TABLE stories ADD COLUMN IF NOT EXISTS duplicate_of UUID REFERENCES stories(id) ON DELETE SET NULL;
+ALTER TABLE stories ADD COLUMN IF NOT EXISTS claimed_by VARCHAR(100);
+ALTER TABLE stories ADD COLUMN IF NOT EXISTS lease_expires_at TIMESTAMP;
+
+-- Reddit IDs scraped since a time, as one array (incremental scraping)
+CREATE OR REPLACE FUNCTION known_reddit_ids(since TIMESTAMP)
+RETURNS TEXT[] AS $$
+    SELECT COALESCE(array_agg(reddit_id), '{}') FROM stories WHERE scraped_at >= since;
+$$ LANGUAGE sql STABLE;
+
+-- Bulk update story metrics/scores in one round trip.
+-- updates: JSON array of objects with "id" plus any of the updatable columns;
+-- columns missing from an object are left unchanged.
+CREATE OR REPLACE FUNCTION bulk_update_stories(updates JSONB)
+RETURNS INT AS $$
+DECLARE
+    updated_count INT;
+BEGIN
+    UPDATE stories s SET
+        upvotes = COALESCE((u->>'upvotes')::INT, s.upvotes),
+        comments = COALESCE((u->>'comments')::INT, s.comments),
+        upvote_ratio = COALESCE((u->>'upvote_ratio')::FLOAT, s.upvote_ratio),
+        awards = COALESCE((u->>'awards')::INT, s.awards),
+        word_count = COALESCE((u->>'word_count')::INT, s.word_count),
+        sentiment_score = COALESCE((u->>'sentiment_score')::FLOAT, s.sentiment_score),
+        virality_score = COALESCE((u->>'virality_score')::FLOAT, s.virality_score),
+        metrics_updated_at = COALESCE((u->>'metrics_updated_at')::TIMESTAMP, s.metrics_updated_at)
+    FROM jsonb_array_elements(updates) u
+    WHERE s.id = (u->>'id')::UUID;
+
+    GET DIAGNOSTICS updated_count = ROW_COUNT;
+    RETURN updated_count;
+END;
+$$ LANGUAGE plpgsql;
+
+-- Atomically claim the top stories for one pipeline worker.
+-- Takes scraped stories, plus selected ones whose lease expired (the worker
+-- that claimed them died), marks them selected with the worker and a new
+-- lease, and returns them. SKIP LOCKED lets concurrent workers claim
+-- different rows instead of waiting on each other.
+CREATE OR REPLACE FUNCTION claim_stories(worker_id TEXT, claim_count INT, lease_seconds INT)
+RETURNS SETOF stories AS $$
+    WITH candidates AS (
+        SELECT id FROM stories
+        WHERE status = 'scraped'
+           OR (status = 'selected' AND lease_expires_at < NOW() AT TIME ZONE 'utc')
+        ORDER BY virality_score DESC
+        LIMIT claim_count
+        FOR UPDATE SKIP LOCKED
+    )
+    UPDATE stories s SET
+        status = 'selected',
+        claimed_by = worker_id,
+        lease_expires_at = NOW() AT TIME ZONE 'utc' + make_interval(secs => lease_seconds)
+    FROM candidates c
+    WHERE s.id = c.id
+    RETURNING s.*;
+$$ LANGUAGE sql VOLATILE;
 
 -- ============================================================================
 -- VIDEOS TABLE
@@ -57,6 +130,10 @@ CREATE TABLE IF NOT EXISTS videos (
 CREATE INDEX IF NOT EXISTS idx_videos_status ON videos(status);
 CREATE INDEX IF NOT EXISTS idx_videos_story_id ON videos(story_id);
 CREATE INDEX IF NOT EXISTS idx_videos_created_at ON videos(created_at DESC);
+-- Keyset pagination by status (get_videos_by_status)
+CREATE INDEX IF NOT EXISTS idx_videos_status_created_at ON videos(status, created_at DESC, id DESC);
+-- Dashboard's Approved page, most recently approved first
+CREATE INDEX IF NOT EXISTS idx_videos_status_approved_at ON videos(status, approved_at DESC NULLS LAST, id DESC);
 
 -- ============================================================================
 -- PLATFORM_POSTS TABLE
@@ -85,10 +162,23 @@ CREATE INDEX IF NOT EXISTS idx_platform_posts_status ON platform_posts(status);
 
 -- ============================================================================
 -- PLATFORM_METRICS TABLE
--- Stores performance metrics from each platform
+-- Stores performance metrics from each platform, partitioned by month of
+-- recorded_at so retention drops whole partitions instead of deleting rows
 -- ============================================================================
+
+-- Existing unpartitioned table (earlier setup): move it aside and copy it
+-- into the partitioned table below
+DO $$
+BEGIN
+    IF EXISTS (SELECT 1 FROM pg_class WHERE relname = 'platform_metrics' AND relkind = 'r') THEN
+        ALTER TABLE platform_metrics RENAME TO platform_metrics_unpartitioned;
+        ALTER INDEX IF EXISTS idx_platform_metrics_post_id RENAME TO idx_platform_metrics_unpartitioned_post_id;
+        ALTER INDEX IF EXISTS idx_platform_metrics_recorded_at RENAME TO idx_platform_metrics_unpartitioned_recorded_at;
+    END IF;
+END $$;
+
 CREATE TABLE IF NOT EXISTS platform_metrics (
-    id UUID PRIMARY KEY DEFAULT uuid_generate_v4(),
+    id UUID DEFAULT uuid_generate_v4(),
     post_id UUID REFERENCES platform_posts(id) ON DELETE CASCADE,
     platform VARCHAR(50) NOT NULL,
     views INT DEFAULT 0,
@@ -98,15 +188,205 @@ CREATE TABLE IF NOT EXISTS platform_metrics (
     saves INT DEFAULT 0,
     watch_time_minutes FLOAT DEFAULT 0,
     engagement_rate FLOAT DEFAULT 0,
-    recorded_at TIMESTAMP DEFAULT NOW(),
+    recorded_at TIMESTAMP NOT NULL DEFAULT NOW(),
 
+    PRIMARY KEY (id, recorded_at),
     CONSTRAINT valid_platform CHECK (platform IN ('youtube', 'instagram', 'tiktok'))
-);
+) PARTITION BY RANGE (recorded_at);
 
--- Indexes
-CREATE INDEX IF NOT EXISTS idx_platform_metrics_post_id ON platform_metrics(post_id);
+-- Indexes (created on every partition)
+CREATE INDEX IF NOT EXISTS idx_platform_metrics_post_id ON platform_metrics(post_id, recorded_at DESC);
 CREATE INDEX IF NOT EXISTS idx_platform_metrics_recorded_at ON platform_metrics(recorded_at DESC);
 
+-- Create the monthly partitions (platform_metrics_YYYY_MM) covering a time range
+CREATE OR REPLACE FUNCTION ensure_metrics_partitions(range_start TIMESTAMP, range_end TIMESTAMP)
+RETURNS VOID AS $$
+DECLARE
+    month_start DATE := date_trunc('month', range_start)::DATE;
+    partition_name TEXT;
+BEGIN
+    WHILE month_start <= range_end LOOP
+        partition_name := 'platform_metrics_' || to_char(month_start, 'YYYY_MM');
+        IF to_regclass(partition_name) IS NULL THEN
+            -- Serialize creation between concurrent ingests, then re-check
+            PERFORM pg_advisory_xact_lock(hashtext('platform_metrics_partitions'));
+        END IF;
+        IF to_regclass(partition_name) IS NULL THEN
+            EXECUTE format(
+                'CREATE TABLE %I PARTITION OF platform_metrics FOR VALUES FROM (%L) TO (%L)',
+                partition_name,
+                month_start,
+                (month_start + INTERVAL '1 month')::DATE
+            );
+        END IF;
+        month_start := (month_start + INTERVAL '1 month')::DATE;
+    END LOOP;
+END;
+$$ LANGUAGE plpgsql SECURITY DEFINER SET search_path = public;
+
+-- The metrics functions run DDL as the owner: keep them off the public RPC
+-- API (anon key) and callable with the service_role key only
+REVOKE EXECUTE ON FUNCTION ensure_metrics_partitions(TIMESTAMP, TIMESTAMP) FROM PUBLIC, anon, authenticated;
+GRANT EXECUTE ON FUNCTION ensure_metrics_partitions(TIMESTAMP, TIMESTAMP) TO service_role;
+
+-- Current and next month always exist (ingestion creates others on demand)
+DO $$
+BEGIN
+    PERFORM ensure_metrics_partitions(NOW()::TIMESTAMP, (NOW() + INTERVAL '1 month')::TIMESTAMP);
+END $$;
+
+DO $$
+DECLARE
+    oldest TIMESTAMP;
+    newest TIMESTAMP;
+BEGIN
+    IF EXISTS (SELECT 1 FROM pg_class WHERE relname = 'platform_metrics_unpartitioned') THEN
+        SELECT MIN(recorded_at), MAX(recorded_at) INTO oldest, newest FROM platform_metrics_unpartitioned;
+        IF oldest IS NOT NULL THEN
+            PERFORM ensure_metrics_partitions(oldest, newest);
+        END IF;
+        INSERT INTO platform_metrics
+        SELECT id, post_id, platform, views, likes, comments, shares, saves,
+               watch_time_minutes, engagement_rate, COALESCE(recorded_at, NOW())
+        FROM platform_metrics_unpartitioned;
+        DROP TABLE platform_metrics_unpartitioned;
+    END IF;
+END $$;
+
+-- Newest snapshot of every post, so current numbers never scan history
+CREATE TABLE IF NOT EXISTS platform_metrics_latest (
+    post_id UUID PRIMARY KEY REFERENCES platform_posts(id) ON DELETE CASCADE,
+    platform VARCHAR(50) NOT NULL,
+    views INT DEFAULT 0,
+    likes INT DEFAULT 0,
+    comments INT DEFAULT 0,
+    shares INT DEFAULT 0,
+    saves INT DEFAULT 0,
+    watch_time_minutes FLOAT DEFAULT 0,
+    engagement_rate FLOAT DEFAULT 0,
+    recorded_at TIMESTAMP NOT NULL
+);
+
+CREATE INDEX IF NOT EXISTS idx_platform_metrics_latest_platform ON platform_metrics_latest(platform);
+
+-- Keep platform_metrics_latest current for every insert path (one upsert per statement)
+CREATE OR REPLACE FUNCTION upsert_latest_metrics()
+RETURNS TRIGGER AS $$
+BEGIN
+    INSERT INTO platform_metrics_latest AS l
+        (post_id, platform, views, likes, comments, shares, saves, watch_time_minutes, engagement_rate, recorded_at)
+    SELECT DISTINCT ON (post_id)
+        post_id, platform, views, likes, comments, shares, saves, watch_time_minutes, engagement_rate, recorded_at
+    FROM new_metrics
+    WHERE post_id IS NOT NULL
+    ORDER BY post_id, recorded_at DESC
+    ON CONFLICT (post_id) DO UPDATE SET
+        platform = EXCLUDED.platform,
+        views = EXCLUDED.views,
+        likes = EXCLUDED.likes,
+        comments = EXCLUDED.comments,
+        shares = EXCLUDED.shares,
+        saves = EXCLUDED.saves,
+        watch_time_minutes = EXCLUDED.watch_time_minutes,
+        engagement_rate = EXCLUDED.engagement_rate,
+        recorded_at = EXCLUDED.recorded_at
+    WHERE EXCLUDED.recorded_at >= l.recorded_at;
+
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS platform_metrics_latest_upsert ON platform_metrics;
+CREATE TRIGGER platform_metrics_latest_upsert
+    AFTER INSERT ON platform_metrics
+    REFERENCING NEW TABLE AS new_metrics
+    FOR EACH STATEMENT EXECUTE FUNCTION upsert_latest_metrics();
+
+-- First run after partitioning: fill the latest table from stored history
+INSERT INTO platform_metrics_latest
+    (post_id, platform, views, likes, comments, shares, saves, watch_time_minutes, engagement_rate, recorded_at)
+SELECT DISTINCT ON (post_id)
+    post_id, platform, views, likes, comments, shares, saves, watch_time_minutes, engagement_rate, recorded_at
+FROM platform_metrics
+WHERE post_id IS NOT NULL AND NOT EXISTS (SELECT 1 FROM platform_metrics_latest)
+ORDER BY post_id, recorded_at DESC;
+
+-- Bulk ingestion: insert many snapshots in one round trip.
+-- snapshots: JSON array of metrics objects (post_id, platform, views, ...;
+-- recorded_at defaults to now). Missing monthly partitions are created first.
+CREATE OR REPLACE FUNCTION ingest_metrics(snapshots JSONB)
+RETURNS INT AS $$
+DECLARE
+    oldest TIMESTAMP;
+    newest TIMESTAMP;
+    inserted_count INT;
+BEGIN
+    SELECT
+        MIN(COALESCE((s->>'recorded_at')::TIMESTAMP, NOW()::TIMESTAMP)),
+        MAX(COALESCE((s->>'recorded_at')::TIMESTAMP, NOW()::TIMESTAMP))
+    INTO oldest, newest
+    FROM jsonb_array_elements(snapshots) s;
+
+    IF oldest IS NULL THEN
+        RETURN 0;
+    END IF;
+    PERFORM ensure_metrics_partitions(oldest, newest);
+
+    INSERT INTO platform_metrics
+        (post_id, platform, views, likes, comments, shares, saves, watch_time_minutes, engagement_rate, recorded_at)
+    SELECT
+        (s->>'post_id')::UUID,
+        s->>'platform',
+        COALESCE((s->>'views')::INT, 0),
+        COALESCE((s->>'likes')::INT, 0),
+        COALESCE((s->>'comments')::INT, 0),
+        COALESCE((s->>'shares')::INT, 0),
+        COALESCE((s->>'saves')::INT, 0),
+        COALESCE((s->>'watch_time_minutes')::FLOAT, 0),
+        COALESCE((s->>'engagement_rate')::FLOAT, 0),
+        COALESCE((s->>'recorded_at')::TIMESTAMP, NOW()::TIMESTAMP)
+    FROM jsonb_array_elements(snapshots) s;
+
+    GET DIAGNOSTICS inserted_count = ROW_COUNT;
+    RETURN inserted_count;
+END;
+$$ LANGUAGE plpgsql SECURITY DEFINER SET search_path = public;
+
+REVOKE EXECUTE ON FUNCTION ingest_metrics(JSONB) FROM PUBLIC, anon, authenticated;
+GRANT EXECUTE ON FUNCTION ingest_metrics(JSONB) TO service_role;
+
+-- Retention: drop monthly partitions entirely older than the cutoff.
+-- Returns the dropped partition names. Rollups and latest snapshots are kept.
+CREATE OR REPLACE FUNCTION drop_expired_metrics_partitions(retention_days INT)
+RETURNS SETOF TEXT AS $$
+DECLARE
+    cutoff TIMESTAMP;
+    part RECORD;
+BEGIN
+    -- 0 would drop every past month, a negative value the current one too
+    IF retention_days IS NULL OR retention_days < 1 THEN
+        RAISE EXCEPTION 'retention_days must be at least 1 (got %)', retention_days;
+    END IF;
+    cutoff := NOW()::TIMESTAMP - make_interval(days => retention_days);
+
+    FOR part IN
+        SELECT c.relname AS name
+        FROM pg_inherits i
+        JOIN pg_class c ON c.oid = i.inhrelid
+        WHERE i.inhparent = 'platform_metrics'::regclass
+          AND c.relname ~ '^platform_metrics_[0-9]{4}_[0-9]{2}$'
+          AND (to_date(substring(c.relname from '[0-9]{4}_[0-9]{2}$'), 'YYYY_MM') + INTERVAL '1 month') <= cutoff
+        ORDER BY c.relname
+    LOOP
+        EXECUTE format('DROP TABLE %I', part.name);
+        RETURN NEXT part.name;
+    END LOOP;
+END;
+$$ LANGUAGE plpgsql SECURITY DEFINER SET search_path = public;
+
+REVOKE EXECUTE ON FUNCTION drop_expired_metrics_partitions(INT) FROM PUBLIC, anon, authenticated;
+GRANT EXECUTE ON FUNCTION drop_expired_metrics_partitions(INT) TO service_role;
+
 -- ============================================================================
 -- UPLOAD_ERRORS TABLE
 -- Logs upload failures for debugging
@@ -126,57 +406,308 @@ CREATE TABLE IF NOT EXISTS upload_errors (
 CREATE INDEX IF NOT EXISTS idx_upload_errors_video_id ON upload_errors(video_id);
 CREATE INDEX IF NOT EXISTS idx_upload_errors_created_at ON upload_errors(created_at DESC);
 
+-- ============================================================================
+-- ANALYTICS ROLLUPS
+-- Aggregates kept current by triggers as rows arrive, so analytics reads
+-- cost the same however long the metrics history grows. Rollups only ever
+-- add metrics: raw rows deleted later (retention) stay counted.
+-- ============================================================================
+
+-- Metrics snapshots per platform per day
+CREATE TABLE IF NOT EXISTS platform_daily_metrics (
+    platform VARCHAR(50) NOT NULL,
+    day DATE NOT NULL,
+    snapshots INT DEFAULT 0,
+    views BIGINT DEFAULT 0,
+    likes BIGINT DEFAULT 0,
+    comments BIGINT DEFAULT 0,
+    shares BIGINT DEFAULT 0,
+    engagement_rate_sum FLOAT DEFAULT 0,
+    max_views INT DEFAULT 0,
+
+    PRIMARY KEY (platform, day)
+);
+
+-- Metrics snapshots and published platforms per video
+CREATE TABLE IF NOT EXISTS video_metrics_totals (
+    video_id UUID PRIMARY KEY REFERENCES videos(id) ON DELETE CASCADE,
+    platforms_posted INT DEFAULT 0,
+    snapshots INT DEFAULT 0,
+    views BIGINT DEFAULT 0,
+    likes BIGINT DEFAULT 0,
+    comments BIGINT DEFAULT 0,
+    shares BIGINT DEFAULT 0,
+    engagement_rate_sum FLOAT DEFAULT 0,
+    updated_at TIMESTAMP DEFAULT NOW()
+);
+
+CREATE INDEX IF NOT EXISTS idx_video_metrics_totals_views ON video_metrics_totals(views DESC);
+
+-- Stories per scrape day (current status and score of each story)
+CREATE TABLE IF NOT EXISTS daily_story_counts (
+    day DATE PRIMARY KEY,
+    stories_scraped INT DEFAULT 0,
+    stories_selected INT DEFAULT 0,
+    high_virality_stories INT DEFAULT 0
+);
+
+-- New metrics rows: one aggregate upsert per statement (bulk inserts included)
+CREATE OR REPLACE FUNCTION rollup_new_metrics()
+RETURNS TRIGGER AS $$
+BEGIN
+    INSERT INTO platform_daily_metrics AS r
+        (platform, day, snapshots, views, likes, comments, shares, engagement_rate_sum, max_views)
+    SELECT
+        platform, DATE(recorded_at), COUNT(*),
+        SUM(COALESCE(views, 0)), SUM(COALESCE(likes, 0)),
+        SUM(COALESCE(comments, 0)), SUM(COALESCE(shares, 0)),
+        SUM(COALESCE(engagement_rate, 0)), MAX(COALESCE(views, 0))
+    FROM new_metrics
+    GROUP BY platform, DATE(recorded_at)
+    ON CONFLICT (platform, day) DO UPDATE SET
+        snapshots = r.snapshots + EXCLUDED.snapshots,
+        views = r.views + EXCLUDED.views,
+        likes = r.likes + EXCLUDED.likes,
+        comments = r.comments + EXCLUDED.comments,
+        shares = r.shares + EXCLUDED.shares,
+        engagement_rate_sum = r.engagement_rate_sum + EXCLUDED.engagement_rate_sum,
+        max_views = GREATEST(r.max_views, EXCLUDED.max_views);
+
+    INSERT INTO video_metrics_totals AS r
+        (video_id, snapshots, views, likes, comments, shares, engagement_rate_sum)
+    SELECT
+        pp.video_id, COUNT(*),
+        SUM(COALESCE(m.views, 0)), SUM(COALESCE(m.likes, 0)),
+        SUM(COALESCE(m.comments, 0)), SUM(COALESCE(m.shares, 0)),
+        SUM(COALESCE(m.engagement_rate, 0))
+    FROM new_metrics m
+    JOIN platform_posts pp ON pp.id = m.post_id
+    WHERE pp.video_id IS NOT NULL
+    GROUP BY pp.video_id
+    ON CONFLICT (video_id) DO UPDATE SET
+        snapshots = r.snapshots + EXCLUDED.snapshots,
+        views = r.views + EXCLUDED.views,
+        likes = r.likes + EXCLUDED.likes,
+        comments = r.comments + EXCLUDED.comments,
+        shares = r.shares + EXCLUDED.shares,
+        engagement_rate_sum = r.engagement_rate_sum + EXCLUDED.engagement_rate_sum,
+        updated_at = NOW();
+
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS platform_metrics_rollup ON platform_metrics;
+CREATE TRIGGER platform_metrics_rollup
+    AFTER INSERT ON platform_metrics
+    REFERENCING NEW TABLE AS new_metrics
+    FOR EACH STATEMENT EXECUTE FUNCTION rollup_new_metrics();
+
+-- Published platforms of a video, recounted when one of its posts changes
+CREATE OR REPLACE FUNCTION rollup_published_platforms()
+RETURNS TRIGGER AS $$
+BEGIN
+    IF NEW.video_id IS NOT NULL THEN
+        INSERT INTO video_metrics_totals AS r (video_id, platforms_posted)
+        SELECT NEW.video_id, COUNT(DISTINCT platform)
+        FROM platform_posts
+        WHERE video_id = NEW.video_id AND status = 'published'
+        ON CONFLICT (video_id) DO UPDATE SET
+            platforms_posted = EXCLUDED.platforms_posted,
+            updated_at = NOW();
+    END IF;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS platform_posts_rollup ON platform_posts;
+CREATE TRIGGER platform_posts_rollup
+    AFTER INSERT OR UPDATE OF status ON platform_posts
+    FOR EACH ROW EXECUTE FUNCTION rollup_published_platforms();
+
+-- Story changes: apply the per-day difference of every statement's rows.
+-- Metric refreshes that don't change status, scrape day or the high
+-- virality flag leave the counts untouched.
+CREATE OR REPLACE FUNCTION rollup_story_counts()
+RETURNS TRIGGER AS $$
+BEGIN
+    IF TG_OP = 'INSERT' THEN
+        INSERT INTO daily_story_counts AS r (day, stories_scraped, stories_selected, high_virality_stories)
+        SELECT
+            DATE(scraped_at), COUNT(*),
+            COUNT(*) FILTER (WHERE status = 'selected'),
+            COUNT(*) FILTER (WHERE virality_score > 50)
+        FROM new_stories
+        GROUP BY DATE(scraped_at)
+        ON CONFLICT (day) DO UPDATE SET
+            stories_scraped = r.stories_scraped + EXCLUDED.stories_scraped,
+            stories_selected = r.stories_selected + EXCLUDED.stories_selected,
+            high_virality_stories = r.high_virality_stories + EXCLUDED.high_virality_stories;
+
+    ELSIF TG_OP = 'UPDATE' THEN
+        INSERT INTO daily_story_counts AS r (day, stories_scraped, stories_selected, high_virality_stories)
+        SELECT day, SUM(scraped), SUM(selected), SUM(high)
+        FROM (
+            SELECT DATE(n.scraped_at) AS day, 1 AS scraped,
+                   (n.status = 'selected')::INT AS selected,
+                   COALESCE(n.virality_score > 50, FALSE)::INT AS high
+            FROM new_stories n JOIN old_stories o ON o.id = n.id
+            WHERE (DATE(n.scraped_at), n.status = 'selected', COALESCE(n.virality_score > 50, FALSE))
+                IS DISTINCT FROM (DATE(o.scraped_at), o.status = 'selected', COALESCE(o.virality_score > 50, FALSE))
+            UNION ALL
+            SELECT DATE(o.scraped_at), -1,
+                   -(o.status = 'selected')::INT,
+                   -COALESCE(o.virality_score > 50, FALSE)::INT
+            FROM new_stories n JOIN old_stories o ON o.id = n.id
+            WHERE (DATE(n.scraped_at), n.status = 'selected', COALESCE(n.virality_score > 50, FALSE))
+                IS DISTINCT FROM (DATE(o.scraped_at), o.status = 'selected', COALESCE(o.virality_score > 50, FALSE))
+        ) changes
+        GROUP BY day
+        ON CONFLICT (day) DO UPDATE SET
+            stories_scraped = r.stories_scraped + EXCLUDED.stories_scraped,
+            stories_selected = r.stories_selected + EXCLUDED.stories_selected,
+            high_virality_stories = r.high_virality_stories + EXCLUDED.high_virality_stories;
+
+    ELSIF TG_OP = 'DELETE' THEN
+        UPDATE daily_story_counts r SET
+            stories_scraped = r.stories_scraped - d.scraped,
+            stories_selected = r.stories_selected - d.selected,
+            high_virality_stories = r.high_virality_stories - d.high
+        FROM (
+            SELECT
+                DATE(scraped_at) AS day, COUNT(*) AS scraped,
+                COUNT(*) FILTER (WHERE status = 'selected') AS selected,
+                COUNT(*) FILTER (WHERE virality_score > 50) AS high
+            FROM old_stories
+            GROUP BY DATE(scraped_at)
+        ) d
+        WHERE r.day = d.day;
+    END IF;
+
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS stories_rollup_insert ON stories;
+CREATE TRIGGER stories_rollup_insert
+    AFTER INSERT ON stories
+    REFERENCING NEW TABLE AS new_stories
+    FOR EACH STATEMENT EXECUTE FUNCTION rollup_story_counts();
+
+DROP TRIGGER IF EXISTS stories_rollup_update ON stories;
+CREATE TRIGGER stories_rollup_update
+    AFTER UPDATE ON stories
+    REFERENCING OLD TABLE AS old_stories NEW TABLE AS new_stories
+    FOR EACH STATEMENT EXECUTE FUNCTION rollup_story_counts();
+
+DROP TRIGGER IF EXISTS stories_rollup_delete ON stories;
+CREATE TRIGGER stories_rollup_delete
+    AFTER DELETE ON stories
+    REFERENCING OLD TABLE AS old_stories
+    FOR EACH STATEMENT EXECUTE FUNCTION rollup_story_counts();
+
+-- Rebuild every rollup from the raw tables (existing databases, or repair).
+-- Metrics already removed by retention are lost from the rebuilt totals.
+CREATE OR REPLACE FUNCTION refresh_analytics_rollups()
+RETURNS VOID AS $$
+BEGIN
+    TRUNCATE platform_daily_metrics, video_metrics_totals, daily_story_counts;
+
+    INSERT INTO platform_daily_metrics
+        (platform, day, snapshots, views, likes, comments, shares, engagement_rate_sum, max_views)
+    SELECT
+        platform, DATE(recorded_at), COUNT(*),
+        SUM(COALESCE(views, 0)), SUM(COALESCE(likes, 0)),
+        SUM(COALESCE(comments, 0)), SUM(COALESCE(shares, 0)),
+        SUM(COALESCE(engagement_rate, 0)), MAX(COALESCE(views, 0))
+    FROM platform_metrics
+    GROUP BY platform, DATE(recorded_at);
+
+    INSERT INTO video_metrics_totals
+        (video_id, platforms_posted, snapshots, views, likes, comments, shares, engagement_rate_sum)
+    SELECT
+        pp.video_id,
+        COUNT(DISTINCT pp.platform) FILTER (WHERE pp.status = 'published'),
+        COUNT(m.id),
+        COALESCE(SUM(m.views), 0), COALESCE(SUM(m.likes), 0),
+        COALESCE(SUM(m.comments), 0), COALESCE(SUM(m.shares), 0),
+        COALESCE(SUM(m.engagement_rate), 0)
+    FROM platform_posts pp
+    LEFT JOIN platform_metrics m ON m.post_id = pp.id
+    WHERE pp.video_id IS NOT NULL
+    GROUP BY pp.video_id;
+
+    INSERT INTO daily_story_counts (day, stories_scraped, stories_selected, high_virality_stories)
+    SELECT
+        DATE(scraped_at), COUNT(*),
+        COUNT(*) FILTER (WHERE status = 'selected'),
+        COUNT(*) FILTER (WHERE virality_score > 50)
+    FROM stories
+    GROUP BY DATE(scraped_at);
+END;
+$$ LANGUAGE plpgsql;
+
+-- First run on an existing database: build the rollups from what is stored
+DO $$
+BEGIN
+    IF NOT EXISTS (SELECT 1 FROM daily_story_counts) AND NOT EXISTS (SELECT 1 FROM platform_daily_metrics) THEN
+        PERFORM refresh_analytics_rollups();
+    END IF;
+END $$;
+
 -- ============================================================================
 -- VIEWS FOR ANALYTICS
+-- Read the rollups above (same columns as the original aggregate views)
 -- ============================================================================
 
 -- View: Top performing videos across all platforms
-CREATE OR REPLACE VIEW top_performing_videos AS
+DROP VIEW IF EXISTS top_performing_videos;
+CREATE VIEW top_performing_videos AS
 SELECT
     v.id as video_id,
     s.title as story_title,
     s.virality_score,
     v.duration,
     v.created_at,
-    COUNT(DISTINCT pp.platform) as platforms_posted,
-    SUM(pm.views) as total_views,
-    SUM(pm.likes) as total_likes,
-    SUM(pm.comments) as total_comments,
-    SUM(pm.shares) as total_shares,
-    AVG(pm.engagement_rate) as avg_engagement_rate
-FROM videos v
+    t.platforms_posted,
+    t.views as total_views,
+    t.likes as total_likes,
+    t.comments as total_comments,
+    t.shares as total_shares,
+    t.engagement_rate_sum / NULLIF(t.snapshots, 0) as avg_engagement_rate
+FROM video_metrics_totals t
+JOIN videos v ON v.id = t.video_id
 JOIN stories s ON v.story_id = s.id
-LEFT JOIN platform_posts pp ON v.id = pp.video_id
-LEFT JOIN platform_metrics pm ON pp.id = pm.post_id
-WHERE v.status = 'approved' AND pp.status = 'published'
-GROUP BY v.id, s.title, s.virality_score, v.duration, v.created_at
+WHERE v.status = 'approved' AND t.platforms_posted > 0
 ORDER BY total_views DESC;
 
 -- View: Platform performance comparison
-CREATE OR REPLACE VIEW platform_performance AS
+DROP VIEW IF EXISTS platform_performance;
+CREATE VIEW platform_performance AS
 SELECT
     platform,
-    COUNT(*) as total_posts,
-    AVG(views) as avg_views,
-    AVG(likes) as avg_likes,
-    AVG(comments) as avg_comments,
-    AVG(shares) as avg_shares,
-    AVG(engagement_rate) as avg_engagement_rate,
-    MAX(views) as max_views,
+    SUM(snapshots) as total_posts,
+    SUM(views)::FLOAT / NULLIF(SUM(snapshots), 0) as avg_views,
+    SUM(likes)::FLOAT / NULLIF(SUM(snapshots), 0) as avg_likes,
+    SUM(comments)::FLOAT / NULLIF(SUM(snapshots), 0) as avg_comments,
+    SUM(shares)::FLOAT / NULLIF(SUM(snapshots), 0) as avg_shares,
+    SUM(engagement_rate_sum) / NULLIF(SUM(snapshots), 0) as avg_engagement_rate,
+    MAX(max_views) as max_views,
     SUM(views) as total_views
-FROM platform_metrics
+FROM platform_daily_metrics
 GROUP BY platform
 ORDER BY total_views DESC;
 
 -- View: Daily pipeline status
-CREATE OR REPLACE VIEW daily_pipeline_status AS
+DROP VIEW IF EXISTS daily_pipeline_status;
+CREATE VIEW daily_pipeline_status AS
 SELECT
-    DATE(scraped_at) as date,
-    COUNT(*) as stories_scraped,
-    SUM(CASE WHEN status = 'selected' THEN 1 ELSE 0 END) as stories_selected,
-    SUM(CASE WHEN virality_score > 50 THEN 1 ELSE 0 END) as high_virality_stories
-FROM stories
-GROUP BY DATE(scraped_at)
+    day as date,
+    stories_scraped,
+    stories_selected,
+    high_virality_stories
+FROM daily_story_counts
+WHERE stories_scraped > 0
 ORDER BY date DESC;
 
 -- ============================================================================
@@ -204,9 +735,13 @@ VALUES (
 DO $$
 BEGIN
     RAISE NOTICE 'Database setup complete!';
-    RAISE NOTICE 'Tables created: stories, videos, platform_posts, platform_metrics, upload_errors';
+    RAISE NOTICE 'Tables created: stories, videos, platform_posts, platform_metrics (monthly partitions), platform_metrics_latest, upload_errors';
     RAISE NOTICE 'Views created: top_performing_videos, platform_performance, daily_pipeline_status';
+    RAISE NOTICE 'Rollups created: platform_daily_metrics, video_metrics_totals, daily_story_counts';
+    RAISE NOTICE 'Functions created: bulk_update_stories, claim_stories, known_reddit_ids, refresh_analytics_rollups,';
+    RAISE NOTICE '                   ingest_metrics, ensure_metrics_partitions, drop_expired_metrics_partitions';
     RAISE NOTICE 'Next steps:';
     RAISE NOTICE '1. Copy your Supabase URL and anon key to .env file';
     RAISE NOTICE '2. Test connection with: python src/database/supabase_client.py';
+    RAISE NOTICE 'Metrics ingestion and pruning need the service_role key (the anon key cannot call them)';
 END $$;
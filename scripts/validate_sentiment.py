@@ -0,0 +1,114 @@
+"""Validate the batch sentiment scorer against TextBlob.
+
+Scores a fixture corpus with TextBlob and with the scorer, reports the
+differences and throughput, and fails if the scorer drifts from TextBlob.
+
+Usage:
+    python scripts/validate_sentiment.py                  # ./draft + built-in fixtures
+    python scripts/validate_sentiment.py stories/*.txt    # custom corpus
+    python scripts/validate_sentiment.py --fuzz 20000     # plus random inputs
+"""
+
+import random
+import sys
+import time
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from textblob import TextBlob
+from src.processors.sentiment import SentimentScorer
+
+# Sentences exercising modifiers, negations, exclamations, emoticons and sentence breaks
+FIXTURES = [
+    "I love this so much!",
+    "This is not good at all.",
+    "It wasn't bad, honestly. Not bad!!",
+    "She was really very happy :) but he was terribly sad :(",
+    "I can't believe he never told me. Never!",
+    "What an absolutely amazing, wonderful day (!)",
+    "\"Great,\" she said. 'Just great.'",
+    "My fiancé cheated on me with my best friend...\n\nI'm devastated.",
+    "Mr. Smith was e.g. kind of weird.",
+    "<3 xD :-D ;) :/ :'(",
+    "The food was okay, but the service was slow and the staff were rude.",
+    "TL;DR: she lied, I left, and I'm happier now.",
+]
+
+FUZZ_TOKENS = [
+    "good", "bad", "very", "really", "not", "never", "no", "don't", "isn't", "I'm",
+    "happily", "terribly", "!", "!!", "?", "...", ".", ",", "(!)", "( ! )", ":)", ":-(",
+    ":'(", "<3", "xD", "o.O", "\"", "'", "“", "”", "’", "e.g.", "Mr.", "love", "hate",
+    "\n", "\n\n", "perfect—but", "well-known",
+]
+
+def load_corpus(paths):
+    """Load texts from files, plus each paragraph on its own."""
+    texts = []
+    for path in paths:
+        text = Path(path).read_text(encoding="utf-8")
+        texts.append(text)
+        texts.extend(p for p in text.split("\n\n") if p.strip())
+    return texts
+
+def fuzz_corpus(count: int, seed: int = 7):
+    """Generate random texts mixing lexicon words, negations and punctuation."""
+    rng = random.Random(seed)
+    return [
+        "".join(rng.choice(FUZZ_TOKENS) + rng.choice(["", " ", " "]) for _ in range(rng.randint(1, 50)))
+        for _ in range(count)
+    ]
+
+def compare(name: str, expected, actual, show: int = 5) -> float:
+    """Print difference statistics and return the maximum absolute difference."""
+    diffs = [abs(e - a) for e, a in zip(expected, actual)]
+    worst = max(diffs, default=0.0)
+    mean = sum(diffs) / len(diffs) if diffs else 0.0
+    print(f"{name:8s} mean |diff| {mean:.6f}   max |diff| {worst:.6f}")
+    return worst
+
+def throughput(func, texts, min_seconds: float = 1.0) -> float:
+    """Return throughput in texts per second."""
+    rounds = 0
+    start = time.perf_counter()
+    while True:
+        func(texts)
+        rounds += 1
+        elapsed = time.perf_counter() - start
+        if elapsed >= min_seconds:
+            return len(texts) * rounds / elapsed
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Validate sentiment scores against TextBlob")
+    parser.add_argument("files", nargs="*", help="Text files (default: ./draft)")
+    parser.add_argument("--fuzz", type=int, default=0, help="Also check N random inputs")
+    parser.add_argument("--tolerance", type=float, default=1e-9, help="Maximum allowed difference")
+    parser.add_argument("--seconds", type=float, default=1.0, help="Minimum time per benchmark")
+    args = parser.parse_args()
+
+    files = args.files or [str(Path(__file__).parent.parent / "draft")]
+    texts = FIXTURES + load_corpus(files)
+    if args.fuzz:
+        texts += fuzz_corpus(args.fuzz)
+
+    print(f"Corpus: {len(texts)} texts, {sum(len(t) for t in texts)} characters\n")
+
+    expected = [TextBlob(text).sentiment.polarity for text in texts]
+    scorer = SentimentScorer(cache_size=0)
+
+    diff = compare("scorer", expected, scorer.score_batch(texts))
+
+    benchmark_texts = texts[:2000]
+    textblob_rate = throughput(lambda batch: [TextBlob(t).sentiment.polarity for t in batch], benchmark_texts, args.seconds)
+    scorer_rate = throughput(scorer.score_batch, benchmark_texts, args.seconds)
+
+    print(f"\nTextBlob: {textblob_rate:10.0f} texts/s")
+    print(f"Scorer:   {scorer_rate:10.0f} texts/s ({scorer_rate / textblob_rate:.1f}x)")
+
+    if diff > args.tolerance:
+        print(f"\n❌ Scorer differs from TextBlob by up to {diff:.6f}")
+        sys.exit(1)
+    print("\n✅ Scorer matches TextBlob")
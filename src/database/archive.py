@@ -0,0 +1,324 @@
+"""Local Parquet archive of the database for offline analytics and rescoring."""
+
+import json
+import uuid
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.dataset as ds
+import pyarrow.parquet as pq
+from src.utils.logger import get_logger
+from src.utils.config_loader import config
+
+logger = get_logger(__name__)
+
+# Archived tables: the timestamp column they sync and partition by, and their schema
+ARCHIVE_TABLES = {
+    "stories": ("scraped_at", pa.schema([
+        ("id", pa.string()),
+        ("reddit_id", pa.string()),
+        ("subreddit", pa.string()),
+        ("title", pa.string()),
+        ("body", pa.string()),
+        ("author", pa.string()),
+        ("created_utc", pa.timestamp("us")),
+        ("upvotes", pa.int64()),
+        ("comments", pa.int64()),
+        ("upvote_ratio", pa.float64()),
+        ("awards", pa.int64()),
+        ("word_count", pa.int64()),
+        ("virality_score", pa.float64()),
+        ("sentiment_score", pa.float64()),
+        ("status", pa.string()),
+        ("duplicate_of", pa.string()),
+        ("scraped_at", pa.timestamp("us")),
+        ("metrics_updated_at", pa.timestamp("us")),
+    ])),
+    "videos": ("created_at", pa.schema([
+        ("id", pa.string()),
+        ("story_id", pa.string()),
+        ("video_url", pa.string()),
+        ("local_path", pa.string()),
+        ("duration", pa.float64()),
+        ("file_size_mb", pa.float64()),
+        ("status", pa.string()),
+        ("approved_at", pa.timestamp("us")),
+        ("approved_by", pa.string()),
+        ("rejection_reason", pa.string()),
+        ("created_at", pa.timestamp("us")),
+    ])),
+    "platform_posts": ("created_at", pa.schema([
+        ("id", pa.string()),
+        ("video_id", pa.string()),
+        ("platform", pa.string()),
+        ("post_id", pa.string()),
+        ("post_url", pa.string()),
+        ("status", pa.string()),
+        ("published_at", pa.timestamp("us")),
+        ("error_message", pa.string()),
+        ("retry_count", pa.int64()),
+        ("created_at", pa.timestamp("us")),
+    ])),
+    "platform_metrics": ("recorded_at", pa.schema([
+        ("id", pa.string()),
+        ("post_id", pa.string()),
+        ("platform", pa.string()),
+        ("views", pa.int64()),
+        ("likes", pa.int64()),
+        ("comments", pa.int64()),
+        ("shares", pa.int64()),
+        ("saves", pa.int64()),
+        ("watch_time_minutes", pa.float64()),
+        ("engagement_rate", pa.float64()),
+        ("recorded_at", pa.timestamp("us")),
+    ])),
+}
+
+def _parse_timestamp(value: Optional[str]) -> Optional[datetime]:
+    """Parse a PostgREST timestamp (naive UTC) into a datetime."""
+    if value is None:
+        return None
+    if value.endswith("Z"):
+        value = value[:-1]
+    elif value.endswith("+00:00"):
+        value = value[:-6]
+    return datetime.fromisoformat(value)
+
+def _to_arrow(rows: List[Dict], schema: pa.Schema) -> pa.Table:
+    """Convert database rows to an Arrow table with the archive schema."""
+    columns = {}
+    for field in schema:
+        values = [row.get(field.name) for row in rows]
+        if pa.types.is_timestamp(field.type):
+            values = [_parse_timestamp(value) for value in values]
+        columns[field.name] = pa.array(values, type=field.type)
+    return pa.table(columns, schema=schema)
+
+class ParquetArchive:
+    """Month-partitioned Parquet copy of the stories, videos and metrics tables.
+
+    Layout: ``<root>/<table>/month=YYYY-MM/part-<sync>.parquet``. Each sync
+    appends new part files for rows past the table's watermark (the last
+    synced (timestamp, id), kept in ``_watermarks.json``), so it only pulls
+    what was added since the previous run. Rows are archived as of the time
+    they were synced; later metric refreshes are not re-exported.
+    """
+
+    def __init__(self, root: Optional[str] = None, db=None):
+        """Initialize archive.
+
+        Args:
+            root: Archive directory. If None, uses config value.
+            db: Database client for syncing. If None, uses the global client.
+        """
+        if root is None:
+            root = config.get("archive.path", "data/archive")
+            root = Path(__file__).parent.parent.parent / root
+
+        self.root = Path(root)
+        self._db = db
+        self.watermark_path = self.root / "_watermarks.json"
+
+    @property
+    def db(self):
+        """Database client (imported on first sync, so loading works offline)."""
+        if self._db is None:
+            from src.database.repository import db
+            self._db = db
+        return self._db
+
+    def _load_watermarks(self) -> Dict[str, List[str]]:
+        """Load per-table (timestamp, id) watermarks."""
+        if not self.watermark_path.exists():
+            return {}
+        with open(self.watermark_path, 'r') as f:
+            return json.load(f)
+
+    def _save_watermarks(self, watermarks: Dict[str, List[str]]) -> None:
+        """Write watermarks atomically."""
+        self.root.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.watermark_path.with_suffix(".tmp")
+        with open(tmp_path, 'w') as f:
+            json.dump(watermarks, f, indent=2)
+        tmp_path.replace(self.watermark_path)
+
+    def _write_pages(self, table: str, pages: Iterable[List[Dict]], sync_id: str) -> Optional[List[str]]:
+        """Write row pages into monthly partitions.
+
+        Returns:
+            Watermark of the last row written, or None if there were no rows
+        """
+        column, schema = ARCHIVE_TABLES[table]
+        watermark = None
+
+        for page_number, rows in enumerate(pages):
+            data = _to_arrow(rows, schema)
+            months = pc.strftime(data[column], format="%Y-%m").to_pylist()
+
+            for month in sorted(set(months)):
+                mask = pa.array([m == month for m in months])
+                partition = self.root / table / f"month={month}"
+                partition.mkdir(parents=True, exist_ok=True)
+                pq.write_table(
+                    data.filter(mask),
+                    partition / f"part-{sync_id}-{page_number:05d}.parquet",
+                    compression="zstd"
+                )
+
+            watermark = [rows[-1][column], rows[-1]["id"]]
+
+        return watermark
+
+    def sync_table(self, table: str, page_size: int = 1000, raise_errors: bool = False) -> int:
+        """Append rows added since the last sync of a table.
+
+        Args:
+            table: One of ARCHIVE_TABLES
+            page_size: Rows fetched per request (and per part file)
+            raise_errors: Re-raise a failed sync instead of logging it and
+                returning 0 (for callers that delete data afterwards)
+
+        Returns:
+            Number of rows archived
+        """
+        column, schema = ARCHIVE_TABLES[table]
+        watermarks = self._load_watermarks()
+        after = watermarks.get(table)
+
+        rows_written = 0
+
+        def pages():
+            nonlocal rows_written
+            for page in self.db.iter_rows_since(
+                table, column,
+                after=tuple(after) if after else None,
+                columns=", ".join(schema.names),
+                page_size=page_size
+            ):
+                rows_written += len(page)
+                yield page
+
+        sync_id = f"{datetime.utcnow():%Y%m%dT%H%M%S}-{uuid.uuid4().hex[:8]}"
+        try:
+            watermark = self._write_pages(table, pages(), sync_id)
+        except Exception as e:
+            # Drop this sync's partial files so the retry doesn't archive rows twice
+            for path in (self.root / table).glob(f"month=*/part-{sync_id}-*.parquet"):
+                path.unlink()
+            logger.error(f"Failed to archive {table}: {e}")
+            if raise_errors:
+                raise
+            return 0
+
+        # Written only after every page landed: a failed sync is retried from the old watermark
+        if watermark is not None:
+            watermarks[table] = watermark
+            self._save_watermarks(watermarks)
+
+        logger.info(f"Archived {rows_written} new {table} rows")
+        return rows_written
+
+    def sync(self, tables: Optional[List[str]] = None) -> Dict[str, int]:
+        """Sync several tables.
+
+        Args:
+            tables: Tables to sync. If None, syncs all of ARCHIVE_TABLES.
+
+        Returns:
+            Rows archived per table
+        """
+        return {table: self.sync_table(table) for table in (tables or list(ARCHIVE_TABLES))}
+
+    def dataset(self, table: str) -> ds.Dataset:
+        """Open a table's archive as a (lazily read) Arrow dataset.
+
+        Args:
+            table: One of ARCHIVE_TABLES
+
+        Returns:
+            Arrow dataset partitioned by month
+        """
+        return ds.dataset(
+            self.root / table,
+            format="parquet",
+            partitioning=ds.partitioning(pa.schema([("month", pa.string())]), flavor="hive"),
+        )
+
+    def load_table(
+        self,
+        table: str,
+        columns: Optional[List[str]] = None,
+        months: Optional[List[str]] = None
+    ) -> pa.Table:
+        """Read archived rows into an Arrow table (files are memory-mapped).
+
+        Args:
+            table: One of ARCHIVE_TABLES
+            columns: Columns to read (e.g. leave out body). If None, reads all.
+            months: Only these partitions (YYYY-MM). If None, reads all.
+
+        Returns:
+            Arrow table (empty if nothing has been archived yet)
+        """
+        schema = ARCHIVE_TABLES[table][1]
+        if not (self.root / table).exists():
+            return schema.empty_table().select(columns or schema.names)
+
+        months_filter = ds.field("month").isin(months) if months else None
+        pieces = [
+            pq.read_table(fragment.path, columns=columns, memory_map=True)
+            for fragment in self.dataset(table).get_fragments(filter=months_filter)
+        ]
+        if not pieces:
+            return schema.empty_table().select(columns or schema.names)
+        return pa.concat_tables(pieces)
+
+    def load_dataframe(
+        self,
+        table: str,
+        columns: Optional[List[str]] = None,
+        months: Optional[List[str]] = None
+    ) -> pd.DataFrame:
+        """Read archived rows into pandas.
+
+        Args:
+            table: One of ARCHIVE_TABLES
+            columns: Columns to read. If None, reads all.
+            months: Only these partitions (YYYY-MM). If None, reads all.
+
+        Returns:
+            DataFrame of archived rows
+        """
+        return self.load_table(table, columns=columns, months=months).to_pandas()
+
+    def load_arrays(self, table: str, columns: List[str], months: Optional[List[str]] = None) -> Dict[str, np.ndarray]:
+        """Read numeric/timestamp columns as NumPy arrays (e.g. for ViralityScorer.score_arrays).
+
+        Args:
+            table: One of ARCHIVE_TABLES
+            columns: Columns to read
+            months: Only these partitions (YYYY-MM). If None, reads all.
+
+        Returns:
+            Mapping of column name to array (NULLs become NaN / NaT)
+        """
+        data = self.load_table(table, columns=columns, months=months)
+        return {name: data[name].to_numpy() for name in columns}
+
+__all__ = ["ParquetArchive", "ARCHIVE_TABLES"]
+
+# CLI interface
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Sync the local Parquet archive from the database")
+    parser.add_argument("--table", action="append", choices=list(ARCHIVE_TABLES), help="Tables to sync (repeatable)")
+    args = parser.parse_args()
+
+    counts = ParquetArchive().sync(args.table)
+    for name, count in counts.items():
+        print(f"✅ {name}: {count} new rows archived")
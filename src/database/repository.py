@@ -0,0 +1,264 @@
+"""Storage interface shared by the Supabase and SQLite backends."""
+
+from abc import ABC, abstractmethod
+from typing import Any, Dict, Iterator, List, Optional, Set, Tuple
+from src.utils.logger import get_logger
+from src.utils.config_loader import config
+from src.utils.lazy import LazyProxy
+
+logger = get_logger(__name__)
+
+# Columns refreshed when an upserted story already exists (status, scraped_at
+# and dedup fields are never overwritten)
+STORY_UPSERT_UPDATE_COLUMNS = (
+    "upvotes", "comments", "upvote_ratio", "awards",
+    "word_count", "sentiment_score", "virality_score",
+)
+
+class Repository(ABC):
+    """Persistence operations the pipeline relies on.
+
+    Every backend keeps the same row shapes (dicts keyed by column name,
+    timestamps as ISO strings) and the same error behaviour: failures are
+    logged and reported as None/False/[]/0, except where a method documents
+    that it raises.
+    """
+
+    # Stories
+
+    @abstractmethod
+    def insert_story(self, story_data: Dict[str, Any]) -> Optional[Dict]:
+        """Insert a story; returns the stored row or None."""
+
+    @abstractmethod
+    def get_known_reddit_ids(self, since: str) -> Set[str]:
+        """reddit_ids scraped at or after an ISO timestamp."""
+
+    @abstractmethod
+    def get_existing_stories(self, reddit_ids: List[str]) -> Dict[str, Dict]:
+        """Stored rows (id, reddit_id, update columns) by reddit_id; raises on failure."""
+
+    @abstractmethod
+    def upsert_stories(
+        self,
+        batch: List[Dict[str, Any]],
+        chunk_size: Optional[int] = None,
+        existing: Optional[Dict[str, Dict]] = None
+    ) -> List[Dict[str, Any]]:
+        """Insert new stories and refresh metrics of stored ones; per-row outcomes."""
+
+    @abstractmethod
+    def get_stories_by_status(
+        self,
+        status: str,
+        limit: int = 100,
+        columns: str = "*",
+        after: Optional[Tuple[float, str]] = None
+    ) -> List[Dict]:
+        """One page of stories with a status, ordered by (virality_score, id) descending.
+
+        after is the (virality_score, id) of the last row of the previous page.
+        """
+
+    def iter_stories_by_status(self, status: str, columns: str = "*", page_size: int = 100) -> Iterator[List[Dict]]:
+        """Stream stories with a status in pages, highest virality first.
+
+        Args:
+            status: Story status
+            columns: Columns to select (must include id and virality_score)
+            page_size: Rows per page
+
+        Yields:
+            Lists of story dictionaries
+        """
+        after = None
+        while True:
+            page = self.get_stories_by_status(status, limit=page_size, columns=columns, after=after)
+            if not page:
+                return
+            yield page
+            if len(page) < page_size:
+                return
+            after = (page[-1]["virality_score"], page[-1]["id"])
+
+    @abstractmethod
+    def get_story(self, story_id: str, columns: str = "*") -> Optional[Dict]:
+        """One story by id, or None if missing."""
+
+    @abstractmethod
+    def claim_stories(self, worker_id: str, count: int, lease_seconds: int) -> List[Dict]:
+        """Atomically mark the top claimable stories selected by a worker, under a lease."""
+
+    @abstractmethod
+    def update_story_status(self, story_id: str, status: str) -> bool:
+        """Set a story's status."""
+
+    @abstractmethod
+    def update_statuses(self, table: str, ids: List[str], status: str) -> bool:
+        """Set the same status on many rows of a table in one statement."""
+
+    @abstractmethod
+    def mark_story_duplicate(self, story_id: str, duplicate_of: str) -> bool:
+        """Reject a story as a near-duplicate of another."""
+
+    @abstractmethod
+    def get_stories_by_ids(self, story_ids: List[str], columns: str = "*") -> List[Dict]:
+        """Several stories by id, in one query."""
+
+    @abstractmethod
+    def iter_story_pages(
+        self,
+        columns: str = "*",
+        page_size: int = 1000,
+        scraped_after: Optional[str] = None,
+        status: Optional[str] = None
+    ) -> Iterator[List[Dict]]:
+        """Stream stories in pages ordered by id (keyset pagination)."""
+
+    @abstractmethod
+    def iter_rows_since(
+        self,
+        table: str,
+        column: str,
+        after: Optional[Tuple[str, str]] = None,
+        columns: str = "*",
+        page_size: int = 1000
+    ) -> Iterator[List[Dict]]:
+        """Stream rows past a (timestamp, id) watermark; raises on failure."""
+
+    @abstractmethod
+    def bulk_update_stories(self, updates: List[Dict[str, Any]]) -> int:
+        """Apply many partial story updates at once; returns rows updated."""
+
+    # Videos
+
+    @abstractmethod
+    def insert_video(self, video_data: Dict[str, Any]) -> Optional[Dict]:
+        """Insert a video; returns the stored row or None."""
+
+    @abstractmethod
+    def get_videos_by_status(
+        self,
+        status: str,
+        limit: int = 100,
+        columns: str = "*",
+        story_columns: Optional[str] = "*",
+        after: Optional[Tuple[str, str]] = None
+    ) -> List[Dict]:
+        """One page of videos with a status, ordered by (created_at, id) descending.
+
+        Each video has its story (story_columns) under 'stories', unless
+        story_columns is None. after is the (created_at, id) of the last row
+        of the previous page.
+        """
+
+    def iter_videos_by_status(
+        self,
+        status: str,
+        columns: str = "*",
+        story_columns: Optional[str] = "*",
+        page_size: int = 100
+    ) -> Iterator[List[Dict]]:
+        """Stream videos with a status in pages, newest first.
+
+        Args:
+            status: Video status
+            columns: Video columns to select (must include id and created_at)
+            story_columns: Story columns embedded under 'stories' (None for no story)
+            page_size: Rows per page
+
+        Yields:
+            Lists of video dictionaries
+        """
+        after = None
+        while True:
+            page = self.get_videos_by_status(
+                status, limit=page_size, columns=columns, story_columns=story_columns, after=after
+            )
+            if not page:
+                return
+            yield page
+            if len(page) < page_size:
+                return
+            after = (page[-1]["created_at"], page[-1]["id"])
+
+    @abstractmethod
+    def update_video_status(
+        self,
+        video_id: str,
+        status: str,
+        approved_by: Optional[str] = None,
+        rejection_reason: Optional[str] = None
+    ) -> bool:
+        """Approve or reject a video."""
+
+    # Platform posts and metrics
+
+    @abstractmethod
+    def insert_platform_post(self, post_data: Dict[str, Any]) -> Optional[Dict]:
+        """Insert a platform post; returns the stored row or None."""
+
+    @abstractmethod
+    def update_platform_post_status(
+        self,
+        post_id: str,
+        status: str,
+        post_url: Optional[str] = None,
+        error_message: Optional[str] = None
+    ) -> bool:
+        """Mark a platform post published or failed."""
+
+    @abstractmethod
+    def insert_metrics(self, metrics_data: Dict[str, Any]) -> Optional[Dict]:
+        """Insert a metrics snapshot; returns the stored snapshot or None."""
+
+    @abstractmethod
+    def insert_metrics_batch(self, snapshots: List[Dict[str, Any]], chunk_size: Optional[int] = None) -> int:
+        """Insert many metrics snapshots in bulk; returns rows inserted."""
+
+    @abstractmethod
+    def get_latest_metrics(
+        self,
+        post_ids: Optional[List[str]] = None,
+        platform: Optional[str] = None
+    ) -> List[Dict]:
+        """Newest snapshot per post (from the latest-snapshot table, not history)."""
+
+    @abstractmethod
+    def ensure_metrics_partitions(self, months_ahead: int = 1) -> bool:
+        """Make sure metrics for this month and the next months_ahead can be stored."""
+
+    @abstractmethod
+    def drop_expired_metrics(self, retention_days: Optional[int] = None) -> int:
+        """Remove metrics history older than the retention window."""
+
+    # Utility
+
+    @abstractmethod
+    def test_connection(self) -> bool:
+        """Check that the backend is reachable."""
+
+def create_repository(backend: Optional[str] = None) -> Repository:
+    """Create the configured storage backend.
+
+    Args:
+        backend: 'supabase' or 'sqlite'. If None, uses config value.
+
+    Returns:
+        Repository instance
+    """
+    backend = backend or config.get("database.backend", "supabase")
+
+    if backend == "sqlite":
+        from src.database.sqlite_client import SQLiteClient
+        return SQLiteClient()
+    if backend == "supabase":
+        from src.database.supabase_client import SupabaseClient
+        return SupabaseClient()
+
+    raise ValueError(f"Unknown database backend: {backend} (expected 'supabase' or 'sqlite')")
+
+# Global database client (created on first use, so importing this module is cheap)
+db = LazyProxy(create_repository)
+
+__all__ = ["Repository", "create_repository", "db", "STORY_UPSERT_UPDATE_COLUMNS"]
@@ -0,0 +1,1005 @@
+"""Local SQLite storage backend (same interface as the Supabase client)."""
+
+import sqlite3
+import threading
+import uuid
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Set, Tuple
+from src.database.repository import Repository, STORY_UPSERT_UPDATE_COLUMNS
+from src.utils.batching import chunked
+from src.utils.logger import get_logger
+from src.utils.config_loader import config
+
+logger = get_logger(__name__)
+
+# SQLite's default limit on bound parameters per statement is 999 on older builds
+MAX_SQL_VARIABLES = 900
+
+# Default for timestamp columns, matching Postgres NOW() as returned by PostgREST
+NOW_SQL = "(strftime('%Y-%m-%dT%H:%M:%f', 'now'))"
+
+# Schema and indexes from scripts/setup_supabase.sql, in SQLite types
+# (UUIDs and timestamps are TEXT, the way the Supabase client returns them)
+SCHEMA_SQL = f"""
+CREATE TABLE IF NOT EXISTS stories (
+    id TEXT PRIMARY KEY,
+    reddit_id TEXT UNIQUE NOT NULL,
+    subreddit TEXT,
+    title TEXT NOT NULL,
+    body TEXT NOT NULL,
+    author TEXT,
+    created_utc TEXT NOT NULL,
+    upvotes INTEGER DEFAULT 0,
+    comments INTEGER DEFAULT 0,
+    upvote_ratio REAL DEFAULT 0,
+    awards INTEGER DEFAULT 0,
+    word_count INTEGER,
+    virality_score REAL DEFAULT 0,
+    sentiment_score REAL DEFAULT 0,
+    minhash TEXT,
+    duplicate_of TEXT REFERENCES stories(id) ON DELETE SET NULL,
+    status TEXT DEFAULT 'scraped',
+    scraped_at TEXT DEFAULT {NOW_SQL},
+    metrics_updated_at TEXT,
+    claimed_by TEXT,
+    lease_expires_at TEXT,
+
+    CONSTRAINT valid_status CHECK (status IN ('scraped', 'selected', 'processed', 'rejected'))
+);
+
+CREATE INDEX IF NOT EXISTS idx_stories_status ON stories(status);
+CREATE INDEX IF NOT EXISTS idx_stories_virality_score ON stories(virality_score DESC);
+CREATE INDEX IF NOT EXISTS idx_stories_scraped_at ON stories(scraped_at DESC);
+CREATE INDEX IF NOT EXISTS idx_stories_status_virality ON stories(status, virality_score DESC, id DESC);
+
+CREATE TABLE IF NOT EXISTS videos (
+    id TEXT PRIMARY KEY,
+    story_id TEXT REFERENCES stories(id) ON DELETE CASCADE,
+    video_url TEXT NOT NULL,
+    local_path TEXT,
+    duration REAL,
+    file_size_mb REAL,
+    status TEXT DEFAULT 'pending_approval',
+    approved_at TEXT,
+    approved_by TEXT,
+    rejection_reason TEXT,
+    created_at TEXT DEFAULT {NOW_SQL},
+
+    CONSTRAINT valid_status CHECK (status IN ('pending_approval', 'approved', 'rejected'))
+);
+
+CREATE INDEX IF NOT EXISTS idx_videos_status ON videos(status);
+CREATE INDEX IF NOT EXISTS idx_videos_story_id ON videos(story_id);
+CREATE INDEX IF NOT EXISTS idx_videos_created_at ON videos(created_at DESC);
+CREATE INDEX IF NOT EXISTS idx_videos_status_created_at ON videos(status, created_at DESC, id DESC);
+
+CREATE TABLE IF NOT EXISTS platform_posts (
+    id TEXT PRIMARY KEY,
+    video_id TEXT REFERENCES videos(id) ON DELETE CASCADE,
+    platform TEXT NOT NULL,
+    post_id TEXT,
+    post_url TEXT,
+    status TEXT DEFAULT 'pending',
+    published_at TEXT,
+    error_message TEXT,
+    retry_count INTEGER DEFAULT 0,
+    created_at TEXT DEFAULT {NOW_SQL},
+
+    CONSTRAINT valid_platform CHECK (platform IN ('youtube', 'instagram', 'tiktok')),
+    CONSTRAINT valid_status CHECK (status IN ('pending', 'published', 'failed'))
+);
+
+CREATE INDEX IF NOT EXISTS idx_platform_posts_video_id ON platform_posts(video_id);
+CREATE INDEX IF NOT EXISTS idx_platform_posts_platform ON platform_posts(platform);
+CREATE INDEX IF NOT EXISTS idx_platform_posts_status ON platform_posts(status);
+
+CREATE TABLE IF NOT EXISTS platform_metrics (
+    id TEXT PRIMARY KEY,
+    post_id TEXT REFERENCES platform_posts(id) ON DELETE CASCADE,
+    platform TEXT NOT NULL,
+    views INTEGER DEFAULT 0,
+    likes INTEGER DEFAULT 0,
+    comments INTEGER DEFAULT 0,
+    shares INTEGER DEFAULT 0,
+    saves INTEGER DEFAULT 0,
+    watch_time_minutes REAL DEFAULT 0,
+    engagement_rate REAL DEFAULT 0,
+    recorded_at TEXT DEFAULT {NOW_SQL},
+
+    CONSTRAINT valid_platform CHECK (platform IN ('youtube', 'instagram', 'tiktok'))
+);
+
+CREATE INDEX IF NOT EXISTS idx_platform_metrics_post_id ON platform_metrics(post_id);
+CREATE INDEX IF NOT EXISTS idx_platform_metrics_recorded_at ON platform_metrics(recorded_at DESC);
+
+CREATE TABLE IF NOT EXISTS platform_metrics_latest (
+    post_id TEXT PRIMARY KEY REFERENCES platform_posts(id) ON DELETE CASCADE,
+    platform TEXT NOT NULL,
+    views INTEGER DEFAULT 0,
+    likes INTEGER DEFAULT 0,
+    comments INTEGER DEFAULT 0,
+    shares INTEGER DEFAULT 0,
+    saves INTEGER DEFAULT 0,
+    watch_time_minutes REAL DEFAULT 0,
+    engagement_rate REAL DEFAULT 0,
+    recorded_at TEXT NOT NULL
+);
+
+CREATE INDEX IF NOT EXISTS idx_platform_metrics_latest_platform ON platform_metrics_latest(platform);
+
+CREATE TRIGGER IF NOT EXISTS platform_metrics_latest_upsert
+AFTER INSERT ON platform_metrics
+WHEN NEW.post_id IS NOT NULL
+BEGIN
+    INSERT INTO platform_metrics_latest
+        (post_id, platform, views, likes, comments, shares, saves, watch_time_minutes, engagement_rate, recorded_at)
+    VALUES
+        (NEW.post_id, NEW.platform, NEW.views, NEW.likes, NEW.comments, NEW.shares, NEW.saves,
+         NEW.watch_time_minutes, NEW.engagement_rate, NEW.recorded_at)
+    ON CONFLICT (post_id) DO UPDATE SET
+        platform = excluded.platform,
+        views = excluded.views,
+        likes = excluded.likes,
+        comments = excluded.comments,
+        shares = excluded.shares,
+        saves = excluded.saves,
+        watch_time_minutes = excluded.watch_time_minutes,
+        engagement_rate = excluded.engagement_rate,
+        recorded_at = excluded.recorded_at
+    WHERE excluded.recorded_at >= platform_metrics_latest.recorded_at;
+END;
+
+CREATE TABLE IF NOT EXISTS upload_errors (
+    id TEXT PRIMARY KEY,
+    video_id TEXT REFERENCES videos(id) ON DELETE CASCADE,
+    platform TEXT,
+    error_type TEXT,
+    error_message TEXT,
+    stack_trace TEXT,
+    retry_count INTEGER DEFAULT 0,
+    created_at TEXT DEFAULT {NOW_SQL}
+);
+
+CREATE INDEX IF NOT EXISTS idx_upload_errors_video_id ON upload_errors(video_id);
+CREATE INDEX IF NOT EXISTS idx_upload_errors_created_at ON upload_errors(created_at DESC);
+"""
+
+# Columns added after the first schema, by table (applied to existing files on open)
+MIGRATION_COLUMNS = {
+    "stories": {"claimed_by": "TEXT", "lease_expires_at": "TEXT"},
+}
+
+class SQLiteClient(Repository):
+    """Single-file SQLite database with the Supabase schema.
+
+    Runs in WAL mode with synchronous=NORMAL, so writes are local and
+    sub-millisecond while readers never block the writer. One connection is
+    shared by all threads behind a lock (SQLite serializes writes anyway).
+    """
+
+    def __init__(self, path: Optional[str] = None):
+        """Initialize SQLite client and create the schema if needed.
+
+        Args:
+            path: Database file (":memory:" for a throwaway database). If None, uses config value.
+        """
+        if path is None:
+            path = config.get("database.sqlite_path", "data/pipeline.db")
+            path = Path(__file__).parent.parent.parent / path
+
+        self.path = str(path)
+        if self.path != ":memory:":
+            Path(self.path).parent.mkdir(parents=True, exist_ok=True)
+
+        self._lock = threading.RLock()
+        self.conn = sqlite3.connect(self.path, check_same_thread=False, isolation_level=None)
+        self.conn.row_factory = sqlite3.Row
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.execute("PRAGMA foreign_keys=ON")
+        self.conn.execute("PRAGMA busy_timeout=5000")
+        self.conn.executescript(SCHEMA_SQL)
+        self._migrate()
+
+        self._columns = {
+            table: [row["name"] for row in self.conn.execute(f"PRAGMA table_info({table})")]
+            for table in ("stories", "videos", "platform_posts", "platform_metrics", "upload_errors")
+        }
+
+        logger.info(f"SQLite client initialized ({self.path})")
+
+    # ========================================================================
+    # HELPERS
+    # ========================================================================
+
+    def _migrate(self) -> None:
+        """Add columns introduced after a database file was created."""
+        for table, columns in MIGRATION_COLUMNS.items():
+            existing = {row["name"] for row in self.conn.execute(f"PRAGMA table_info({table})")}
+            for name, sql_type in columns.items():
+                if name not in existing:
+                    self.conn.execute(f"ALTER TABLE {table} ADD COLUMN {name} {sql_type}")
+                    logger.info(f"Added column {table}.{name}")
+
+    @contextmanager
+    def _transaction(self) -> Iterator[sqlite3.Connection]:
+        """Run statements in one transaction (committed together or not at all)."""
+        with self._lock:
+            self.conn.execute("BEGIN IMMEDIATE")
+            try:
+                yield self.conn
+            except BaseException:
+                self.conn.execute("ROLLBACK")
+                raise
+            self.conn.execute("COMMIT")
+
+    def _query(self, sql: str, params: Tuple = ()) -> List[Dict]:
+        """Run a read query and return rows as dictionaries."""
+        with self._lock:
+            return [dict(row) for row in self.conn.execute(sql, params)]
+
+    def _select_columns(self, table: str, columns: str) -> str:
+        """Translate a PostgREST-style column list ("*" or "a, b") into SQL."""
+        if columns.strip() == "*":
+            return "*"
+        names = [name.strip() for name in columns.split(",")]
+        unknown = [name for name in names if name not in self._columns[table]]
+        if unknown:
+            raise ValueError(f"Unknown {table} columns: {unknown}")
+        return ", ".join(names)
+
+    def _insert(self, table: str, data: Dict[str, Any]) -> Dict:
+        """Insert one row (id generated if missing) and return it."""
+        row = {"id": str(uuid.uuid4()), **data}
+        unknown = [name for name in row if name not in self._columns[table]]
+        if unknown:
+            raise ValueError(f"Unknown {table} columns: {unknown}")
+
+        columns = ", ".join(row)
+        placeholders = ", ".join("?" for _ in row)
+        with self._lock:
+            cursor = self.conn.execute(
+                f"INSERT INTO {table} ({columns}) VALUES ({placeholders}) RETURNING *",
+                tuple(row.values())
+            )
+            return dict(cursor.fetchone())
+
+    def _update(self, table: str, row_id: str, data: Dict[str, Any]) -> int:
+        """Update columns of one row by id; returns rows changed."""
+        assignments = ", ".join(f"{name} = ?" for name in data)
+        with self._lock:
+            cursor = self.conn.execute(
+                f"UPDATE {table} SET {assignments} WHERE id = ?",
+                (*data.values(), row_id)
+            )
+            return cursor.rowcount
+
+    # ========================================================================
+    # STORIES TABLE
+    # ========================================================================
+
+    def insert_story(self, story_data: Dict[str, Any]) -> Optional[Dict]:
+        """Insert a new story into the database.
+
+        Args:
+            story_data: Dictionary with story fields (reddit_id, title, body, etc.)
+
+        Returns:
+            Inserted story data or None if failed
+        """
+        try:
+            story = self._insert("stories", story_data)
+            logger.info(f"Inserted story: {story_data.get('reddit_id')}")
+            return story
+        except Exception as e:
+            logger.error(f"Failed to insert story: {e}")
+            return None
+
+    def get_known_reddit_ids(self, since: str) -> Set[str]:
+        """Get every reddit_id scraped since a time.
+
+        Args:
+            since: ISO timestamp
+
+        Returns:
+            Set of reddit_ids (empty if failed)
+        """
+        try:
+            with self._lock:
+                return {row[0] for row in self.conn.execute(
+                    "SELECT reddit_id FROM stories WHERE scraped_at >= ?", (since,)
+                )}
+        except Exception as e:
+            logger.error(f"Failed to load known Reddit IDs: {e}")
+            return set()
+
+    def get_existing_stories(self, reddit_ids: List[str]) -> Dict[str, Dict]:
+        """Look up which Reddit posts are already stored.
+
+        Args:
+            reddit_ids: Reddit post IDs
+
+        Returns:
+            Mapping of reddit_id to stored row (id, reddit_id and the upsert update columns)
+
+        Raises:
+            Exception: If a lookup fails (callers must not mistake stored posts for new ones)
+        """
+        columns = ", ".join(("id", "reddit_id") + STORY_UPSERT_UPDATE_COLUMNS)
+        existing = {}
+
+        for chunk in chunked(reddit_ids, MAX_SQL_VARIABLES):
+            placeholders = ", ".join("?" for _ in chunk)
+            rows = self._query(f"SELECT {columns} FROM stories WHERE reddit_id IN ({placeholders})", tuple(chunk))
+            existing.update((row["reddit_id"], row) for row in rows)
+
+        return existing
+
+    def upsert_stories(
+        self,
+        batch: List[Dict[str, Any]],
+        chunk_size: Optional[int] = None,
+        existing: Optional[Dict[str, Dict]] = None
+    ) -> List[Dict[str, Any]]:
+        """Insert new stories and refresh metrics of stored ones in one transaction per chunk.
+
+        Args:
+            batch: Story dictionaries (must include reddit_id)
+            chunk_size: Rows per transaction. If None, uses config value.
+            existing: Ignored (the lookup is local and happens inside the transaction)
+
+        Returns:
+            Per-row outcomes in input order: dicts with reddit_id, id and
+            outcome ('inserted', 'updated' or 'skipped')
+        """
+        if chunk_size is None:
+            chunk_size = config.get("database.upsert_chunk_size", 500)
+
+        outcomes = []
+        for chunk in chunked(batch, chunk_size):
+            try:
+                with self._transaction():
+                    known = self.get_existing_stories([story["reddit_id"] for story in chunk])
+                    outcomes.extend(self._upsert_story_chunk(chunk, known))
+            except Exception as e:
+                logger.error(f"Failed to upsert {len(chunk)} stories: {e}")
+                outcomes.extend(
+                    {"reddit_id": story["reddit_id"], "id": None, "outcome": "skipped"} for story in chunk
+                )
+
+        counts = {outcome: sum(1 for o in outcomes if o["outcome"] == outcome)
+                  for outcome in ("inserted", "updated", "skipped")}
+        logger.info(
+            f"Upserted {len(batch)} stories: {counts['inserted']} inserted, "
+            f"{counts['updated']} updated, {counts['skipped']} skipped"
+        )
+        return outcomes
+
+    def _upsert_story_chunk(self, chunk: List[Dict[str, Any]], known: Dict[str, Dict]) -> List[Dict[str, Any]]:
+        """Upsert one chunk of stories inside the caller's transaction."""
+        outcomes = []
+
+        for story in chunk:
+            reddit_id = story["reddit_id"]
+            stored = known.get(reddit_id)
+
+            if stored is None:
+                row = self._insert("stories", story)
+                known[reddit_id] = row  # Repeats later in the chunk become updates
+                outcomes.append({"reddit_id": reddit_id, "id": row["id"], "outcome": "inserted"})
+                continue
+
+            changes = {
+                column: story[column] for column in STORY_UPSERT_UPDATE_COLUMNS
+                if column in story and story[column] != stored.get(column)
+            }
+            outcome = "updated" if changes and self._update("stories", stored["id"], changes) else "skipped"
+            outcomes.append({"reddit_id": reddit_id, "id": stored["id"], "outcome": outcome})
+
+        return outcomes
+
+    def get_stories_by_status(
+        self,
+        status: str,
+        limit: int = 100,
+        columns: str = "*",
+        after: Optional[Tuple[float, str]] = None
+    ) -> List[Dict]:
+        """Get one page of stories filtered by status, highest virality first.
+
+        Args:
+            status: Story status ('scraped', 'selected', 'processed', 'rejected')
+            limit: Maximum number of stories to return
+            columns: Columns to select
+            after: (virality_score, id) of the last story already seen
+
+        Returns:
+            List of story dictionaries
+        """
+        try:
+            select = self._select_columns("stories", columns)
+            where, params = "status = ?", [status]
+            if after is not None:
+                where += " AND (virality_score, id) < (?, ?)"
+                params.extend(after)
+            return self._query(
+                f"SELECT {select} FROM stories WHERE {where} ORDER BY virality_score DESC, id DESC LIMIT ?",
+                (*params, limit)
+            )
+        except Exception as e:
+            logger.error(f"Failed to get stories: {e}")
+            return []
+
+    def get_story(self, story_id: str, columns: str = "*") -> Optional[Dict]:
+        """Get one story by ID.
+
+        Args:
+            story_id: Story UUID
+            columns: Columns to select
+
+        Returns:
+            Story dictionary or None if not found or failed
+        """
+        try:
+            select = self._select_columns("stories", columns)
+            rows = self._query(f"SELECT {select} FROM stories WHERE id = ?", (story_id,))
+            return rows[0] if rows else None
+        except Exception as e:
+            logger.error(f"Failed to get story {story_id}: {e}")
+            return None
+
+    def claim_stories(self, worker_id: str, count: int, lease_seconds: int) -> List[Dict]:
+        """Claim the top stories for a worker in one write transaction.
+
+        BEGIN IMMEDIATE takes the database write lock before the candidates
+        are read, so concurrent workers (threads or processes) claim in turn
+        and never get the same story.
+
+        Args:
+            worker_id: Identifier of the claiming worker
+            count: Maximum number of stories to claim
+            lease_seconds: How long the claim holds before others may take over
+
+        Returns:
+            Claimed story dictionaries, highest virality first (empty if failed)
+        """
+        try:
+            with self._transaction() as conn:
+                rows = conn.execute(
+                    f"""
+                    UPDATE stories SET
+                        status = 'selected',
+                        claimed_by = ?,
+                        lease_expires_at = strftime('%Y-%m-%dT%H:%M:%f', 'now', ?)
+                    WHERE id IN (
+                        SELECT id FROM stories
+                        WHERE status = 'scraped'
+                           OR (status = 'selected' AND lease_expires_at < {NOW_SQL})
+                        ORDER BY virality_score DESC
+                        LIMIT ?
+                    )
+                    RETURNING *
+                    """,
+                    (worker_id, f"+{int(lease_seconds)} seconds", count)
+                ).fetchall()
+            stories = sorted((dict(row) for row in rows), key=lambda story: story["virality_score"], reverse=True)
+            logger.info(f"Worker {worker_id} claimed {len(stories)} stories")
+            return stories
+        except Exception as e:
+            logger.error(f"Failed to claim stories: {e}")
+            return []
+
+    def update_story_status(self, story_id: str, status: str) -> bool:
+        """Update story status.
+
+        Args:
+            story_id: Story UUID
+            status: New status
+
+        Returns:
+            True if successful
+        """
+        try:
+            self._update("stories", story_id, {"status": status})
+            logger.info(f"Updated story {story_id} status to {status}")
+            return True
+        except Exception as e:
+            logger.error(f"Failed to update story status: {e}")
+            return False
+
+    def update_statuses(self, table: str, ids: List[str], status: str) -> bool:
+        """Set the same status on many rows in one transaction.
+
+        Args:
+            table: 'stories', 'videos' or 'platform_posts'
+            ids: Row UUIDs
+            status: New status
+
+        Returns:
+            True if successful
+        """
+        try:
+            if table not in ("stories", "videos", "platform_posts"):
+                raise ValueError(f"Table {table} has no status column")
+            with self._transaction() as conn:
+                for chunk in chunked(ids, MAX_SQL_VARIABLES):
+                    placeholders = ", ".join("?" for _ in chunk)
+                    conn.execute(f"UPDATE {table} SET status = ? WHERE id IN ({placeholders})", (status, *chunk))
+            logger.info(f"Updated {len(ids)} {table} rows to status {status}")
+            return True
+        except Exception as e:
+            logger.error(f"Failed to update {table} statuses: {e}")
+            return False
+
+    def mark_story_duplicate(self, story_id: str, duplicate_of: str) -> bool:
+        """Reject a story as a near-duplicate of another.
+
+        Args:
+            story_id: Story UUID
+            duplicate_of: UUID of the story it duplicates
+
+        Returns:
+            True if successful
+        """
+        try:
+            self._update("stories", story_id, {"status": "rejected", "duplicate_of": duplicate_of})
+            logger.info(f"Marked story {story_id} as duplicate of {duplicate_of}")
+            return True
+        except Exception as e:
+            logger.error(f"Failed to mark story duplicate: {e}")
+            return False
+
+    def get_stories_by_ids(self, story_ids: List[str], columns: str = "*") -> List[Dict]:
+        """Get several stories by ID.
+
+        Args:
+            story_ids: Story UUIDs
+            columns: Columns to select
+
+        Returns:
+            List of story dictionaries (order not guaranteed)
+        """
+        try:
+            select = self._select_columns("stories", columns)
+            stories = []
+            for chunk in chunked(story_ids, MAX_SQL_VARIABLES):
+                placeholders = ", ".join("?" for _ in chunk)
+                stories.extend(self._query(f"SELECT {select} FROM stories WHERE id IN ({placeholders})", tuple(chunk)))
+            return stories
+        except Exception as e:
+            logger.error(f"Failed to get stories by ID: {e}")
+            return []
+
+    def iter_story_pages(
+        self,
+        columns: str = "*",
+        page_size: int = 1000,
+        scraped_after: Optional[str] = None,
+        status: Optional[str] = None
+    ) -> Iterator[List[Dict]]:
+        """Stream the whole stories table in pages ordered by id (keyset pagination).
+
+        Args:
+            columns: Columns to select (must include id)
+            page_size: Rows per page
+            scraped_after: Only stories scraped at or after this ISO timestamp
+            status: Only stories with this status
+
+        Yields:
+            Lists of story dictionaries
+        """
+        last_id = None
+        while True:
+            try:
+                conditions, params = [], []
+                if scraped_after:
+                    conditions.append("scraped_at >= ?")
+                    params.append(scraped_after)
+                if status:
+                    conditions.append("status = ?")
+                    params.append(status)
+                if last_id is not None:
+                    conditions.append("id > ?")
+                    params.append(last_id)
+
+                where = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+                page = self._query(
+                    f"SELECT {self._select_columns('stories', columns)} FROM stories {where} ORDER BY id LIMIT ?",
+                    (*params, page_size)
+                )
+            except Exception as e:
+                logger.error(f"Failed to page stories after {last_id}: {e}")
+                return
+
+            if not page:
+                return
+            yield page
+            if len(page) < page_size:
+                return
+            last_id = page[-1]["id"]
+
+    def iter_rows_since(
+        self,
+        table: str,
+        column: str,
+        after: Optional[Tuple[str, str]] = None,
+        columns: str = "*",
+        page_size: int = 1000
+    ) -> Iterator[List[Dict]]:
+        """Stream rows of any table added after a (timestamp, id) watermark.
+
+        Args:
+            table: Table name
+            column: Timestamp column rows are ordered by (e.g. scraped_at)
+            after: (timestamp, id) of the last row already seen, or None for all rows
+            columns: Columns to select (must include id and the timestamp column)
+            page_size: Rows per page
+
+        Yields:
+            Lists of row dictionaries, oldest first
+        """
+        if table not in self._columns or column not in self._columns[table]:
+            raise ValueError(f"Unknown table or column: {table}.{column}")
+        select = self._select_columns(table, columns)
+
+        while True:
+            where = f"{column} IS NOT NULL"
+            params: Tuple = ()
+            if after is not None:
+                where += f" AND ({column}, id) > (?, ?)"
+                params = tuple(after)
+
+            page = self._query(
+                f"SELECT {select} FROM {table} WHERE {where} ORDER BY {column}, id LIMIT ?",
+                (*params, page_size)
+            )
+
+            if not page:
+                return
+            yield page
+            if len(page) < page_size:
+                return
+            after = (page[-1][column], page[-1]["id"])
+
+    def bulk_update_stories(self, updates: List[Dict[str, Any]]) -> int:
+        """Update many stories in one transaction.
+
+        Args:
+            updates: Dictionaries with id plus the columns to change
+
+        Returns:
+            Number of rows updated (0 if failed)
+        """
+        if not updates:
+            return 0
+
+        try:
+            updated = 0
+            with self._transaction():
+                for update in updates:
+                    changes = {k: v for k, v in update.items() if k != "id" and v is not None}
+                    if not changes:
+                        continue
+                    unknown = [name for name in changes if name not in self._columns["stories"]]
+                    if unknown:
+                        raise ValueError(f"Unknown stories columns: {unknown}")
+                    updated += self._update("stories", update["id"], changes)
+            logger.info(f"Bulk updated {updated} stories")
+            return updated
+        except Exception as e:
+            logger.error(f"Failed to bulk update stories: {e}")
+            return 0
+
+    # ========================================================================
+    # VIDEOS TABLE
+    # ========================================================================
+
+    def insert_video(self, video_data: Dict[str, Any]) -> Optional[Dict]:
+        """Insert a new video into the database.
+
+        Args:
+            video_data: Dictionary with video fields (story_id, video_url, etc.)
+
+        Returns:
+            Inserted video data or None if failed
+        """
+        try:
+            video = self._insert("videos", video_data)
+            logger.info(f"Inserted video for story: {video_data.get('story_id')}")
+            return video
+        except Exception as e:
+            logger.error(f"Failed to insert video: {e}")
+            return None
+
+    def get_videos_by_status(
+        self,
+        status: str,
+        limit: int = 100,
+        columns: str = "*",
+        story_columns: Optional[str] = "*",
+        after: Optional[Tuple[str, str]] = None
+    ) -> List[Dict]:
+        """Get one page of videos filtered by status, newest first.
+
+        Args:
+            status: Video status ('pending_approval', 'approved', 'rejected')
+            limit: Maximum number of videos to return
+            columns: Video columns to select
+            story_columns: Story columns embedded under 'stories' (None for no story)
+            after: (created_at, id) of the last video already seen
+
+        Returns:
+            List of video dictionaries with story data (under 'stories', as Supabase embeds it)
+        """
+        try:
+            select = self._select_columns("videos", columns)
+            where, params = "status = ?", [status]
+            if after is not None:
+                where += " AND (created_at, id) < (?, ?)"
+                params.extend(after)
+            videos = self._query(
+                f"SELECT {select} FROM videos WHERE {where} ORDER BY created_at DESC, id DESC LIMIT ?",
+                (*params, limit)
+            )
+            if not story_columns:
+                return videos
+
+            # Embedding needs each video's story_id and each story's id
+            names = [name.strip() for name in story_columns.split(",")]
+            lookup = story_columns if story_columns.strip() == "*" or "id" in names else f"id, {story_columns}"
+            story_ids = list({video["story_id"] for video in videos if video.get("story_id")})
+            stories = {story["id"]: story for story in self.get_stories_by_ids(story_ids, lookup)}
+            for video in videos:
+                story = stories.get(video.get("story_id"))
+                if story is not None and lookup != story_columns:
+                    story = {k: v for k, v in story.items() if k != "id"}
+                video["stories"] = story
+            return videos
+        except Exception as e:
+            logger.error(f"Failed to get videos: {e}")
+            return []
+
+    def update_video_status(
+        self,
+        video_id: str,
+        status: str,
+        approved_by: Optional[str] = None,
+        rejection_reason: Optional[str] = None
+    ) -> bool:
+        """Update video approval status.
+
+        Args:
+            video_id: Video UUID
+            status: New status ('approved' or 'rejected')
+            approved_by: Username who approved/rejected
+            rejection_reason: Reason for rejection (if rejected)
+
+        Returns:
+            True if successful
+        """
+        try:
+            update_data = {"status": status}
+
+            if status == "approved":
+                update_data["approved_at"] = datetime.now().isoformat()
+                if approved_by:
+                    update_data["approved_by"] = approved_by
+            elif status == "rejected" and rejection_reason:
+                update_data["rejection_reason"] = rejection_reason
+
+            self._update("videos", video_id, update_data)
+            logger.info(f"Updated video {video_id} status to {status}")
+            return True
+        except Exception as e:
+            logger.error(f"Failed to update video status: {e}")
+            return False
+
+    # ========================================================================
+    # PLATFORM_POSTS TABLE
+    # ========================================================================
+
+    def insert_platform_post(self, post_data: Dict[str, Any]) -> Optional[Dict]:
+        """Insert a platform post record.
+
+        Args:
+            post_data: Dictionary with platform post fields
+
+        Returns:
+            Inserted post data or None if failed
+        """
+        try:
+            post = self._insert("platform_posts", post_data)
+            logger.info(f"Inserted platform post: {post_data.get('platform')}")
+            return post
+        except Exception as e:
+            logger.error(f"Failed to insert platform post: {e}")
+            return None
+
+    def update_platform_post_status(
+        self,
+        post_id: str,
+        status: str,
+        post_url: Optional[str] = None,
+        error_message: Optional[str] = None
+    ) -> bool:
+        """Update platform post status.
+
+        Args:
+            post_id: Post UUID
+            status: New status ('published' or 'failed')
+            post_url: URL of published post
+            error_message: Error message if failed
+
+        Returns:
+            True if successful
+        """
+        try:
+            update_data = {"status": status}
+
+            if status == "published":
+                update_data["published_at"] = datetime.now().isoformat()
+                if post_url:
+                    update_data["post_url"] = post_url
+            elif status == "failed" and error_message:
+                update_data["error_message"] = error_message
+
+            self._update("platform_posts", post_id, update_data)
+            logger.info(f"Updated platform post {post_id} status to {status}")
+            return True
+        except Exception as e:
+            logger.error(f"Failed to update platform post status: {e}")
+            return False
+
+    # ========================================================================
+    # PLATFORM_METRICS TABLE
+    # ========================================================================
+
+    def insert_metrics(self, metrics_data: Dict[str, Any]) -> Optional[Dict]:
+        """Insert platform metrics.
+
+        Args:
+            metrics_data: Dictionary with metric fields
+
+        Returns:
+            Inserted metrics data or None if failed
+        """
+        try:
+            metrics = self._insert("platform_metrics", metrics_data)
+            logger.info(f"Inserted metrics for post: {metrics_data.get('post_id')}")
+            return metrics
+        except Exception as e:
+            logger.error(f"Failed to insert metrics: {e}")
+            return None
+
+    def insert_metrics_batch(self, snapshots: List[Dict[str, Any]], chunk_size: Optional[int] = None) -> int:
+        """Insert many metrics snapshots in one transaction.
+
+        platform_metrics_latest is updated by trigger.
+
+        Args:
+            snapshots: Metrics dictionaries (post_id, platform, views, ...;
+                recorded_at defaults to now)
+            chunk_size: Unused (one local transaction needs no chunking)
+
+        Returns:
+            Number of rows inserted (0 if failed)
+        """
+        try:
+            with self._transaction():
+                for snapshot in snapshots:
+                    row = {k: v.isoformat() if isinstance(v, datetime) else v for k, v in snapshot.items()}
+                    self._insert("platform_metrics", row)
+            logger.info(f"Inserted {len(snapshots)} metrics snapshots")
+            return len(snapshots)
+        except Exception as e:
+            logger.error(f"Failed to insert {len(snapshots)} metrics snapshots: {e}")
+            return 0
+
+    def get_latest_metrics(
+        self,
+        post_ids: Optional[List[str]] = None,
+        platform: Optional[str] = None
+    ) -> List[Dict]:
+        """Get the newest snapshot of each post (platform_metrics_latest).
+
+        Args:
+            post_ids: Only these posts. If None, every post.
+            platform: Only posts on this platform
+
+        Returns:
+            List of metrics dictionaries, one per post (empty if failed)
+        """
+        try:
+            where, params = "1 = 1", []
+            if platform:
+                where += " AND platform = ?"
+                params.append(platform)
+            if post_ids is None:
+                return self._query(f"SELECT * FROM platform_metrics_latest WHERE {where}", tuple(params))
+
+            latest = []
+            for chunk in chunked(post_ids, MAX_SQL_VARIABLES):
+                placeholders = ", ".join("?" for _ in chunk)
+                latest.extend(self._query(
+                    f"SELECT * FROM platform_metrics_latest WHERE {where} AND post_id IN ({placeholders})",
+                    (*params, *chunk)
+                ))
+            return latest
+        except Exception as e:
+            logger.error(f"Failed to get latest metrics: {e}")
+            return []
+
+    def ensure_metrics_partitions(self, months_ahead: int = 1) -> bool:
+        """No-op: SQLite stores metrics in one unpartitioned table.
+
+        Returns:
+            Always True
+        """
+        return True
+
+    def drop_expired_metrics(self, retention_days: Optional[int] = None) -> int:
+        """Delete metrics snapshots older than the retention window.
+
+        SQLite has no partitions, so old rows are deleted (a range scan on
+        the recorded_at index). Latest snapshots are unaffected.
+
+        Args:
+            retention_days: Days of history to keep. If None, uses config value.
+
+        Returns:
+            Number of rows deleted (0 if failed)
+
+        Raises:
+            ValueError: If retention_days is below 1
+        """
+        if retention_days is None:
+            retention_days = config.get("tracking.retention_days", 90)
+        if retention_days < 1:
+            raise ValueError(f"retention_days must be at least 1 (got {retention_days})")
+        try:
+            with self._transaction() as conn:
+                cursor = conn.execute(
+                    "DELETE FROM platform_metrics WHERE recorded_at < strftime('%Y-%m-%dT%H:%M:%f', 'now', ?)",
+                    (f"-{int(retention_days)} days",)
+                )
+            logger.info(f"Deleted {cursor.rowcount} expired metrics snapshots")
+            return cursor.rowcount
+        except Exception as e:
+            logger.error(f"Failed to delete expired metrics: {e}")
+            return 0
+
+    # ========================================================================
+    # UTILITY METHODS
+    # ========================================================================
+
+    def test_connection(self) -> bool:
+        """Test database connection.
+
+        Returns:
+            True if connection successful
+        """
+        try:
+            self._query("SELECT COUNT(*) FROM stories")
+            logger.info("Database connection successful")
+            return True
+        except Exception as e:
+            logger.error(f"Database connection failed: {e}")
+            return False
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            self.conn.close()
+
+__all__ = ["SQLiteClient"]
+
+# Test connection if run directly
+if __name__ == "__main__":
+    print("Testing SQLite database...")
+    client = SQLiteClient()
+    if client.test_connection():
+        print(f"✅ Database ready at {client.path}")
+    else:
+        print("❌ Database check failed.")
@@ -1,18 +1,83 @@
 """Supabase database client for managing stories, videos, and metrics."""
 
 import os
-from typing import List, Dict, Optional, Any
-from datetime import datetime
+from typing import TYPE_CHECKING, List, Dict, Optional, Any, Iterator, Set, Tuple
+from datetime import datetime, timedelta
 from dotenv import load_dotenv
-from supabase import create_client, Client
 from src.utils.logger import get_logger
+from src.utils.config_loader import config
+from src.utils.batching import chunked
+from src.utils.rate_limiter import call_with_rate_limit
+from src.database.repository import Repository, STORY_UPSERT_UPDATE_COLUMNS, db
+
+if TYPE_CHECKING:
+    from postgrest import SyncPostgrestClient
 
 logger = get_logger(__name__)
 
 # Load environment variables
 load_dotenv()
 
-class SupabaseClient:
+def create_pooled_client(url: str, key: str, schema: str = "public", timeout: Optional[float] = None) -> Any:
+    """Create the PostgREST client for a Supabase project on the shared HTTP pool.
+
+    The pipeline only uses ``table()`` and ``rpc()``, so the REST client is
+    built here directly instead of through ``supabase.create_client``; its
+    session is an httpx client on ``http_pool``'s transport.
+
+    Args:
+        url: Supabase project URL
+        key: Supabase API key
+        schema: Database schema
+        timeout: Request timeout in seconds. If None, uses config value.
+
+    Returns:
+        postgrest ``SyncPostgrestClient``
+
+    Raises:
+        RuntimeError: If postgrest did not build its session through ``create_session``
+    """
+    from postgrest import SyncPostgrestClient
+    from postgrest.utils import SyncClient
+    from src.utils.http_pool import get_transport
+
+    class PooledSession(SyncClient):
+        """httpx session of the PostgREST client, sending through the shared pool."""
+
+    class PooledPostgrestClient(SyncPostgrestClient):
+        def create_session(self, base_url, headers, timeout):
+            return PooledSession(base_url=base_url, headers=headers, timeout=timeout, transport=get_transport())
+
+    client = PooledPostgrestClient(
+        f"{url}/rest/v1",
+        headers={"apiKey": key, "Authorization": f"Bearer {key}"},
+        schema=schema,
+        timeout=timeout or config.get("database.supabase_timeout_seconds", 5),
+    )
+    if not isinstance(client.session, PooledSession):
+        # A postgrest upgrade that stops calling create_session would silently bypass the pool
+        raise RuntimeError(f"postgrest {type(client.session).__name__} session does not use the shared HTTP pool")
+
+    logger.info("Supabase REST client uses the shared HTTP pool")
+    return client
+
+def or_filter(query: Any, conditions: str) -> Any:
+    """Add a PostgREST ``or=(...)`` filter to a query.
+
+    postgrest-py before 0.14 (the range supabase 2.0.x accepts) has no
+    ``or_()``, so the parameter is added the way its other filters are.
+
+    Args:
+        query: PostgREST query builder
+        conditions: Comma-separated PostgREST conditions, e.g. "a.lt.1,and(a.eq.1,id.lt.5)"
+
+    Returns:
+        The query builder
+    """
+    query.params = query.params.add("or", f"({conditions})")
+    return query
+
+class SupabaseClient(Repository):
     """Wrapper for Supabase database operations."""
 
     def __init__(self):
@@ -25,9 +90,21 @@ class SupabaseClient:
                 "SUPABASE_URL and SUPABASE_KEY must be set in .env file"
             )
 
-        self.client: Client = create_client(self.url, self.key)
+        # PostgREST requests go through the shared connection pool
+        self.client: "SyncPostgrestClient" = create_pooled_client(self.url, self.key)
         logger.info("Supabase client initialized")
 
+    def _execute(self, query: Any) -> Any:
+        """Execute a query under the shared Supabase rate limit (429s are retried).
+
+        Args:
+            query: PostgREST query builder
+
+        Returns:
+            API response
+        """
+        return call_with_rate_limit("supabase", query.execute)
+
     # ========================================================================
     # STORIES TABLE
     # ========================================================================
@@ -42,37 +119,220 @@ class SupabaseClient:
             Inserted story data or None if failed
         """
         try:
-            result = self.client.table("stories").insert(story_data).execute()
+            result = self._execute(self.client.table("stories").insert(story_data))
             logger.info(f"Inserted story: {story_data.get('reddit_id')}")
             return result.data[0] if result.data else None
         except Exception as e:
             logger.error(f"Failed to insert story: {e}")
             return None
 
-    def get_stories_by_status(self, status: str, limit: int = 100) -> List[Dict]:
-        """Get stories filtered by status.
+    def get_known_reddit_ids(self, since: str) -> Set[str]:
+        """Get every reddit_id scraped since a time, in one request.
+
+        Uses the known_reddit_ids RPC, which returns a single array (not
+        subject to the API's row limit).
+
+        Args:
+            since: ISO timestamp
+
+        Returns:
+            Set of reddit_ids (empty if failed)
+        """
+        try:
+            result = self._execute(self.client.rpc("known_reddit_ids", {"since": since}))
+            return set(result.data or [])
+        except Exception as e:
+            logger.error(f"Failed to load known Reddit IDs: {e}")
+            return set()
+
+    def get_existing_stories(self, reddit_ids: List[str]) -> Dict[str, Dict]:
+        """Look up which Reddit posts are already stored.
+
+        Args:
+            reddit_ids: Reddit post IDs
+
+        Returns:
+            Mapping of reddit_id to stored row (id, reddit_id and the upsert update columns)
+
+        Raises:
+            Exception: If a lookup fails (callers must not mistake stored posts for new ones)
+        """
+        columns = ", ".join(("id", "reddit_id") + STORY_UPSERT_UPDATE_COLUMNS)
+        chunk_size = config.get("database.upsert_chunk_size", 500)
+        existing = {}
+
+        for chunk in chunked(reddit_ids, chunk_size):
+            result = self._execute(self.client.table("stories").select(columns).in_("reddit_id", chunk))
+            existing.update((row["reddit_id"], row) for row in result.data)
+
+        return existing
+
+    def upsert_stories(
+        self,
+        batch: List[Dict[str, Any]],
+        chunk_size: Optional[int] = None,
+        existing: Optional[Dict[str, Dict]] = None
+    ) -> List[Dict[str, Any]]:
+        """Insert new stories and refresh metrics of stored ones in bulk.
+
+        Each chunk costs one lookup (skipped if ``existing`` is given), one
+        bulk insert with ``on_conflict=reddit_id`` for new posts, and one bulk
+        update for stored posts whose metrics changed.
+
+        Args:
+            batch: Story dictionaries (must include reddit_id)
+            chunk_size: Rows per request. If None, uses config value.
+            existing: Result of get_existing_stories for the batch, if already known
+
+        Returns:
+            Per-row outcomes in input order: dicts with reddit_id, id and
+            outcome ('inserted', 'updated' or 'skipped')
+        """
+        if chunk_size is None:
+            chunk_size = config.get("database.upsert_chunk_size", 500)
+
+        outcomes = []
+        for chunk in chunked(batch, chunk_size):
+            try:
+                known = existing if existing is not None else self.get_existing_stories(
+                    [story["reddit_id"] for story in chunk]
+                )
+                outcomes.extend(self._upsert_story_chunk(chunk, known))
+            except Exception as e:
+                logger.error(f"Failed to upsert {len(chunk)} stories: {e}")
+                outcomes.extend(
+                    {"reddit_id": story["reddit_id"], "id": None, "outcome": "skipped"} for story in chunk
+                )
+
+        counts = {outcome: sum(1 for o in outcomes if o["outcome"] == outcome)
+                  for outcome in ("inserted", "updated", "skipped")}
+        logger.info(
+            f"Upserted {len(batch)} stories: {counts['inserted']} inserted, "
+            f"{counts['updated']} updated, {counts['skipped']} skipped"
+        )
+        return outcomes
+
+    def _upsert_story_chunk(self, chunk: List[Dict[str, Any]], known: Dict[str, Dict]) -> List[Dict[str, Any]]:
+        """Upsert one chunk of stories (see upsert_stories)."""
+        new_rows = [story for story in chunk if story["reddit_id"] not in known]
+        updates = {}
+
+        for story in chunk:
+            stored = known.get(story["reddit_id"])
+            if stored is None:
+                continue
+            changes = {
+                column: story[column] for column in STORY_UPSERT_UPDATE_COLUMNS
+                if column in story and story[column] != stored.get(column)
+            }
+            if changes:
+                updates[story["reddit_id"]] = {"id": stored["id"], **changes}
+
+        inserted = {}
+        if new_rows:
+            # ignore_duplicates: rows inserted concurrently by someone else are skipped, not overwritten
+            result = self._execute(
+                self.client.table("stories").upsert(new_rows, on_conflict="reddit_id", ignore_duplicates=True)
+            )
+            inserted = {row["reddit_id"]: row["id"] for row in result.data or []}
+
+        updated = bool(updates) and self.bulk_update_stories(list(updates.values())) > 0
+
+        outcomes = []
+        for story in chunk:
+            reddit_id = story["reddit_id"]
+            if reddit_id in inserted:
+                outcomes.append({"reddit_id": reddit_id, "id": inserted[reddit_id], "outcome": "inserted"})
+            elif reddit_id in known:
+                outcome = "updated" if updated and reddit_id in updates else "skipped"
+                outcomes.append({"reddit_id": reddit_id, "id": known[reddit_id]["id"], "outcome": outcome})
+            else:
+                outcomes.append({"reddit_id": reddit_id, "id": None, "outcome": "skipped"})
+        return outcomes
+
+    def get_stories_by_status(
+        self,
+        status: str,
+        limit: int = 100,
+        columns: str = "*",
+        after: Optional[Tuple[float, str]] = None
+    ) -> List[Dict]:
+        """Get one page of stories filtered by status, highest virality first.
+
+        Keyset pagination on (virality_score, id): pass the last row's values
+        as after to get the next page (see iter_stories_by_status).
 
         Args:
             status: Story status ('scraped', 'selected', 'processed', 'rejected')
             limit: Maximum number of stories to return
+            columns: Columns to select
+            after: (virality_score, id) of the last story already seen
 
         Returns:
             List of story dictionaries
         """
         try:
-            result = (
+            query = (
                 self.client.table("stories")
-                .select("*")
+                .select(columns)
                 .eq("status", status)
-                .order("virality_score", desc=True)
+                # One order param (chained .order() calls repeat the key instead of listing columns)
+                .order("virality_score.desc,id.desc")
                 .limit(limit)
-                .execute()
             )
-            return result.data
+            if after is not None:
+                score, last_id = after
+                query = or_filter(query, f"virality_score.lt.{score},and(virality_score.eq.{score},id.lt.{last_id})")
+            return self._execute(query).data
         except Exception as e:
             logger.error(f"Failed to get stories: {e}")
             return []
 
+    def get_story(self, story_id: str, columns: str = "*") -> Optional[Dict]:
+        """Get one story by ID.
+
+        Args:
+            story_id: Story UUID
+            columns: Columns to select
+
+        Returns:
+            Story dictionary or None if not found or failed
+        """
+        try:
+            result = self._execute(self.client.table("stories").select(columns).eq("id", story_id).limit(1))
+            return result.data[0] if result.data else None
+        except Exception as e:
+            logger.error(f"Failed to get story {story_id}: {e}")
+            return None
+
+    def claim_stories(self, worker_id: str, count: int, lease_seconds: int) -> List[Dict]:
+        """Claim the top stories for a worker in one round trip (claim_stories RPC).
+
+        Claimable stories are scraped ones and selected ones whose lease has
+        expired. Rows locked by a concurrent claim are skipped, so two
+        workers never get the same story.
+
+        Args:
+            worker_id: Identifier of the claiming worker
+            count: Maximum number of stories to claim
+            lease_seconds: How long the claim holds before others may take over
+
+        Returns:
+            Claimed story dictionaries, highest virality first (empty if failed)
+        """
+        try:
+            result = self._execute(self.client.rpc("claim_stories", {
+                "worker_id": worker_id,
+                "claim_count": count,
+                "lease_seconds": lease_seconds
+            }))
+            stories = sorted(result.data or [], key=lambda story: story["virality_score"], reverse=True)
+            logger.info(f"Worker {worker_id} claimed {len(stories)} stories")
+            return stories
+        except Exception as e:
+            logger.error(f"Failed to claim stories: {e}")
+            return []
+
     def update_story_status(self, story_id: str, status: str) -> bool:
         """Update story status.
 
@@ -84,13 +344,187 @@ class SupabaseClient:
             True if successful
         """
         try:
-            self.client.table("stories").update({"status": status}).eq("id", story_id).execute()
+            self._execute(self.client.table("stories").update({"status": status}).eq("id", story_id))
             logger.info(f"Updated story {story_id} status to {status}")
             return True
         except Exception as e:
             logger.error(f"Failed to update story status: {e}")
             return False
 
+    def update_statuses(self, table: str, ids: List[str], status: str) -> bool:
+        """Set the same status on many rows in one request per chunk (id IN (...)).
+
+        Args:
+            table: 'stories', 'videos' or 'platform_posts'
+            ids: Row UUIDs
+            status: New status
+
+        Returns:
+            True if every chunk was updated
+        """
+        try:
+            for chunk in chunked(ids, config.get("database.upsert_chunk_size", 500)):
+                self._execute(self.client.table(table).update({"status": status}).in_("id", chunk))
+            logger.info(f"Updated {len(ids)} {table} rows to status {status}")
+            return True
+        except Exception as e:
+            logger.error(f"Failed to update {table} statuses: {e}")
+            return False
+
+    def mark_story_duplicate(self, story_id: str, duplicate_of: str) -> bool:
+        """Reject a story as a near-duplicate of another.
+
+        Args:
+            story_id: Story UUID
+            duplicate_of: UUID of the story it duplicates
+
+        Returns:
+            True if successful
+        """
+        try:
+            self._execute(
+                self.client.table("stories")
+                .update({"status": "rejected", "duplicate_of": duplicate_of})
+                .eq("id", story_id)
+            )
+            logger.info(f"Marked story {story_id} as duplicate of {duplicate_of}")
+            return True
+        except Exception as e:
+            logger.error(f"Failed to mark story as duplicate: {e}")
+            return False
+
+    def get_stories_by_ids(self, story_ids: List[str], columns: str = "*") -> List[Dict]:
+        """Get several stories by ID in one query.
+
+        Args:
+            story_ids: Story UUIDs
+            columns: Columns to select
+
+        Returns:
+            List of story dictionaries (order not guaranteed)
+        """
+        if not story_ids:
+            return []
+
+        try:
+            result = self._execute(self.client.table("stories").select(columns).in_("id", story_ids))
+            return result.data
+        except Exception as e:
+            logger.error(f"Failed to get stories by ID: {e}")
+            return []
+
+    def iter_story_pages(
+        self,
+        columns: str = "*",
+        page_size: int = 1000,
+        scraped_after: Optional[str] = None,
+        status: Optional[str] = None
+    ) -> Iterator[List[Dict]]:
+        """Stream the whole stories table in pages ordered by id.
+
+        Uses keyset pagination (id > last seen id), so every page is an index
+        range scan no matter how deep into the table it is.
+
+        Args:
+            columns: Columns to select (must include id)
+            page_size: Rows per page
+            scraped_after: Only stories scraped at or after this ISO timestamp
+            status: Only stories with this status
+
+        Yields:
+            Lists of story dictionaries
+        """
+        last_id = None
+        while True:
+            try:
+                query = self.client.table("stories").select(columns).order("id").limit(page_size)
+                if scraped_after:
+                    query = query.gte("scraped_at", scraped_after)
+                if status:
+                    query = query.eq("status", status)
+                if last_id is not None:
+                    query = query.gt("id", last_id)
+                page = self._execute(query).data
+            except Exception as e:
+                logger.error(f"Failed to page stories after {last_id}: {e}")
+                return
+
+            if not page:
+                return
+            yield page
+            if len(page) < page_size:
+                return
+            last_id = page[-1]["id"]
+
+    def iter_rows_since(
+        self,
+        table: str,
+        column: str,
+        after: Optional[Tuple[str, str]] = None,
+        columns: str = "*",
+        page_size: int = 1000
+    ) -> Iterator[List[Dict]]:
+        """Stream rows of any table added after a (timestamp, id) watermark.
+
+        Keyset pagination on (column, id), so rows sharing a timestamp are
+        neither skipped nor repeated across pages or incremental runs. Rows
+        with a NULL timestamp are not returned.
+
+        Args:
+            table: Table name
+            column: Timestamp column rows are ordered by (e.g. scraped_at)
+            after: (timestamp, id) of the last row already seen, or None for all rows
+            columns: Columns to select (must include id and the timestamp column)
+            page_size: Rows per page
+
+        Yields:
+            Lists of row dictionaries, oldest first
+        """
+        while True:
+            try:
+                query = (
+                    self.client.table(table).select(columns)
+                    .not_.is_(column, "null")
+                    .order(f"{column},id").limit(page_size)
+                )
+                if after is not None:
+                    stamp, last_id = after
+                    query = or_filter(
+                        query, f'{column}.gt."{stamp}",and({column}.eq."{stamp}",id.gt.{last_id})'
+                    )
+                page = self._execute(query).data
+            except Exception as e:
+                logger.error(f"Failed to page {table} after {after}: {e}")
+                raise
+
+            if not page:
+                return
+            yield page
+            if len(page) < page_size:
+                return
+            after = (page[-1][column], page[-1]["id"])
+
+    def bulk_update_stories(self, updates: List[Dict[str, Any]]) -> int:
+        """Update many stories in one round trip (bulk_update_stories RPC).
+
+        Args:
+            updates: Dictionaries with id plus the columns to change
+
+        Returns:
+            Number of rows updated (0 if failed)
+        """
+        if not updates:
+            return 0
+
+        try:
+            result = self._execute(self.client.rpc("bulk_update_stories", {"updates": updates}))
+            updated = result.data or 0
+            logger.info(f"Bulk updated {updated} stories")
+            return updated
+        except Exception as e:
+            logger.error(f"Failed to bulk update stories: {e}")
+            return 0
+
     # ========================================================================
     # VIDEOS TABLE
     # ========================================================================
@@ -105,31 +539,49 @@ class SupabaseClient:
             Inserted video data or None if failed
         """
         try:
-            result = self.client.table("videos").insert(video_data).execute()
+            result = self._execute(self.client.table("videos").insert(video_data))
             logger.info(f"Inserted video for story: {video_data.get('story_id')}")
             return result.data[0] if result.data else None
         except Exception as e:
             logger.error(f"Failed to insert video: {e}")
             return None
 
-    def get_videos_by_status(self, status: str) -> List[Dict]:
-        """Get videos filtered by status.
+    def get_videos_by_status(
+        self,
+        status: str,
+        limit: int = 100,
+        columns: str = "*",
+        story_columns: Optional[str] = "*",
+        after: Optional[Tuple[str, str]] = None
+    ) -> List[Dict]:
+        """Get one page of videos filtered by status, newest first.
+
+        Keyset pagination on (created_at, id): pass the last row's values as
+        after to get the next page (see iter_videos_by_status).
 
         Args:
             status: Video status ('pending_approval', 'approved', 'rejected')
+            limit: Maximum number of videos to return
+            columns: Video columns to select
+            story_columns: Story columns embedded under 'stories' (None for no story)
+            after: (created_at, id) of the last video already seen
 
         Returns:
             List of video dictionaries with story data
         """
         try:
-            result = (
+            select = f"{columns}, stories({story_columns})" if story_columns else columns
+            query = (
                 self.client.table("videos")
-                .select("*, stories(*)")
+                .select(select)
                 .eq("status", status)
-                .order("created_at", desc=True)
-                .execute()
+                .order("created_at.desc,id.desc")
+                .limit(limit)
             )
-            return result.data
+            if after is not None:
+                stamp, last_id = after
+                query = or_filter(query, f'created_at.lt."{stamp}",and(created_at.eq."{stamp}",id.lt.{last_id})')
+            return self._execute(query).data
         except Exception as e:
             logger.error(f"Failed to get videos: {e}")
             return []
@@ -162,7 +614,7 @@ class SupabaseClient:
             elif status == "rejected" and rejection_reason:
                 update_data["rejection_reason"] = rejection_reason
 
-            self.client.table("videos").update(update_data).eq("id", video_id).execute()
+            self._execute(self.client.table("videos").update(update_data).eq("id", video_id))
             logger.info(f"Updated video {video_id} status to {status}")
             return True
         except Exception as e:
@@ -183,7 +635,7 @@ class SupabaseClient:
             Inserted post data or None if failed
         """
         try:
-            result = self.client.table("platform_posts").insert(post_data).execute()
+            result = self._execute(self.client.table("platform_posts").insert(post_data))
             logger.info(f"Inserted platform post: {post_data.get('platform')}")
             return result.data[0] if result.data else None
         except Exception as e:
@@ -218,7 +670,7 @@ class SupabaseClient:
             elif status == "failed" and error_message:
                 update_data["error_message"] = error_message
 
-            self.client.table("platform_posts").update(update_data).eq("id", post_id).execute()
+            self._execute(self.client.table("platform_posts").update(update_data).eq("id", post_id))
             logger.info(f"Updated platform post {post_id} status to {status}")
             return True
         except Exception as e:
@@ -238,13 +690,127 @@ class SupabaseClient:
         Returns:
             Inserted metrics data or None if failed
         """
-        try:
-            result = self.client.table("platform_metrics").insert(metrics_data).execute()
+        # Through ingest_metrics, which creates the month's partition if needed
+        # (a plain insert fails once recorded_at passes the pre-created months)
+        if self.insert_metrics_batch([metrics_data]):
             logger.info(f"Inserted metrics for post: {metrics_data.get('post_id')}")
-            return result.data[0] if result.data else None
+            return metrics_data
+        return None
+
+    def insert_metrics_batch(self, snapshots: List[Dict[str, Any]], chunk_size: Optional[int] = None) -> int:
+        """Insert many metrics snapshots, one ingest_metrics RPC per chunk.
+
+        Rows land in the monthly partition of their recorded_at (created on
+        demand), and platform_metrics_latest is updated by trigger.
+
+        Args:
+            snapshots: Metrics dictionaries (post_id, platform, views, ...;
+                recorded_at defaults to now)
+            chunk_size: Snapshots per request. If None, uses config value.
+
+        Returns:
+            Number of rows inserted (chunks that failed are not counted)
+        """
+        chunk_size = chunk_size or config.get("tracking.metrics_batch_size", 1000)
+        inserted = 0
+
+        for chunk in chunked(snapshots, chunk_size):
+            payload = [
+                {k: v.isoformat() if isinstance(v, datetime) else v for k, v in snapshot.items()}
+                for snapshot in chunk
+            ]
+            try:
+                result = self._execute(self.client.rpc("ingest_metrics", {"snapshots": payload}))
+                inserted += result.data or 0
+            except Exception as e:
+                logger.error(f"Failed to insert {len(chunk)} metrics snapshots: {e}")
+
+        logger.info(f"Inserted {inserted}/{len(snapshots)} metrics snapshots")
+        return inserted
+
+    def get_latest_metrics(
+        self,
+        post_ids: Optional[List[str]] = None,
+        platform: Optional[str] = None
+    ) -> List[Dict]:
+        """Get the newest snapshot of each post (platform_metrics_latest).
+
+        Args:
+            post_ids: Only these posts. If None, every post.
+            platform: Only posts on this platform
+
+        Returns:
+            List of metrics dictionaries, one per post (empty if failed)
+        """
+        def latest_query():
+            # Filters mutate the builder, so every request starts from a fresh one
+            query = self.client.table("platform_metrics_latest").select("*")
+            return query.eq("platform", platform) if platform else query
+
+        try:
+            if post_ids is None:
+                return self._execute(latest_query()).data
+
+            latest = []
+            for chunk in chunked(post_ids, config.get("database.upsert_chunk_size", 500)):
+                latest.extend(self._execute(latest_query().in_("post_id", chunk)).data)
+            return latest
         except Exception as e:
-            logger.error(f"Failed to insert metrics: {e}")
-            return None
+            logger.error(f"Failed to get latest metrics: {e}")
+            return []
+
+    def ensure_metrics_partitions(self, months_ahead: int = 1) -> bool:
+        """Create the monthly metrics partitions from this month to months_ahead.
+
+        Args:
+            months_ahead: Upcoming months to create besides the current one
+
+        Returns:
+            True if the partitions exist
+        """
+        now = datetime.utcnow()
+        range_end = now + timedelta(days=31 * months_ahead)
+        try:
+            self._execute(self.client.rpc("ensure_metrics_partitions", {
+                "range_start": now.isoformat(),
+                "range_end": range_end.isoformat(),
+            }))
+            return True
+        except Exception as e:
+            logger.error(f"Failed to create metrics partitions: {e}")
+            return False
+
+    def drop_expired_metrics(self, retention_days: Optional[int] = None) -> int:
+        """Drop monthly metrics partitions older than the retention window.
+
+        Only whole months that ended before the cutoff are dropped, so up to
+        a month past retention_days is kept. Rollups and latest snapshots
+        are unaffected.
+
+        Args:
+            retention_days: Days of history to keep. If None, uses config value.
+
+        Returns:
+            Number of partitions dropped (0 if failed)
+
+        Raises:
+            ValueError: If retention_days is below 1
+        """
+        if retention_days is None:
+            retention_days = config.get("tracking.retention_days", 90)
+        if retention_days < 1:
+            raise ValueError(f"retention_days must be at least 1 (got {retention_days})")
+        try:
+            result = self._execute(
+                self.client.rpc("drop_expired_metrics_partitions", {"retention_days": retention_days})
+            )
+            dropped = result.data or []
+            if dropped:
+                logger.info(f"Dropped metrics partitions: {', '.join(dropped)}")
+            return len(dropped)
+        except Exception as e:
+            logger.error(f"Failed to drop expired metrics partitions: {e}")
+            return 0
 
     # ========================================================================
     # UTILITY METHODS
@@ -257,17 +823,15 @@ class SupabaseClient:
             True if connection successful
         """
         try:
-            result = self.client.table("stories").select("count", count="exact").limit(1).execute()
+            result = self._execute(self.client.table("stories").select("count", count="exact").limit(1))
             logger.info("Database connection successful")
             return True
         except Exception as e:
             logger.error(f"Database connection failed: {e}")
             return False
 
-# Global database client
-db = SupabaseClient()
-
-__all__ = ["SupabaseClient", "db"]
+# db (the configured backend) is re-exported for existing imports
+__all__ = ["SupabaseClient", "create_pooled_client", "or_filter", "db"]
 
 # Test connection if run directly
 if __name__ == "__main__":
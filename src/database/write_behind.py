@@ -0,0 +1,240 @@
+"""Write-behind queue that batches status updates into bulk database writes."""
+
+import atexit
+import json
+import threading
+from collections import defaultdict
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+from src.database.repository import Repository, db as default_db
+from src.utils.lazy import LazyProxy
+from src.utils.logger import get_logger
+from src.utils.config_loader import config
+
+logger = get_logger(__name__)
+
+# Tables whose status column can be written behind
+STATUS_TABLES = ("stories", "videos", "platform_posts")
+
+class WriteBehindQueue:
+    """Coalesce status updates by row and flush them as bulk ``id IN (...)`` updates.
+
+    Callers enqueue and return immediately; a background thread flushes every
+    ``flush_interval`` seconds, or as soon as ``flush_size`` rows are pending.
+    Repeated updates of the same row keep only the latest status, and each
+    flush issues one request per (table, status) pair.
+
+    Pending updates are flushed on ``close()`` and at interpreter exit. If the
+    database is unreachable then, they are written to a spill file and
+    replayed by the next queue that starts.
+    """
+
+    def __init__(
+        self,
+        db: Optional[Repository] = None,
+        flush_size: Optional[int] = None,
+        flush_interval: Optional[float] = None,
+        spill_path: Optional[str] = None
+    ):
+        """Initialize the queue and start its flush thread.
+
+        Args:
+            db: Repository to write to. If None, uses the global client.
+            flush_size: Pending rows that trigger a flush. If None, uses config value.
+            flush_interval: Seconds between timed flushes. If None, uses config value.
+            spill_path: File for updates that could not be flushed at shutdown.
+                If None, uses config value.
+        """
+        self.db = db if db is not None else default_db
+        self.enabled = config.get("database.write_behind.enabled", True)
+        self.flush_size = flush_size or config.get("database.write_behind.flush_size", 50)
+        self.flush_interval = flush_interval or config.get("database.write_behind.flush_interval_seconds", 2.0)
+
+        if spill_path is None:
+            spill_path = config.get("database.write_behind.spill_file", "data/state/write_behind_spill.json")
+            spill_path = Path(__file__).parent.parent.parent / spill_path
+        self.spill_path = Path(spill_path)
+
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._pending: Dict[Tuple[str, str], str] = {}
+        self._wakeup = threading.Event()
+        self._closed = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._recovered = False
+
+        self._load_spill()
+
+        if self.enabled:
+            self._thread = threading.Thread(target=self._run, name="write-behind", daemon=True)
+            self._thread.start()
+            atexit.register(self.close)
+
+        logger.info(
+            f"Write-behind queue initialized (enabled: {self.enabled}, "
+            f"flush_size: {self.flush_size}, flush_interval: {self.flush_interval}s)"
+        )
+
+    # ========================================================================
+    # ENQUEUE
+    # ========================================================================
+
+    def update_status(self, table: str, row_id: str, status: str) -> bool:
+        """Queue a status update (written directly if the queue is disabled or closed).
+
+        Args:
+            table: 'stories', 'videos' or 'platform_posts'
+            row_id: Row UUID
+            status: New status
+
+        Returns:
+            True if the update was queued or written
+        """
+        if table not in STATUS_TABLES:
+            raise ValueError(f"Table {table} has no status column")
+
+        if not self.enabled or self._closed.is_set():
+            return self.db.update_statuses(table, [row_id], status)
+
+        with self._lock:
+            self._pending[(table, row_id)] = status
+            pending = len(self._pending)
+
+        if pending >= self.flush_size:
+            self._wakeup.set()
+        return True
+
+    def update_story_status(self, story_id: str, status: str) -> bool:
+        """Queue a story status update (see ``update_status``)."""
+        return self.update_status("stories", story_id, status)
+
+    def update_video_status(self, video_id: str, status: str) -> bool:
+        """Queue a video status update without approval fields (see ``update_status``)."""
+        return self.update_status("videos", video_id, status)
+
+    def pending_count(self) -> int:
+        """Number of rows waiting to be flushed."""
+        with self._lock:
+            return len(self._pending)
+
+    # ========================================================================
+    # FLUSH
+    # ========================================================================
+
+    def flush(self) -> bool:
+        """Write all pending updates now (blocks until done).
+
+        Call before reading rows whose status may still be queued.
+
+        Returns:
+            True if nothing is left pending
+        """
+        with self._flush_lock:
+            with self._lock:
+                batch, self._pending = self._pending, {}
+            if not batch:
+                return True
+
+            groups: Dict[Tuple[str, str], List[str]] = defaultdict(list)
+            for (table, row_id), status in batch.items():
+                groups[(table, status)].append(row_id)
+
+            failed: Dict[Tuple[str, str], str] = {}
+            for (table, status), ids in groups.items():
+                if not self.db.update_statuses(table, ids, status):
+                    failed.update({(table, row_id): status for row_id in ids})
+
+            if failed:
+                # Re-queue, unless the row was updated again while flushing
+                with self._lock:
+                    for key, status in failed.items():
+                        self._pending.setdefault(key, status)
+                logger.warning(f"Write-behind flush failed for {len(failed)} rows; will retry")
+                return False
+
+            if self._recovered:
+                # Spilled updates are now in the database
+                self.spill_path.unlink(missing_ok=True)
+                self._recovered = False
+
+            logger.debug(f"Flushed {len(batch)} status updates in {len(groups)} requests")
+            return True
+
+    def _run(self) -> None:
+        """Flush on the timer or when the size threshold wakes the thread."""
+        while not self._closed.is_set():
+            self._wakeup.wait(self.flush_interval)
+            self._wakeup.clear()
+            if self._closed.is_set():
+                break
+            try:
+                self.flush()
+            except Exception as e:
+                logger.error(f"Write-behind flush error: {e}")
+
+    def close(self) -> None:
+        """Stop the flush thread and flush what is left, spilling it to disk on failure."""
+        if self._closed.is_set():
+            return
+        self._closed.set()
+        self._wakeup.set()
+        if self._thread is not None:
+            self._thread.join(timeout=self.flush_interval + 30)
+
+        if not self.flush():
+            self._spill()
+
+    def __enter__(self) -> "WriteBehindQueue":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+
+    # ========================================================================
+    # SPILL FILE
+    # ========================================================================
+
+    def _spill(self) -> None:
+        """Write unflushed updates to the spill file atomically."""
+        with self._lock:
+            updates = [
+                {"table": table, "id": row_id, "status": status}
+                for (table, row_id), status in self._pending.items()
+            ]
+            self._pending = {}
+
+        try:
+            self.spill_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.spill_path.with_suffix(".tmp")
+            with open(tmp_path, 'w') as f:
+                json.dump({"updates": updates}, f, indent=2)
+            tmp_path.replace(self.spill_path)
+            logger.warning(f"Spilled {len(updates)} unflushed status updates to {self.spill_path}")
+        except OSError as e:
+            logger.error(f"Failed to spill {len(updates)} status updates: {e}")
+
+    def _load_spill(self) -> None:
+        """Queue updates left by a previous run (the file is removed once they are flushed)."""
+        if not self.spill_path.exists():
+            return
+
+        try:
+            with open(self.spill_path, 'r') as f:
+                updates = json.load(f).get("updates", [])
+        except (OSError, ValueError) as e:
+            logger.warning(f"Failed to load write-behind spill file {self.spill_path}: {e}")
+            return
+
+        with self._lock:
+            for update in updates:
+                self._pending[(update["table"], update["id"])] = update["status"]
+        self._recovered = True
+        logger.info(f"Recovered {len(updates)} status updates from {self.spill_path}")
+
+        if not self.enabled:
+            self.flush()
+
+# Global write-behind queue (started on first use)
+status_writer = LazyProxy(WriteBehindQueue)
+
+__all__ = ["WriteBehindQueue", "status_writer", "STATUS_TABLES"]
@@ -1,15 +1,16 @@
 """Text-to-Speech engine using gTTS (Google TTS) with edge-tts fallback."""
 
-import asyncio
 from pathlib import Path
 from typing import Optional
-from gtts import gTTS
-import edge_tts
 from src.utils.logger import get_logger
 from src.utils.config_loader import config
+from src.utils.rate_limiter import call_with_rate_limit, get_bucket
 
 logger = get_logger(__name__)
 
+# Voice identifier used for speaking-rate calibration of gTTS output
+GTTS_VOICE_ID = "gtts:en"
+
 class TTSEngine:
     """Generate voiceovers using gTTS (primary) and edge-tts (fallback)."""
 
@@ -18,8 +19,14 @@ class TTSEngine:
         self.engine = "gtts"  # Use gTTS by default since edge-tts is blocked
         self.voice = config.get("tts.voice", "en-US-AriaNeural")
         self.fallback_voice = config.get("tts.fallback_voice", "en-US-GuyNeural")
+        self.last_voice: Optional[str] = None  # Voice that produced the most recent audio
         logger.info(f"TTS engine initialized (using gTTS)")
 
+    @property
+    def planned_voice(self) -> str:
+        """Voice the next ``generate`` call will use (before any fallback)."""
+        return GTTS_VOICE_ID if self.engine == "gtts" else self.voice
+
     def generate_with_gtts(self, text: str, output_path: str) -> bool:
         """Generate TTS using Google TTS.
 
@@ -31,8 +38,11 @@ class TTSEngine:
             True if successful
         """
         try:
+            from gtts import gTTS
+
             tts = gTTS(text=text, lang='en', slow=False)
-            tts.save(output_path)
+            call_with_rate_limit("tts", tts.save, output_path)
+            self.last_voice = GTTS_VOICE_ID
             logger.info(f"Generated TTS audio with gTTS: {output_path}")
             return True
         except Exception as e:
@@ -56,8 +66,12 @@ class TTSEngine:
         # If gTTS fails, try edge-tts as fallback
         logger.info("Trying edge-tts as fallback...")
         try:
+            import edge_tts
+
             communicate = edge_tts.Communicate(text, self.voice)
+            await get_bucket("tts").acquire_async()
             await communicate.save(output_path)
+            self.last_voice = self.voice
             logger.info(f"Generated TTS audio with edge-tts: {output_path}")
             return True
         except Exception as e:
@@ -83,6 +97,8 @@ class TTSEngine:
         Returns:
             List of available voice names
         """
+        import edge_tts
+
         voices = await edge_tts.list_voices()
         return [v["Name"] for v in voices if v["Locale"].startswith("en")]
 
@@ -92,6 +108,8 @@ class TTSEngine:
         Returns:
             List of available voice names
         """
+        import asyncio
+
         return asyncio.run(self.list_voices_async())
 
 # Test if run directly
@@ -2,39 +2,47 @@
 
 import random
 from pathlib import Path
-from typing import Dict, Optional
+from typing import TYPE_CHECKING, Dict, Optional
 from datetime import datetime
-
-# Fix for Pillow 10.x compatibility with MoviePy
-try:
-    from PIL import Image
-    if not hasattr(Image, 'ANTIALIAS'):
-        Image.ANTIALIAS = Image.LANCZOS
-except ImportError:
-    pass
-
-from moviepy.editor import (
-    VideoFileClip,
-    AudioFileClip,
-    concatenate_videoclips,
-    CompositeVideoClip
-)
 from src.generators.tts_engine import TTSEngine
 from src.processors.script_generator import ScriptGenerator
 from src.processors.ai_script_enhancer import AIScriptEnhancer
-from src.database.supabase_client import db
+from src.processors.speech_rate import get_speech_rate_model
+from src.database.repository import db
+from src.database.write_behind import status_writer
 from src.utils.logger import get_logger
 from src.utils.config_loader import config
 
 logger = get_logger(__name__)
 
+if TYPE_CHECKING:
+    from moviepy.editor import VideoFileClip
+
+def _moviepy():
+    """Import MoviePy on first use (it pulls in PIL, NumPy and imageio).
+
+    Returns:
+        The moviepy.editor module
+    """
+    # Fix for Pillow 10.x compatibility with MoviePy
+    try:
+        from PIL import Image
+        if not hasattr(Image, 'ANTIALIAS'):
+            Image.ANTIALIAS = Image.LANCZOS
+    except ImportError:
+        pass
+
+    import moviepy.editor
+    return moviepy.editor
+
 class VideoGenerator:
     """Generate videos from Reddit stories."""
 
     def __init__(self):
         """Initialize video generator."""
         self.tts = TTSEngine()
-        self.script_generator = ScriptGenerator(max_words_per_video=300)
+        self.rate_model = get_speech_rate_model()
+        self.script_generator = ScriptGenerator(max_words_per_video=300, rate_model=self.rate_model)
         self.ai_enhancer = AIScriptEnhancer()
 
         # Directories
@@ -75,7 +83,7 @@ class VideoGenerator:
         logger.info(f"Selected background: {selected.name}")
         return selected
 
-    def crop_to_vertical(self, video: VideoFileClip) -> VideoFileClip:
+    def crop_to_vertical(self, video: "VideoFileClip") -> "VideoFileClip":
         """Crop video to 9:16 aspect ratio (vertical/portrait).
 
         Args:
@@ -113,7 +121,7 @@ class VideoGenerator:
         self,
         background_path: Path,
         target_duration: float
-    ) -> VideoFileClip:
+    ) -> "VideoFileClip":
         """Loop background video to match target duration.
 
         Args:
@@ -124,7 +132,7 @@ class VideoGenerator:
             Looped and cropped video clip
         """
         # Load background
-        bg = VideoFileClip(str(background_path))
+        bg = _moviepy().VideoFileClip(str(background_path))
 
         # Crop to 9:16
         bg = self.crop_to_vertical(bg)
@@ -134,7 +142,7 @@ class VideoGenerator:
 
         # Concatenate loops
         clips = [bg] * loop_count
-        looped = concatenate_videoclips(clips)
+        looped = _moviepy().concatenate_videoclips(clips)
 
         # Trim to exact duration
         final = looped.subclip(0, target_duration)
@@ -171,7 +179,7 @@ class VideoGenerator:
         logger.info(f"Selected background: {bg_path.name}")
 
         # Load and crop to vertical
-        bg = VideoFileClip(str(bg_path))
+        bg = _moviepy().VideoFileClip(str(bg_path))
         bg = self.crop_to_vertical(bg)
 
         # Choose a random start position
@@ -185,7 +193,7 @@ class VideoGenerator:
         if bg.duration < target_duration:
             loop_count = int(target_duration / bg.duration) + 1
             clips = [bg] * loop_count
-            looped = concatenate_videoclips(clips)
+            looped = _moviepy().concatenate_videoclips(clips)
             bg.close()
 
             # Start from random position in looped video
@@ -202,7 +210,7 @@ class VideoGenerator:
         self,
         story: Dict,
         output_filename: Optional[str] = None
-    ) -> Optional[Path]:
+    ) -> Optional[Dict]:
         """Generate video from story.
 
         Args:
@@ -210,27 +218,29 @@ class VideoGenerator:
             output_filename: Optional custom output filename
 
         Returns:
-            Path to generated video or None if failed
+            Dictionary with video_id (database row, None if the insert failed),
+            story_id, path, duration and file_size_mb, or None if failed
         """
         story_id = story["id"]
 
-        # Generate engaging script with hook (standalone, no parts)
+        # Generate engaging script with hook (standalone, no parts), timed
+        # for the voice that is about to read it
+        voice = self.tts.planned_voice
         logger.info(f"Generating engaging script for story {story_id}")
-        script = self.script_generator.generate_script(
+        script_doc = self.script_generator.build_script(
             story=story['body'],
-            title=story['title'],
-            max_duration=180  # 3 minutes max
+            max_duration=180,  # 3 minutes max
+            voice=voice
         )
 
-        word_count = len(script.split())
-        logger.info(f"Generated script with {word_count} words (includes hook)")
+        logger.info(f"Generated script with {script_doc.word_count} words (includes hook)")
 
         # Enhance script with AI for maximum virality
         logger.info("Enhancing script with AI for viral hooks and pacing...")
-        script = self.ai_enhancer.enhance_script(script, story['title'])
+        script_doc = self.ai_enhancer.enhance_document(script_doc, story['title'])
+        script = script_doc.text
 
-        word_count = len(script.split())
-        logger.info(f"AI-enhanced script with {word_count} words")
+        logger.info(f"AI-enhanced script with {script_doc.word_count} words")
         logger.info(f"Generating video for story {story_id}")
 
         try:
@@ -243,9 +253,15 @@ class VideoGenerator:
                 return None
 
             # Step 2: Load audio to get duration
-            audio = AudioFileClip(str(voiceover_path))
+            audio = _moviepy().AudioFileClip(str(voiceover_path))
             duration = audio.duration
-            logger.info(f"Voiceover duration: {duration:.1f}s")
+            logger.info(
+                f"Voiceover duration: {duration:.1f}s "
+                f"(estimated {self.rate_model.predict_counts(script_doc.word_count, len(script_doc), voice):.1f}s)"
+            )
+
+            # Calibrate the voice that actually spoke (a fallback voice may have been used)
+            self.rate_model.record_counts(self.tts.last_voice, script_doc.word_count, len(script_doc), duration)
 
             # Step 3: Create background video with random start position
             logger.info("Creating background video from random start position...")
@@ -291,17 +307,25 @@ class VideoGenerator:
                 "status": "pending_approval"
             }
 
-            db.insert_video(video_data)
+            video_row = db.insert_video(video_data)
+            if video_row is None:
+                logger.warning(f"Video for story {story_id} rendered but not recorded in the database")
 
-            # Update story status
-            db.update_story_status(story_id, "processed")
+            # Update story status (written behind, off the render path)
+            status_writer.update_story_status(story_id, "processed")
 
             # Cleanup
             audio.close()
             video.close()
             final.close()
 
-            return output_path
+            return {
+                "video_id": video_row["id"] if video_row else None,
+                "story_id": story_id,
+                "path": output_path,
+                "duration": duration,
+                "file_size_mb": video_data["file_size_mb"],
+            }
 
         except Exception as e:
             logger.error(f"Failed to generate video: {e}", exc_info=True)
@@ -346,11 +370,12 @@ if __name__ == "__main__":
     print(f"\nGenerating video for: {story['title'][:50]}...")
     print(f"Story ID: {story['id']}")
 
-    video_path = generator.generate_video(story)
+    result = generator.generate_video(story)
 
-    if video_path:
+    if result:
         print(f"\nVideo generated successfully!")
-        print(f"Location: {video_path}")
+        print(f"Location: {result['path']}")
+        print(f"Video ID: {result['video_id']}")
         print(f"\nPlay the video to verify quality.")
     else:
         print("\nERROR: Video generation failed. Check logs for details.")
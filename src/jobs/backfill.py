@@ -0,0 +1,362 @@
+"""Backfill historical stories for a date range with parallel windowed workers."""
+
+import json
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+from src.scrapers.multi_source import load_sources
+from src.scrapers.reddit_scraper import RedditScraper, create_reddit
+from src.utils.logger import get_logger
+from src.utils.config_loader import config
+
+logger = get_logger(__name__)
+
+# Smallest Reddit time filter that still reaches a given age
+TIME_FILTERS = [
+    ("day", timedelta(days=1)),
+    ("week", timedelta(weeks=1)),
+    ("month", timedelta(days=31)),
+    ("year", timedelta(days=365)),
+]
+
+Window = Tuple[datetime, datetime]
+
+def split_windows(start: datetime, end: datetime, window_days: int) -> List[Window]:
+    """Split a date range into consecutive windows, newest first.
+
+    Args:
+        start: Range start (inclusive)
+        end: Range end (exclusive)
+        window_days: Window length in days
+
+    Returns:
+        List of (window_start, window_end) pairs
+    """
+    windows = []
+    window_end = end
+    while window_end > start:
+        window_start = max(start, window_end - timedelta(days=window_days))
+        windows.append((window_start, window_end))
+        window_end = window_start
+    return windows
+
+def time_filter_for(window_start: datetime, now: datetime) -> str:
+    """Pick the narrowest search time filter that covers a window.
+
+    Args:
+        window_start: Oldest post time wanted
+        now: Current time (UTC)
+
+    Returns:
+        Reddit time filter name
+    """
+    for name, span in TIME_FILTERS:
+        if now - window_start <= span:
+            return name
+    return "all"
+
+class BackfillCheckpoint:
+    """Per-window progress stored in a small JSON file.
+
+    Each window records the fullname of the last post whose page was saved
+    ("after") and whether it finished, so an interrupted backfill resumes
+    each window where it left off instead of starting over.
+    """
+
+    def __init__(self, path: Optional[str] = None):
+        """Initialize checkpoint.
+
+        Args:
+            path: Path to checkpoint JSON file. If None, uses config value.
+        """
+        if path is None:
+            path = config.get("backfill.checkpoint_file", "data/state/backfill_checkpoint.json")
+            path = Path(__file__).parent.parent.parent / path
+
+        self.path = Path(path)
+        self._lock = threading.Lock()
+        self._windows: Dict[str, Dict] = self._load()
+
+    def _load(self) -> Dict[str, Dict]:
+        """Load window progress from disk."""
+        if not self.path.exists():
+            return {}
+
+        try:
+            with open(self.path, 'r') as f:
+                return json.load(f).get("windows", {})
+        except (OSError, ValueError) as e:
+            logger.warning(f"Failed to load backfill checkpoint from {self.path}: {e}")
+            return {}
+
+    @staticmethod
+    def key(subreddit: str, window: Window) -> str:
+        """Checkpoint key for a subreddit window."""
+        return f"{subreddit.lower()}:{window[0].isoformat()}:{window[1].isoformat()}"
+
+    def get(self, key: str) -> Dict:
+        """Progress of a window ({} if never started)."""
+        with self._lock:
+            return dict(self._windows.get(key, {}))
+
+    def update(self, key: str, **progress) -> None:
+        """Record window progress and write the file atomically.
+
+        Args:
+            key: Window key
+            **progress: Fields to set (after, done, saved)
+        """
+        with self._lock:
+            self._windows.setdefault(key, {}).update(progress)
+
+            try:
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                tmp_path = self.path.with_suffix(".tmp")
+                with open(tmp_path, 'w') as f:
+                    json.dump({"windows": self._windows}, f, indent=2)
+                tmp_path.replace(self.path)
+            except OSError as e:
+                logger.warning(f"Failed to save backfill checkpoint: {e}")
+
+class Backfiller:
+    """Fetch past stories window by window across a thread pool.
+
+    Reddit listings stop after ~1000 posts, so each window is read from a
+    ``subreddit.search()`` sorted by new under the narrowest time filter that
+    reaches it, and walking stops once posts fall before the window. The
+    search still starts at the newest post, so on a busy subreddit it can
+    run out before reaching an old window; such windows are reported as
+    incomplete and never checkpointed as done. Workers
+    use their own PRAW client but share the process-wide Reddit rate budget.
+    Candidates go through the scraper's usual filter, score and dedup path,
+    one bulk save per page; the checkpoint only moves past pages that were
+    stored, so a failed save is fetched again on the next run.
+    """
+
+    def __init__(
+        self,
+        sources: Optional[List[Dict]] = None,
+        scraper: Optional[RedditScraper] = None,
+        checkpoint: Optional[BackfillCheckpoint] = None,
+        max_workers: Optional[int] = None,
+        page_size: Optional[int] = None
+    ):
+        """Initialize backfiller.
+
+        Args:
+            sources: Source dictionaries (see load_sources). If None, uses config.
+            scraper: Scraper used for filtering, scoring and saving. If None, creates one.
+            checkpoint: Window progress store. If None, uses the configured file.
+            max_workers: Windows fetched at once. If None, uses config value.
+            page_size: Candidates saved per bulk write. If None, uses config value.
+        """
+        self.scraper = scraper or RedditScraper()
+        self.sources = sources or load_sources(self.scraper)
+        self.checkpoint = checkpoint or BackfillCheckpoint()
+        self.max_workers = max_workers or config.get("backfill.max_workers", 4)
+        self.page_size = page_size or config.get("backfill.page_size", 100)
+
+        self._local = threading.local()
+        self._save_lock = threading.Lock()  # Dedup index and known IDs are shared
+
+    def _reddit(self):
+        """PRAW client for the current worker thread."""
+        if not hasattr(self._local, "reddit"):
+            self._local.reddit = create_reddit()
+        return self._local.reddit
+
+    def _save(self, candidates: List[Dict]) -> int:
+        """Score and save one page of candidates."""
+        if not candidates:
+            return 0
+        with self._save_lock:
+            return self.scraper.save_stories_to_db(self.scraper.score_candidates(candidates))
+
+    def backfill_window(self, source: Dict, window: Window) -> Tuple[int, bool]:
+        """Fetch and save one subreddit window, resuming from its checkpoint.
+
+        Args:
+            source: Source dictionary
+            window: (window_start, window_end) in UTC
+
+        Returns:
+            Tuple of (stories saved in this run, whether the walk covered the
+            whole window)
+        """
+        name = source["subreddit"]
+        key = BackfillCheckpoint.key(name, window)
+        progress = self.checkpoint.get(key)
+        if progress.get("done"):
+            return 0, True
+
+        start_ts = window[0].replace(tzinfo=timezone.utc).timestamp()
+        end_ts = window[1].replace(tzinfo=timezone.utc).timestamp()
+        params = {"after": progress["after"]} if progress.get("after") else None
+        time_filter = time_filter_for(window[0], datetime.utcnow())
+
+        candidates = []
+        saved = 0
+        last_fullname = progress.get("after")
+        committed = last_fullname  # Resume point: only moves past pages that were stored
+        oldest_ts = None
+        reached_start = False
+        save_failed = False
+
+        subreddit = self._reddit().subreddit(name)
+        listing = subreddit.search(
+            "self:yes", sort="new", time_filter=time_filter, limit=None, params=params
+        )
+
+        for post in listing:
+            oldest_ts = post.created_utc
+            if post.created_utc >= end_ts:
+                continue
+            if post.created_utc < start_ts:
+                reached_start = True
+                break
+
+            candidate = self.scraper.build_candidate(post, filters=source, subreddit=name)
+            if candidate is not None:
+                candidates.append(candidate)
+
+            last_fullname = post.fullname
+            if len(candidates) >= self.page_size:
+                page_saved = self._save(candidates)
+                candidates = []
+                if not page_saved:
+                    # Lookup or upsert failed: the rerun must fetch this page again
+                    save_failed = True
+                    break
+                saved += page_saved
+                committed = last_fullname
+                self.checkpoint.update(key, after=committed, saved=progress.get("saved", 0) + saved)
+
+        if not save_failed:
+            page_saved = self._save(candidates)
+            if candidates and not page_saved:
+                save_failed = True
+            else:
+                saved += page_saved
+                committed = last_fullname
+
+        # Only a walk that got past the window start (and stored everything) has covered it
+        complete = reached_start and not save_failed
+        self.checkpoint.update(
+            key, after=committed, saved=progress.get("saved", 0) + saved, done=complete
+        )
+
+        if save_failed:
+            logger.warning(
+                f"Backfill of r/{name} {window[0]:%Y-%m-%d}..{window[1]:%Y-%m-%d} is incomplete: "
+                f"a page of candidates could not be saved, {saved} stories saved"
+            )
+            return saved, False
+
+        if not reached_start:
+            reached = (
+                f"reached {datetime.utcfromtimestamp(oldest_ts):%Y-%m-%d %H:%M}"
+                if oldest_ts is not None else "returned no posts"
+            )
+            logger.warning(
+                f"Backfill of r/{name} {window[0]:%Y-%m-%d}..{window[1]:%Y-%m-%d} is incomplete: "
+                f"the search listing ran out ({reached}), {saved} stories saved"
+            )
+            return saved, False
+
+        logger.info(f"Backfilled r/{name} {window[0]:%Y-%m-%d}..{window[1]:%Y-%m-%d}: {saved} stories saved")
+        return saved, True
+
+    def run(self, start: datetime, end: datetime, window_days: Optional[int] = None) -> Dict[str, int]:
+        """Backfill every source over a date range.
+
+        Args:
+            start: Range start (UTC, inclusive)
+            end: Range end (UTC, exclusive)
+            window_days: Window length in days. If None, uses config value.
+
+        Returns:
+            Counts of windows completed, incomplete (listing ran out before
+            the window start, or a page could not be saved), failed and
+            stories saved
+        """
+        window_days = window_days or config.get("backfill.window_days", 7)
+        windows = split_windows(start, end, window_days)
+
+        # Stories stored long ago can fall inside the range, so widen the lookbacks
+        lookback_days = (datetime.utcnow() - start).days + 1
+        self.scraper.known_ids_lookback_days = max(self.scraper.known_ids_lookback_days, lookback_days)
+        self.scraper.dedup_lookback_days = max(self.scraper.dedup_lookback_days, lookback_days)
+        self.scraper.get_known_ids()
+        self.scraper.get_dedup_index()
+
+        jobs = [(source, window) for source in self.sources for window in windows]
+        stats = {"windows": 0, "incomplete": 0, "failed": 0, "saved": 0}
+        started = time.perf_counter()
+
+        logger.info(
+            f"Backfilling {len(self.sources)} subreddits over {len(windows)} windows "
+            f"with {self.max_workers} workers"
+        )
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            futures = {executor.submit(self.backfill_window, source, window): (source, window)
+                       for source, window in jobs}
+
+            for future in as_completed(futures):
+                source, window = futures[future]
+                try:
+                    saved, complete = future.result()
+                    stats["saved"] += saved
+                    stats["windows" if complete else "incomplete"] += 1
+                except Exception as e:
+                    stats["failed"] += 1
+                    logger.error(f"Backfill of r/{source['subreddit']} {window[0]:%Y-%m-%d} failed: {e}")
+
+        logger.info(f"Backfill finished in {time.perf_counter() - started:.1f}s: {stats}")
+        return stats
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Backfill historical Reddit stories")
+    parser.add_argument("--start", required=True, help="Range start (YYYY-MM-DD, UTC)")
+    parser.add_argument("--end", default=None, help="Range end (YYYY-MM-DD, UTC, exclusive). Defaults to tomorrow.")
+    parser.add_argument("--subreddit", action="append", help="Only these subreddits (repeatable)")
+    parser.add_argument("--window-days", type=int, default=None, help="Days per window")
+    parser.add_argument("--workers", type=int, default=None, help="Windows fetched at once")
+    parser.add_argument("--checkpoint", default=None, help="Checkpoint file (resume state)")
+    args = parser.parse_args()
+
+    backfiller = Backfiller(
+        checkpoint=BackfillCheckpoint(args.checkpoint) if args.checkpoint else None,
+        max_workers=args.workers
+    )
+    if args.subreddit:
+        # Configured sources keep their filters, others use the defaults
+        configured = {source["subreddit"].lower(): source for source in backfiller.sources}
+        backfiller.sources = [
+            configured.get(name.lower(), {**backfiller.scraper.filters, "subreddit": name})
+            for name in args.subreddit
+        ]
+
+    start = datetime.strptime(args.start, "%Y-%m-%d")
+    if args.end:
+        end = datetime.strptime(args.end, "%Y-%m-%d")
+    else:
+        # Midnight tomorrow keeps window keys stable, so reruns resume the same windows
+        end = datetime.combine(datetime.utcnow().date() + timedelta(days=1), datetime.min.time())
+
+    try:
+        stats = backfiller.run(start, end, window_days=args.window_days)
+        print(f"✅ Backfilled {stats['saved']} stories across {stats['windows']} windows "
+              f"({stats['failed']} failed)")
+        if stats["incomplete"]:
+            print(f"⚠️  {stats['incomplete']} windows were not fully covered (out of Reddit "
+                  f"search reach or failed saves) and were not marked done")
+    except KeyboardInterrupt:
+        print("\n\n❌ Backfill interrupted; rerun the same command to resume.")
+        sys.exit(1)
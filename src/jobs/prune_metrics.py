@@ -0,0 +1,58 @@
+"""Apply metrics retention: drop platform_metrics history past tracking.retention_days."""
+
+import sys
+from typing import Dict, Optional
+from src.database.repository import db
+from src.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+def prune_metrics(retention_days: Optional[int] = None, archive: bool = False) -> Dict[str, int]:
+    """Remove expired metrics history, optionally archiving it first.
+
+    On Supabase whole monthly partitions are dropped; rollups and the
+    latest snapshot of every post are kept either way. Partitions for the
+    current and next month are created first, so a regular prune run also
+    keeps inserts from running out of partitions.
+
+    Args:
+        retention_days: Days of history to keep. If None, uses config value.
+        archive: Sync platform_metrics to the Parquet archive before pruning.
+            Nothing is removed if the sync fails.
+
+    Returns:
+        Dictionary with rows archived and partitions (or rows) removed
+
+    Raises:
+        Exception: If archive is set and the Parquet sync failed
+    """
+    archived = 0
+    if archive:
+        from src.database.archive import ParquetArchive
+        archived = ParquetArchive().sync_table("platform_metrics", raise_errors=True)
+        logger.info(f"Archived {archived} metrics rows before pruning")
+
+    if not db.ensure_metrics_partitions(months_ahead=1):
+        logger.warning("Could not create upcoming metrics partitions")
+
+    removed = db.drop_expired_metrics(retention_days)
+    return {"archived": archived, "removed": removed}
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Drop metrics history older than the retention window")
+    parser.add_argument("--retention-days", type=int, help="Days of history to keep (default: tracking.retention_days)")
+    parser.add_argument("--archive", action="store_true", help="Sync metrics to the Parquet archive first")
+    args = parser.parse_args()
+
+    try:
+        stats = prune_metrics(retention_days=args.retention_days, archive=args.archive)
+        print(f"✅ Archived {stats['archived']} rows, removed {stats['removed']} expired partitions/rows")
+    except KeyboardInterrupt:
+        print("\n\n❌ Pruning interrupted by user.")
+        sys.exit(1)
+    except Exception as e:
+        print(f"\n❌ Pruning failed: {e}")
+        logger.error(f"Metrics pruning failed: {e}", exc_info=True)
+        sys.exit(1)
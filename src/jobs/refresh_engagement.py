@@ -0,0 +1,165 @@
+"""Refresh engagement metrics and virality of stories waiting for selection."""
+
+import sys
+import time
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional
+from src.database.repository import db
+from src.processors.virality import ViralityScorer
+from src.scrapers.reddit_scraper import create_reddit
+from src.utils.batching import chunked
+from src.utils.logger import get_logger
+from src.utils.config_loader import config
+
+logger = get_logger(__name__)
+
+# reddit.info() accepts at most 100 fullnames per request
+INFO_BATCH_SIZE = 100
+
+REFRESH_COLUMNS = (
+    "id, reddit_id, created_utc, upvotes, comments, upvote_ratio, awards, "
+    "word_count, sentiment_score, virality_score"
+)
+
+class EngagementRefresher:
+    """Re-fetch upvotes/comments for scraped stories and rescore them.
+
+    Stories are looked up 100 fullnames per ``reddit.info()`` request (one
+    API call per 100 stories, versus re-walking listings), rescored with
+    their current age, and written back with one bulk update per page.
+    """
+
+    def __init__(self, reddit=None, max_age_hours: Optional[float] = None):
+        """Initialize engagement refresher.
+
+        Args:
+            reddit: PRAW client. If None, creates a rate-limited one from .env.
+            max_age_hours: Skip stories older than this. If None, uses config value.
+        """
+        self.reddit = reddit or create_reddit()
+        self.max_age_hours = max_age_hours or config.get("refresh.max_age_hours", 72)
+        self.scorer = ViralityScorer()
+
+    def fetch_metrics(self, reddit_ids: List[str]) -> Dict[str, Dict]:
+        """Look up current engagement for Reddit posts.
+
+        Args:
+            reddit_ids: Reddit post IDs
+
+        Returns:
+            Mapping of reddit_id to current metrics (posts that were removed
+            or deleted are left out)
+        """
+        metrics = {}
+
+        for chunk in chunked(reddit_ids, INFO_BATCH_SIZE):
+            try:
+                for post in self.reddit.info(fullnames=[f"t3_{reddit_id}" for reddit_id in chunk]):
+                    if post.removed_by_category or post.selftext in ["[removed]", "[deleted]"]:
+                        continue
+                    metrics[post.id] = {
+                        "upvotes": post.score,
+                        "comments": post.num_comments,
+                        "upvote_ratio": post.upvote_ratio,
+                        "awards": post.total_awards_received,
+                    }
+            except Exception as e:
+                logger.error(f"Failed to look up {len(chunk)} posts: {e}")
+
+        return metrics
+
+    def refresh_page(self, rows: List[Dict], now: datetime) -> List[Dict]:
+        """Refresh one page of stories.
+
+        Args:
+            rows: Story rows with REFRESH_COLUMNS
+            now: Measurement time (UTC)
+
+        Returns:
+            Update dicts for every story still live on Reddit
+        """
+        cutoff = now - timedelta(hours=self.max_age_hours)
+        rows = [row for row in rows if datetime.fromisoformat(row["created_utc"]) >= cutoff]
+        if not rows:
+            return []
+
+        metrics = self.fetch_metrics([row["reddit_id"] for row in rows])
+
+        # Rows scraped before word_count existed
+        missing = [row["id"] for row in rows if row.get("word_count") is None]
+        word_counts = {
+            story["id"]: len(story["body"].split())
+            for story in db.get_stories_by_ids(missing, columns="id, body")
+        }
+
+        stories = []
+        for row in rows:
+            current = metrics.get(row["reddit_id"])
+            if current is None:
+                continue
+            created = datetime.fromisoformat(row["created_utc"])
+            stories.append({
+                **row,
+                **current,
+                "word_count": word_counts.get(row["id"], row.get("word_count") or 0),
+                "sentiment_score": row.get("sentiment_score") or 0,
+                "hours_old": (now - created) / timedelta(hours=1),  # Same arithmetic as rescoring
+            })
+
+        updates = []
+        measured_at = now.isoformat()
+        for story, virality_score in zip(stories, self.scorer.score_batch(stories)):
+            update = {
+                column: story[column]
+                for column in ("upvotes", "comments", "upvote_ratio", "awards")
+            }
+            update["virality_score"] = virality_score
+            update["metrics_updated_at"] = measured_at
+            if story["id"] in word_counts:
+                update["word_count"] = story["word_count"]
+            updates.append({"id": story["id"], **update})
+
+        return updates
+
+    def refresh(self, page_size: int = 500, dry_run: bool = False) -> Dict[str, int]:
+        """Refresh every story still in 'scraped' status.
+
+        Args:
+            page_size: Stories per page (and per bulk update)
+            dry_run: Compute updates without writing them
+
+        Returns:
+            Counts of scanned, refreshed and updated stories
+        """
+        stats = {"scanned": 0, "refreshed": 0, "updated": 0}
+        start = time.perf_counter()
+
+        for rows in db.iter_story_pages(columns=REFRESH_COLUMNS, page_size=page_size, status="scraped"):
+            updates = self.refresh_page(rows, datetime.utcnow())
+            stats["scanned"] += len(rows)
+            stats["refreshed"] += len(updates)
+
+            if updates and not dry_run:
+                stats["updated"] += db.bulk_update_stories(updates)
+
+        logger.info(
+            f"Refreshed {stats['refreshed']}/{stats['scanned']} scraped stories "
+            f"in {time.perf_counter() - start:.1f}s ({stats['updated']} rows written)"
+        )
+        return stats
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Refresh engagement of stories waiting for selection")
+    parser.add_argument("--page-size", type=int, default=500, help="Stories per page")
+    parser.add_argument("--dry-run", action="store_true", help="Report changes without writing them")
+    args = parser.parse_args()
+
+    try:
+        stats = EngagementRefresher().refresh(page_size=args.page_size, dry_run=args.dry_run)
+        print(f"✅ Refreshed {stats['refreshed']} of {stats['scanned']} scraped stories "
+              f"({stats['updated']} rows updated)")
+    except KeyboardInterrupt:
+        print("\n\n❌ Refresh interrupted by user.")
+        sys.exit(1)
@@ -0,0 +1,136 @@
+"""Rescore every stored story with the current virality weights."""
+
+import sys
+import time
+from typing import Dict, List
+import numpy as np
+from src.database.repository import db
+from src.processors.virality import ViralityScorer
+from src.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+# Only the columns the score depends on (bodies are fetched just for rows missing word_count)
+SCORE_COLUMNS = (
+    "id, upvotes, comments, upvote_ratio, awards, word_count, "
+    "sentiment_score, created_utc, scraped_at, metrics_updated_at, virality_score"
+)
+
+def _to_datetime64(values: List[str]) -> np.ndarray:
+    """Parse ISO timestamps (naive UTC, as stored) into datetime64."""
+    return np.array(
+        [v[:-6] if v.endswith("+00:00") else v.rstrip("Z") for v in values],
+        dtype="datetime64[us]"
+    )
+
+def _column(rows: List[Dict], key: str) -> np.ndarray:
+    """Extract a numeric column, treating NULL as 0."""
+    return np.array([row.get(key) or 0 for row in rows], dtype=np.float64)
+
+def rescore_page(rows: List[Dict], scorer: ViralityScorer) -> List[Dict]:
+    """Rescore one page of stories.
+
+    Age is measured when the metrics were last collected (metrics_updated_at,
+    or scraped_at if never refreshed) minus created_utc: the same age the
+    score was originally computed with, so unchanged weights give unchanged
+    scores.
+
+    Args:
+        rows: Story rows with SCORE_COLUMNS
+        scorer: Virality scorer with the current weights
+
+    Returns:
+        Update dicts (id, virality_score and backfilled word_count) for changed rows only
+    """
+    # Backfill word counts for rows scraped before the column existed
+    missing = [row["id"] for row in rows if row.get("word_count") is None]
+    backfilled = {}
+    if missing:
+        for story in db.get_stories_by_ids(missing, columns="id, body"):
+            backfilled[story["id"]] = len(story["body"].split())
+        for row in rows:
+            if row["id"] in backfilled:
+                row["word_count"] = backfilled[row["id"]]
+
+    created = _to_datetime64([row["created_utc"] for row in rows])
+    measured = _to_datetime64([
+        row.get("metrics_updated_at") or row["scraped_at"] or row["created_utc"] for row in rows
+    ])
+    hours_old = (measured - created) / np.timedelta64(1, "h")
+
+    scores = scorer.score_arrays(
+        _column(rows, "upvotes"),
+        _column(rows, "comments"),
+        _column(rows, "upvote_ratio"),
+        _column(rows, "awards"),
+        _column(rows, "word_count"),
+        hours_old,
+        _column(rows, "sentiment_score"),
+    )
+
+    # Both sides are rounded to 2 decimals by np.round, so unchanged scores compare equal
+    old_scores = np.round(_column(rows, "virality_score"), 2)
+    changed = np.flatnonzero(~np.isclose(scores, old_scores, rtol=0, atol=1e-9))
+
+    updates = []
+    for index in changed.tolist():
+        row = rows[index]
+        update = {"id": row["id"], "virality_score": float(scores[index])}
+        if row["id"] in backfilled:
+            update["word_count"] = backfilled[row["id"]]
+        updates.append(update)
+
+    # Rows whose score didn't change still need their backfilled word count saved
+    changed_ids = {update["id"] for update in updates}
+    updates.extend(
+        {"id": story_id, "word_count": word_count}
+        for story_id, word_count in backfilled.items() if story_id not in changed_ids
+    )
+
+    return updates
+
+def rescore_all_stories(page_size: int = 1000, dry_run: bool = False) -> Dict[str, int]:
+    """Stream the stories table, rescore it and write back changed scores.
+
+    Args:
+        page_size: Stories per page (and per bulk update)
+        dry_run: Compute changes without writing them
+
+    Returns:
+        Counts of scanned, changed and updated stories
+    """
+    scorer = ViralityScorer()
+    stats = {"scanned": 0, "changed": 0, "updated": 0}
+    start = time.perf_counter()
+
+    logger.info(f"Rescoring stories with weights {scorer.weights}")
+
+    for rows in db.iter_story_pages(columns=SCORE_COLUMNS, page_size=page_size):
+        updates = rescore_page(rows, scorer)
+        stats["scanned"] += len(rows)
+        stats["changed"] += sum(1 for update in updates if "virality_score" in update)
+
+        if updates and not dry_run:
+            stats["updated"] += db.bulk_update_stories(updates)
+
+    logger.info(
+        f"Rescored {stats['scanned']} stories in {time.perf_counter() - start:.1f}s: "
+        f"{stats['changed']} changed, {stats['updated']} rows written"
+    )
+    return stats
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Rescore all stories with the current virality weights")
+    parser.add_argument("--page-size", type=int, default=1000, help="Stories per page")
+    parser.add_argument("--dry-run", action="store_true", help="Report changes without writing them")
+    args = parser.parse_args()
+
+    try:
+        stats = rescore_all_stories(page_size=args.page_size, dry_run=args.dry_run)
+        print(f"✅ Scanned {stats['scanned']} stories, {stats['changed']} scores changed, "
+              f"{stats['updated']} rows updated")
+    except KeyboardInterrupt:
+        print("\n\n❌ Rescoring interrupted by user.")
+        sys.exit(1)
@@ -1,7 +1,8 @@
 """Phase 1 pipeline: Scrape Reddit, select stories, and generate videos."""
 
+import argparse
 import sys
-from pathlib import Path
+from typing import Dict, List, Tuple
 from src.scrapers.reddit_scraper import RedditScraper
 from src.processors.story_selector import StorySelector
 from src.generators.video_generator import VideoGenerator
@@ -9,11 +10,52 @@ from src.utils.logger import get_logger
 
 logger = get_logger(__name__)
 
-def run_phase1_pipeline(story_count: int = 1):
+def review_videos(generated: List[Tuple[Dict, Dict]]) -> None:
+    """Ask for an approve/reject/skip decision on each generated video.
+
+    Each decision is one update by video id. Skipped videos stay pending
+    for the dashboard.
+
+    Args:
+        generated: (story, generate_video result) pairs
+    """
+    from src.database.repository import db
+
+    for story, result in generated:
+        print("\nPreview:")
+        print(f"  Title: {story['title']}")
+        print(f"  Virality Score: {story['virality_score']}")
+        print(f"  Word Count: {story.get('word_count', 'N/A')}")
+        print(f"  Video Location: {result['path']}")
+
+        if result["video_id"] is None:
+            print("❌ Video was not recorded in the database; nothing to approve.")
+            continue
+
+        while True:
+            response = input("\nApprove this video? (y/n/s to skip): ").lower().strip()
+
+            if response == 'y':
+                db.update_video_status(result["video_id"], "approved", approved_by="CLI")
+                print("✅ Video approved!")
+                break
+            elif response == 'n':
+                db.update_video_status(result["video_id"], "rejected", rejection_reason="Manual rejection via CLI")
+                print("❌ Video rejected.")
+                break
+            elif response == 's':
+                print("Left pending approval.")
+                break
+            else:
+                print("Please enter 'y', 'n' or 's'")
+
+def run_phase1_pipeline(story_count: int = 1, review: bool = True):
     """Run complete Phase 1 pipeline.
 
     Args:
         story_count: Number of stories to process (default 1 for Phase 1)
+        review: Ask for approval of each video after rendering (otherwise
+            videos stay pending for the dashboard)
 
     Returns:
         Number of videos generated
@@ -71,53 +113,27 @@ def run_phase1_pipeline(story_count: int = 1):
         print(f"3. Save to: {generator.backgrounds_dir}/minecraft_parkour_01.mp4")
         return 0
 
-    videos_generated = 0
+    generated = []
 
     for i, story in enumerate(stories, 1):
         print(f"\nGenerating video {i}/{len(stories)}: {story['title'][:50]}...")
 
-        video_path = generator.generate_video(story)
-
-        if video_path:
-            print(f"✅ Video generated: {video_path.name}")
-            videos_generated += 1
-
-            # Simple CLI approval
-            print("\nPreview:")
-            print(f"  Title: {story['title']}")
-            print(f"  Virality Score: {story['virality_score']}")
-            print(f"  Word Count: {story.get('word_count', 'N/A')}")
-            print(f"  Video Location: {video_path}")
-
-            while True:
-                response = input("\nApprove this video? (y/n): ").lower().strip()
-
-                if response == 'y':
-                    # Update video status to approved
-                    from src.database.supabase_client import db
-                    videos = db.get_videos_by_status("pending_approval")
-                    for vid in videos:
-                        if vid["story_id"] == story["id"]:
-                            db.update_video_status(vid["id"], "approved", approved_by="CLI")
-                            print("✅ Video approved!")
-                            break
-                    break
-                elif response == 'n':
-                    # Update video status to rejected
-                    from src.database.supabase_client import db
-                    videos = db.get_videos_by_status("pending_approval")
-                    for vid in videos:
-                        if vid["story_id"] == story["id"]:
-                            db.update_video_status(vid["id"], "rejected", rejection_reason="Manual rejection via CLI")
-                            print("❌ Video rejected.")
-                            break
-                    break
-                else:
-                    print("Please enter 'y' or 'n'")
+        result = generator.generate_video(story)
 
+        if result:
+            print(f"✅ Video generated: {result['path'].name}")
+            generated.append((story, result))
         else:
             print(f"❌ Failed to generate video for story {i}")
 
+    videos_generated = len(generated)
+
+    # Review once everything is rendered, so no render waits on input
+    if generated and review:
+        print("\nReview generated videos")
+        print("-" * 60)
+        review_videos(generated)
+
     # Summary
     print("\n" + "=" * 60)
     print(f"PIPELINE COMPLETE")
@@ -130,11 +146,13 @@ def run_phase1_pipeline(story_count: int = 1):
     return videos_generated
 
 if __name__ == "__main__":
-    # Get story count from command line, default to 1
-    count = int(sys.argv[1]) if len(sys.argv) > 1 else 1
+    parser = argparse.ArgumentParser(description="Scrape Reddit, select stories and generate videos")
+    parser.add_argument("count", type=int, nargs="?", default=1, help="Number of stories to process")
+    parser.add_argument("--no-review", action="store_true", help="Leave videos pending for the dashboard")
+    args = parser.parse_args()
 
     try:
-        videos_count = run_phase1_pipeline(story_count=count)
+        videos_count = run_phase1_pipeline(story_count=args.count, review=not args.no_review)
 
         if videos_count > 0:
             print("\n✅ Phase 1 pipeline completed successfully!")
@@ -1,9 +1,10 @@
 """AI-powered script enhancer using Claude Haiku for viral TikTok scripts."""
 
 import os
-from typing import Dict
-from anthropic import Anthropic
+from typing import Dict, Union
 from src.utils.logger import get_logger
+from src.processors.story_document import StoryDocument
+from src.utils.rate_limiter import call_with_rate_limit
 
 logger = get_logger(__name__)
 
@@ -17,19 +18,38 @@ class AIScriptEnhancer:
             logger.warning("ANTHROPIC_API_KEY not found - AI enhancement disabled")
             self.client = None
         else:
-            self.client = Anthropic(api_key=self.api_key)
+            from anthropic import Anthropic  # Heavy import, skipped when AI enhancement is disabled
+            from src.utils.http_pool import client as pooled_http_client
+
+            self.client = Anthropic(api_key=self.api_key, http_client=pooled_http_client())
             logger.info("AI Script Enhancer initialized with Claude Haiku")
 
-    def enhance_script(self, raw_script: str, story_title: str = "") -> str:
+    def enhance_document(self, script: StoryDocument, story_title: str = "") -> StoryDocument:
+        """Enhance a script document, reusing it unchanged if enhancement is skipped.
+
+        Args:
+            script: Script document from script_generator
+            story_title: Story title for context
+
+        Returns:
+            Enhanced script document
+        """
+        enhanced = self.enhance_script(script, story_title)
+        return script if enhanced is script.text else StoryDocument(enhanced)
+
+    def enhance_script(self, raw_script: Union[str, StoryDocument], story_title: str = "") -> str:
         """Enhance a script using AI to make it more viral.
 
         Args:
-            raw_script: The basic script from script_generator
+            raw_script: The basic script (text or document) from script_generator
             story_title: Story title for context
 
         Returns:
             Enhanced script optimized for TikTok/Shorts virality
         """
+        raw_doc = StoryDocument.of(raw_script)
+        raw_script = raw_doc.text
+
         if not self.client:
             logger.info("AI enhancement disabled - returning original script")
             return raw_script
@@ -60,7 +80,9 @@ RULES:
 
 OUTPUT ONLY THE ENHANCED SCRIPT - NO EXPLANATIONS."""
 
-            response = self.client.messages.create(
+            response = call_with_rate_limit(
+                "anthropic",
+                self.client.messages.create,
                 model="claude-haiku-4-5-20251001",  # Updated to correct model name
                 max_tokens=500,
                 temperature=0.7,
@@ -69,12 +91,12 @@ OUTPUT ONLY THE ENHANCED SCRIPT - NO EXPLANATIONS."""
                 ]
             )
 
-            enhanced = response.content[0].text.strip()
+            enhanced = StoryDocument(response.content[0].text.strip())
 
-            logger.info(f"Script enhanced by AI ({len(raw_script.split())} -> {len(enhanced.split())} words)")
+            logger.info(f"Script enhanced by AI ({raw_doc.word_count} -> {enhanced.word_count} words)")
             logger.info(f"API cost: ${response.usage.input_tokens * 0.0000008 + response.usage.output_tokens * 0.000004:.4f}")
 
-            return enhanced
+            return enhanced.text
 
         except Exception as e:
             logger.error(f"AI enhancement failed: {e}")
@@ -109,7 +131,9 @@ OUTPUT FORMAT (one per line):
 2. [hook]
 3. [hook]"""
 
-            response = self.client.messages.create(
+            response = call_with_rate_limit(
+                "anthropic",
+                self.client.messages.create,
                 model="claude-haiku-4.5-20250929",
                 max_tokens=300,
                 temperature=0.9,
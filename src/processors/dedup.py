@@ -0,0 +1,183 @@
+"""Near-duplicate story detection with MinHash signatures and LSH buckets."""
+
+import base64
+import re
+import zlib
+from typing import Dict, Iterable, List, Optional, Tuple
+import numpy as np
+from src.utils.logger import get_logger
+from src.utils.config_loader import config
+from src.processors.text_cleaner import clean_reddit_markdown
+
+logger = get_logger(__name__)
+
+# Universal hashing (a*x + b) mod p with a Mersenne prime; a < 2^31 and 32-bit
+# shingle hashes keep a*x + b inside uint64
+MERSENNE_PRIME = np.uint64((1 << 61) - 1)
+MAX_HASH = np.uint64(0xFFFFFFFF)
+
+# Fixed seed: signatures are stored, so permutations must never change
+PERMUTATION_SEED = 1
+
+WORD_RE = re.compile(r"\w+")
+
+def shingles(text: str, size: int) -> List[str]:
+    """Word n-grams of a story body, after markdown cleanup and lowercasing.
+
+    Args:
+        text: Story body
+        size: Words per shingle
+
+    Returns:
+        List of shingles (texts shorter than size give a single shingle)
+    """
+    words = WORD_RE.findall(clean_reddit_markdown(text).lower())
+    if len(words) <= size:
+        return [" ".join(words)] if words else []
+    return [" ".join(words[i:i + size]) for i in range(len(words) - size + 1)]
+
+class MinHasher:
+    """Compute fixed-length MinHash signatures of story bodies."""
+
+    def __init__(self, num_perm: Optional[int] = None, shingle_size: Optional[int] = None):
+        """Initialize MinHasher.
+
+        Args:
+            num_perm: Signature length. If None, uses config value.
+            shingle_size: Words per shingle. If None, uses config value.
+        """
+        self.num_perm = num_perm or config.get("dedup.num_perm", 128)
+        self.shingle_size = shingle_size or config.get("dedup.shingle_size", 3)
+
+        rng = np.random.RandomState(PERMUTATION_SEED)
+        self._a = rng.randint(1, 1 << 31, size=self.num_perm, dtype=np.uint64)[:, None]
+        self._b = rng.randint(0, 1 << 31, size=self.num_perm, dtype=np.uint64)[:, None]
+
+    def signature(self, text: str) -> np.ndarray:
+        """Compute the MinHash signature of a story body.
+
+        Args:
+            text: Story body
+
+        Returns:
+            uint32 array of length num_perm
+        """
+        grams = set(shingles(text, self.shingle_size))
+        if not grams:
+            return np.full(self.num_perm, MAX_HASH, dtype=np.uint32)
+
+        hashes = np.fromiter(
+            (zlib.crc32(gram.encode("utf-8")) for gram in grams), dtype=np.uint64, count=len(grams)
+        )
+        permuted = ((self._a * hashes + self._b) % MERSENNE_PRIME) & MAX_HASH
+        return permuted.min(axis=1).astype(np.uint32)
+
+    def encode(self, signature: np.ndarray) -> str:
+        """Encode a signature compactly for storage (base64 of little-endian uint32)."""
+        return base64.b64encode(signature.astype("<u4").tobytes()).decode("ascii")
+
+    def decode(self, value: Optional[str]) -> Optional[np.ndarray]:
+        """Decode a stored signature (None if missing or from a different num_perm)."""
+        if not value:
+            return None
+        try:
+            signature = np.frombuffer(base64.b64decode(value), dtype="<u4")
+        except (ValueError, TypeError):
+            return None
+        return signature.astype(np.uint32) if len(signature) == self.num_perm else None
+
+def estimate_similarity(a: np.ndarray, b: np.ndarray) -> float:
+    """Estimate Jaccard similarity of two stories from their signatures."""
+    return float(np.count_nonzero(a == b)) / len(a)
+
+class DedupIndex:
+    """LSH index over MinHash signatures.
+
+    Signatures are split into bands; two stories land in the same bucket if
+    any band matches exactly. Bucket hits are confirmed by estimating the
+    Jaccard similarity from the full signatures, so a query is a handful of
+    dict lookups plus one vector compare per candidate.
+    """
+
+    def __init__(
+        self,
+        hasher: Optional[MinHasher] = None,
+        bands: Optional[int] = None,
+        threshold: Optional[float] = None
+    ):
+        """Initialize dedup index.
+
+        Args:
+            hasher: MinHasher for signatures. If None, creates one from config.
+            bands: Number of LSH bands. If None, uses config value.
+            threshold: Minimum estimated similarity for a duplicate. If None, uses config value.
+        """
+        self.hasher = hasher or MinHasher()
+        self.bands = bands or config.get("dedup.bands", 16)
+        self.threshold = threshold if threshold is not None else config.get("dedup.threshold", 0.8)
+
+        if self.hasher.num_perm % self.bands:
+            raise ValueError(f"num_perm ({self.hasher.num_perm}) must be divisible by bands ({self.bands})")
+        self.rows = self.hasher.num_perm // self.bands
+
+        self._buckets: List[Dict[bytes, List[str]]] = [{} for _ in range(self.bands)]
+        self._signatures: Dict[str, np.ndarray] = {}
+
+    def __len__(self) -> int:
+        return len(self._signatures)
+
+    def _band_keys(self, signature: np.ndarray) -> Iterable[Tuple[int, bytes]]:
+        for band in range(self.bands):
+            yield band, signature[band * self.rows:(band + 1) * self.rows].tobytes()
+
+    def add(self, story_id: str, signature: np.ndarray) -> None:
+        """Add a story's signature to the index.
+
+        Args:
+            story_id: Story UUID
+            signature: MinHash signature
+        """
+        if story_id in self._signatures:
+            return
+        self._signatures[story_id] = signature
+        for band, key in self._band_keys(signature):
+            self._buckets[band].setdefault(key, []).append(story_id)
+
+    def query(self, signature: np.ndarray) -> Optional[Tuple[str, float]]:
+        """Find the most similar indexed story above the threshold.
+
+        Args:
+            signature: MinHash signature
+
+        Returns:
+            Tuple of (story ID, estimated similarity) or None
+        """
+        candidates = set()
+        for band, key in self._band_keys(signature):
+            candidates.update(self._buckets[band].get(key, ()))
+
+        best = None
+        for story_id in candidates:
+            similarity = estimate_similarity(signature, self._signatures[story_id])
+            if similarity >= self.threshold and (best is None or similarity > best[1]):
+                best = (story_id, similarity)
+        return best
+
+    def add_stories(self, stories: Iterable[Dict]) -> int:
+        """Add stored stories (with id and encoded minhash) to the index.
+
+        Args:
+            stories: Story rows; rows without a valid signature are skipped
+
+        Returns:
+            Number of stories added
+        """
+        added = 0
+        for story in stories:
+            signature = self.hasher.decode(story.get("minhash"))
+            if signature is not None:
+                self.add(story["id"], signature)
+                added += 1
+        return added
+
+__all__ = ["MinHasher", "DedupIndex", "estimate_similarity", "shingles"]
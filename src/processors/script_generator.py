@@ -1,56 +1,64 @@
 """Script generator for creating engaging video narratives from stories."""
 
 import re
-from typing import Dict, List, Tuple
+from functools import partial
+from typing import Dict, Iterable, Iterator, List, Optional, Union
 from src.utils.logger import get_logger
+from src.utils.batching import process_in_chunks
+from src.processors.speech_rate import SpeechRateModel, get_speech_rate_model
+from src.processors.story_document import StoryDocument
 
 logger = get_logger(__name__)
 
+# Common hook patterns, in priority order
+HOOK_PATTERNS = [
+    re.compile(r"(After \d+ years[^.]+\.)(?=\s)", re.IGNORECASE),  # "After X years..."
+    re.compile(r"(I (?:just|never) (?:found out|discovered|learned)[^.]+\.)(?=\s)", re.IGNORECASE),  # "I just found out..."
+    re.compile(r"(My (?:wife|husband|partner|girlfriend|boyfriend)[^.]+(?:cheated|left)[^.]+\.)(?=\s)", re.IGNORECASE),  # "My wife cheated..."
+    re.compile(r"(Everything (?:changed|fell apart|was ruined)[^.]+\.)(?=\s)", re.IGNORECASE),  # "Everything changed..."
+]
+
 class ScriptGenerator:
     """Generate engaging video scripts from Reddit stories."""
 
-    def __init__(self, max_words_per_video: int = 300):
+    def __init__(
+        self,
+        max_words_per_video: int = 300,
+        rate_model: Optional[SpeechRateModel] = None
+    ):
         """Initialize script generator.
 
         Args:
             max_words_per_video: Maximum words per video (default ~2 min)
+            rate_model: Speaking-rate model for duration estimates. If None, uses the shared model.
         """
         self.max_words_per_video = max_words_per_video
+        self.rate_model = rate_model or get_speech_rate_model()
         logger.info(f"Script generator initialized (max {max_words_per_video} words/video)")
 
-    def extract_hook(self, story: str) -> str:
+    def extract_hook(self, story: Union[str, StoryDocument]) -> str:
         """Extract the most engaging hook from the story.
 
         Args:
-            story: Full story text
+            story: Full story text or document
 
         Returns:
             Engaging hook sentence
         """
-        # Common hook patterns
-        hook_patterns = [
-            r"(After \d+ years[^.]+\.)(?=\s)",  # "After X years..."
-            r"(I (?:just|never) (?:found out|discovered|learned)[^.]+\.)(?=\s)",  # "I just found out..."
-            r"(My (?:wife|husband|partner|girlfriend|boyfriend)[^.]+(?:cheated|left)[^.]+\.)(?=\s)",  # "My wife cheated..."
-            r"(Everything (?:changed|fell apart|was ruined)[^.]+\.)(?=\s)",  # "Everything changed..."
-        ]
+        doc = StoryDocument.of(story)
 
         # Try to find a hook
-        for pattern in hook_patterns:
-            match = re.search(pattern, story, re.IGNORECASE)
+        for pattern in HOOK_PATTERNS:
+            match = pattern.search(doc.text)
             if match:
                 return match.group(1).strip()
 
         # If no pattern matches, use first sentence
-        sentences = re.split(r'[.!?]+\s+', story)
-        if sentences:
-            first = sentences[0].strip()
-            # Make sure it ends with punctuation
-            if not first.endswith(('.', '!', '?')):
-                first += '.'
-            return first
-
-        return ""
+        first = doc.first_sentence()
+        # Make sure it ends with punctuation
+        if not first.endswith(('.', '!', '?')):
+            first += '.'
+        return first
 
     def create_engaging_intro(self, hook: str) -> str:
         """Create an engaging intro with the hook.
@@ -79,34 +87,31 @@ class ScriptGenerator:
         else:
             return intros[0]  # Default
 
-    def split_into_parts(self, story: str, title: str = "") -> List[Dict[str, str]]:
+    def split_into_parts(self, story: Union[str, StoryDocument], title: str = "") -> List[Dict[str, str]]:
         """Split a long story into multiple parts.
 
         Args:
-            story: Full story text
+            story: Full story text or document
             title: Story title (optional, won't be used in script)
 
         Returns:
             List of parts, each with 'script', 'part_number', 'total_parts'
         """
         # Remove TL;DR and metadata
-        story = re.sub(r'TL;DR:.*?(?=\n\n|\Z)', '', story, flags=re.DOTALL | re.IGNORECASE)
-        story = re.sub(r'⸻+', '', story)
-        story = story.strip()
+        doc = StoryDocument.for_script(story)
 
         # Count words
-        words = story.split()
-        total_words = len(words)
+        total_words = doc.word_count
 
         logger.info(f"Story has {total_words} words")
 
+        hook = self.extract_hook(doc)
+        intro = self.create_engaging_intro(hook)
+
         # If story is short enough for one video
         if total_words <= self.max_words_per_video:
-            hook = self.extract_hook(story)
-            intro = self.create_engaging_intro(hook)
-
             # Remove the hook from the main story to avoid repetition
-            story_without_hook = story.replace(hook, "", 1).strip()
+            story_without_hook = doc.text.replace(hook, "", 1).strip()
 
             script = f"{intro}\n\n{story_without_hook}"
 
@@ -114,29 +119,27 @@ class ScriptGenerator:
                 'script': script,
                 'part_number': 1,
                 'total_parts': 1,
-                'word_count': len(script.split())
+                'word_count': StoryDocument(script).word_count
             }]
 
         # Split into multiple parts
-        paragraphs = [p.strip() for p in story.split('\n\n') if p.strip()]
+        paragraphs = doc.paragraphs()
+        paragraph_word_counts = doc.paragraph_word_counts()
         parts = []
         current_part = []
         current_word_count = 0
         part_num = 1
 
         # First part gets the hook
-        hook = self.extract_hook(story)
-        intro = self.create_engaging_intro(hook)
         current_part.append(intro)
         current_word_count += len(intro.split())
 
         # Remove hook from first paragraph if it's there
         if paragraphs and hook in paragraphs[0]:
             paragraphs[0] = paragraphs[0].replace(hook, "", 1).strip()
+            paragraph_word_counts[0] = len(paragraphs[0].split())
 
-        for para in paragraphs:
-            para_words = len(para.split())
-
+        for para, para_words in zip(paragraphs, paragraph_word_counts):
             # If adding this paragraph exceeds limit, save current part
             if current_word_count + para_words > self.max_words_per_video and current_part:
                 parts.append({
@@ -172,44 +175,132 @@ class ScriptGenerator:
 
         return parts
 
-    def generate_script(self, story: str, title: str = "", max_duration: int = 180) -> str:
-        """Generate an engaging script from a story.
+    def trim_to_duration(
+        self,
+        script: Union[str, StoryDocument],
+        max_duration: float,
+        voice: Optional[str] = None
+    ) -> StoryDocument:
+        """Trim a script at a sentence boundary so its voiceover fits max_duration.
 
         Args:
-            story: Full story text
-            title: Story title (won't be read)
-            max_duration: Maximum video duration in seconds (default 180s = 3 min)
+            script: Full script text or document
+            max_duration: Maximum voiceover duration in seconds
+            voice: TTS voice identifier used for the rate estimate
 
         Returns:
-            Engaging script ready for TTS with hook at start
+            Script document ending on the last whole sentence that fits
+        """
+        doc = StoryDocument.of(script)
+
+        if self.rate_model.predict_counts(doc.word_count, len(doc), voice) <= max_duration:
+            return doc
+
+        best_end = 0
+        for _, _, end in doc.sentence_spans:
+            words = doc.words_before(end)
+            if self.rate_model.predict_counts(words, end, voice) > max_duration:
+                break
+            best_end = end
+
+        if best_end:
+            trimmed = StoryDocument(doc.text[:best_end].rstrip())
+        else:
+            # Not even the first sentence fits - cut at a word boundary instead
+            max_words = int(max_duration / self.rate_model.seconds_per_word(voice))
+            trimmed = StoryDocument(doc.first_words(max_words))
+
+        logger.info(
+            f"Trimmed script from {doc.word_count} to {trimmed.word_count} words "
+            f"to fit {max_duration}s (estimated "
+            f"{self.rate_model.predict_counts(trimmed.word_count, len(trimmed), voice):.1f}s)"
+        )
+        return trimmed
+
+    def build_script(
+        self,
+        story: Union[str, StoryDocument],
+        max_duration: int = 180,
+        voice: Optional[str] = None
+    ) -> StoryDocument:
+        """Build an engaging script document from a story.
+
+        Args:
+            story: Full story text or document
+            max_duration: Maximum video duration in seconds
+            voice: TTS voice identifier used to estimate speaking rate
+
+        Returns:
+            Script document (word counts and sentences are cached on it)
         """
         # Remove TL;DR and metadata
-        story = re.sub(r'TL;DR:.*?(?=\n\n|\Z)', '', story, flags=re.DOTALL | re.IGNORECASE)
-        story = re.sub(r'⸻+', '', story)
-        story = story.strip()
+        doc = StoryDocument.for_script(story)
 
         # Extract hook for engaging opening
-        hook = self.extract_hook(story)
+        hook = self.extract_hook(doc)
         intro = self.create_engaging_intro(hook)
 
         # Remove the hook from the main story to avoid repetition
-        story_without_hook = story.replace(hook, "", 1).strip()
+        story_without_hook = doc.text.replace(hook, "", 1).strip()
 
         # Combine intro + story
-        full_script = f"{intro}\n\n{story_without_hook}"
+        full_script = StoryDocument(f"{intro}\n\n{story_without_hook}")
+
+        # Trim to fit max duration using the calibrated speaking rate for this voice
+        return self.trim_to_duration(full_script, max_duration, voice)
+
+    def generate_script(
+        self,
+        story: Union[str, StoryDocument],
+        title: str = "",
+        max_duration: int = 180,
+        voice: Optional[str] = None
+    ) -> str:
+        """Generate an engaging script from a story.
 
-        # If script is too long (estimate ~150 words per minute for TTS)
-        words = full_script.split()
-        estimated_duration = (len(words) / 150) * 60  # seconds
+        Args:
+            story: Full story text or document
+            title: Story title (won't be read)
+            max_duration: Maximum video duration in seconds (default 180s = 3 min)
+            voice: TTS voice identifier used to estimate speaking rate
 
-        if estimated_duration > max_duration:
-            # Trim to fit max duration
-            max_words = int((max_duration / 60) * 150)
-            words = words[:max_words]
-            full_script = ' '.join(words)
-            logger.info(f"Trimmed script from {len(full_script.split())} to {max_words} words to fit {max_duration}s")
+        Returns:
+            Engaging script ready for TTS with hook at start
+        """
+        return self.build_script(story, max_duration, voice).text
+
+    def generate_scripts_batch(
+        self,
+        stories: Iterable[Union[str, Dict]],
+        max_duration: int = 180,
+        voice: Optional[str] = None,
+        chunk_size: Optional[int] = None,
+        max_workers: Optional[int] = None
+    ) -> Iterator[str]:
+        """Generate scripts for many stories across a process pool.
 
-        return full_script
+        Args:
+            stories: Story texts, or story dictionaries with a 'body'
+            max_duration: Maximum video duration in seconds
+            voice: TTS voice identifier used to estimate speaking rate
+            chunk_size: Stories per worker task. If None, uses config value.
+            max_workers: Worker processes. If None, uses config value.
+
+        Yields:
+            Scripts in input order
+        """
+        bodies = (story["body"] if isinstance(story, dict) else story for story in stories)
+        func = partial(
+            _generate_script_chunk,
+            (self.max_words_per_video, self.rate_model, max_duration, voice)
+        )
+        return process_in_chunks(func, bodies, chunk_size, max_workers)
+
+def _generate_script_chunk(settings: tuple, bodies: List[str]) -> List[str]:
+    """Generate scripts for a chunk of story bodies (runs in worker processes)."""
+    max_words_per_video, rate_model, max_duration, voice = settings
+    generator = ScriptGenerator(max_words_per_video, rate_model)
+    return [generator.generate_script(body, max_duration=max_duration, voice=voice) for body in bodies]
 
 # CLI test
 if __name__ == "__main__":
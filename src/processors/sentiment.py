@@ -0,0 +1,375 @@
+"""Batch lexicon sentiment scoring (TextBlob-compatible polarity without TextBlob)."""
+
+import hashlib
+import importlib.util
+import re
+import threading
+import xml.etree.ElementTree as ElementTree
+from collections import OrderedDict
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence
+import numpy as np
+from src.utils.logger import get_logger
+from src.utils.config_loader import config
+
+logger = get_logger(__name__)
+
+# ============================================================================
+# TOKENIZER
+# Mirrors the find_tokens() tokenizer TextBlob's PatternAnalyzer uses, so
+# the scorer sees exactly the same tokens as TextBlob does.
+# ============================================================================
+
+PUNCTUATION = ".,;:!?()[]{}`''\"@#$^&*+-|=~_"
+_LEADING_PUNCTUATION = tuple(PUNCTUATION.replace(".", ""))
+_TRAILING_PUNCTUATION = _LEADING_PUNCTUATION + (".",)
+
+ABBREVIATIONS = {
+    "a.", "adj.", "adv.", "al.", "a.m.", "c.", "cf.", "comp.", "conf.", "def.",
+    "ed.", "e.g.", "esp.", "etc.", "ex.", "f.", "fig.", "gen.", "id.", "i.e.",
+    "int.", "l.", "m.", "Med.", "Mil.", "Mr.", "n.", "n.q.", "orig.", "pl.",
+    "pred.", "pres.", "p.m.", "ref.", "v.", "vs.", "w/"
+}
+_ABBREVIATION_RE = re.compile(r"^(?:[A-Za-z]\.|(?:[A-Za-z]\.)+|[A-Z][bcdfghjklmnpqrstvwxz|]+.)$")
+
+EMOTICONS = {
+    +1.00: ("<3", "♥", ">:D", ":-D", ":D", "=-D", "=D", "X-D", "x-D", "XD", "xD", "8-D"),
+    +0.75: (">:P", ":-P", ":P", ":-p", ":p", ":-b", ":b", ":c)", ":o)", ":^)"),
+    +0.50: (">:)", ":-)", ":)", "=)", "=]", ":]", ":}", ":>", ":3", "8)", "8-)"),
+    +0.25: (">;]", ";-)", ";)", ";-]", ";]", ";D", ";^)", "*-)", "*)"),
+    +0.05: (">:o", ":-O", ":O", ":o", ":-o", "o_O", "o.O", "°O°", "°o°"),
+    -0.25: (">:/", ":-/", ":/", ":\\", ">:\\", ":-.", ":-s", ":s", ":S", ":-S", ">.>"),
+    -0.75: (">:[", ":-(", ":(", "=(", ":-[", ":[", ":{", ":-<", ":c", ":-c", "=/"),
+    -1.00: (":'(", ":'''(", ";'("),
+}
+
+# Lowercased emoticon -> polarity (first match in the table above wins)
+_EMOTICON_POLARITY: Dict[str, float] = {}
+for _polarity, _faces in EMOTICONS.items():
+    for _face in _faces:
+        _EMOTICON_POLARITY.setdefault(_face.lower(), _polarity)
+
+# Punctuation splitting leaves emoticons as space-separated pieces; this joins them back
+_EMOTICON_RE = re.compile(r"(%s)($|\s)" % "|".join(
+    r" ?".join(re.escape(ch) for ch in face) for faces in EMOTICONS.values() for face in faces
+))
+_SARCASM_RE = re.compile(r"\( ?\! ?\)")
+_LINEBREAK_RE = re.compile(r"\n{2,}")
+
+EOS = "END-OF-SENTENCE"
+_SENTENCE_END_TOKENS = ("...", ".", "!", "?", EOS)
+_SENTENCE_TAIL_TOKENS = ("'", "\"", "”", "’", "...", ".", "!", "?", ")", EOS)
+
+NEGATIONS = ("no", "not", "n't", "never")
+
+def _split_punctuation(token: str, tokens: List[str]) -> None:
+    """Split leading/trailing punctuation off a whitespace token (appends to tokens)."""
+    tail = []
+    while token.startswith(_LEADING_PUNCTUATION):
+        tokens.append(token[0])
+        token = token[1:]
+    while token.endswith(_TRAILING_PUNCTUATION):
+        if token.endswith(_LEADING_PUNCTUATION):
+            tail.append(token[-1])
+            token = token[:-1]
+        if token.endswith("..."):
+            tail.append("...")
+            token = token[:-3].rstrip(".")
+        if token.endswith("."):
+            if token in ABBREVIATIONS or _ABBREVIATION_RE.match(token):
+                break
+            tail.append(token[-1])
+            token = token[:-1]
+    if token:
+        tokens.append(token)
+    tokens.extend(reversed(tail))
+
+def tokenize(text: str) -> List[str]:
+    """Tokenize text the way TextBlob's sentiment analyzer does (lowercased).
+
+    Args:
+        text: Raw text
+
+    Returns:
+        List of lowercased tokens
+    """
+    # Contractions and quotes: every apostrophe ends up as its own token
+    text = text.replace("n't", " n't")
+    text = (text.replace("“", " “ ").replace("”", " ” ").replace("‘", " ‘ ")
+            .replace("’", " ’ ").replace("'", " ' ").replace('"', ' " '))
+    text = text.replace("\r\n", "\n")
+    text = _LINEBREAK_RE.sub(" %s " % EOS, text)
+
+    tokens: List[str] = []
+    for token in text.split():
+        if token.startswith(_LEADING_PUNCTUATION) or token.endswith(_TRAILING_PUNCTUATION):
+            _split_punctuation(token, tokens)
+        else:
+            tokens.append(token)
+
+    # Sentence breaks: drop paragraph markers, rejoin sarcasm marks and emoticons per sentence
+    sentences = [[]]
+    i = j = 0
+    while j < len(tokens):
+        if tokens[j] in _SENTENCE_END_TOKENS:
+            while j < len(tokens) and tokens[j] in _SENTENCE_TAIL_TOKENS:
+                if tokens[j] in ("'", "\"") and sentences[-1].count(tokens[j]) % 2 == 0:
+                    break  # Balanced quotes
+                j += 1
+            sentences[-1].extend(t for t in tokens[i:j] if t != EOS)
+            sentences.append([])
+            i = j
+        j += 1
+    sentences[-1].extend(tokens[i:j])
+
+    words = []
+    for sentence in sentences:
+        if not sentence:
+            continue
+        joined = " ".join(sentence)
+        if "(" in joined:
+            joined = _SARCASM_RE.sub("(!)", joined)
+        joined = _EMOTICON_RE.sub(lambda m: m.group(1).replace(" ", "") + m.group(2), joined)
+        words.extend(joined.lower().split())
+    return words
+
+# ============================================================================
+# LEXICON
+# ============================================================================
+
+def _default_lexicon_path() -> Optional[Path]:
+    """Locate the sentiment lexicon bundled with TextBlob (without importing it)."""
+    spec = importlib.util.find_spec("textblob")
+    if spec is None or not spec.submodule_search_locations:
+        return None
+    return Path(list(spec.submodule_search_locations)[0]) / "en" / "en-sentiment.xml"
+
+class SentimentLexicon:
+    """Polarity lexicon loaded once into NumPy arrays indexed by token id.
+
+    Scores match TextBlob's pattern lexicon: senses are averaged per
+    part-of-speech tag, tags are averaged per word, and every adjective also
+    yields an "-ly" adverb with the same scores.
+    """
+
+    def __init__(self, path: Optional[Path] = None):
+        """Load lexicon from XML.
+
+        Args:
+            path: Path to en-sentiment.xml. If None, uses the copy bundled with TextBlob.
+        """
+        path = path or _default_lexicon_path()
+        if path is None or not Path(path).exists():
+            raise FileNotFoundError(
+                "Sentiment lexicon not found. Install textblob (pip install -r requirements.txt)."
+            )
+
+        words: Dict[str, Dict[Optional[str], list]] = {}
+        for node in ElementTree.parse(path).getroot().findall("word"):
+            form = node.attrib.get("form")
+            if not form:
+                continue
+            scores = (
+                float(node.attrib.get("polarity", 0.0)),
+                float(node.attrib.get("subjectivity", 0.0)),
+                float(node.attrib.get("intensity", 1.0)),
+            )
+            words.setdefault(form, {}).setdefault(node.attrib.get("pos"), []).append(scores)
+
+        lexicon: Dict[str, Dict[Optional[str], tuple]] = {}
+        for form, tags in words.items():
+            averaged = {pos: tuple(sum(v) / len(v) for v in zip(*senses)) for pos, senses in tags.items()}
+            averaged[None] = tuple(sum(v) / len(v) for v in zip(*averaged.values()))
+            lexicon[form] = averaged
+
+        # Map "terrible" to adverb "terribly" (TextBlob does the same)
+        for form, tags in list(lexicon.items()):
+            if "JJ" in tags:
+                adverb = form[:-1] + "i" if form.endswith("y") else form
+                if adverb.endswith("le"):
+                    adverb = adverb[:-2]
+                entry = lexicon.setdefault(adverb + "ly", {})
+                entry["RB"] = entry[None] = tags["JJ"]
+
+        # Token vocabulary: lexicon words plus words the scorer treats specially
+        vocabulary = list(lexicon)
+        extra = [w for w in NEGATIONS if w not in lexicon]
+        self.vocabulary: Dict[str, int] = {w: i for i, w in enumerate(vocabulary + extra)}
+        self.oov_id = len(self.vocabulary)  # Shared id for all unknown tokens
+
+        size = self.oov_id + 1
+        self.known = np.zeros(size, dtype=bool)
+        self.polarity = np.zeros(size, dtype=np.float64)
+        self.intensity = np.ones(size, dtype=np.float64)
+        self.is_modifier = np.zeros(size, dtype=bool)
+        self.is_negation = np.zeros(size, dtype=bool)
+        self.ends_with_ly = np.zeros(size, dtype=bool)
+
+        for form, index in self.vocabulary.items():
+            tags = lexicon.get(form)
+            if tags:
+                self.known[index] = True
+                self.polarity[index] = tags[None][0]
+                self.intensity[index] = tags[None][2]
+                self.is_modifier[index] = "RB" in tags
+            self.is_negation[index] = form in NEGATIONS
+            self.ends_with_ly[index] = form.endswith("ly")
+
+        logger.info(f"Loaded sentiment lexicon ({len(lexicon)} words)")
+
+    def ids(self, tokens: List[str]) -> List[int]:
+        """Map tokens to vocabulary ids (unknown tokens get oov_id)."""
+        get = self.vocabulary.get
+        oov = self.oov_id
+        return [get(token, oov) for token in tokens]
+
+_lexicon: Optional[SentimentLexicon] = None
+_lexicon_lock = threading.Lock()
+
+def get_lexicon() -> SentimentLexicon:
+    """Get the shared lexicon (loaded on first use)."""
+    global _lexicon
+    with _lexicon_lock:
+        if _lexicon is None:
+            _lexicon = SentimentLexicon()
+    return _lexicon
+
+# ============================================================================
+# SCORER
+# ============================================================================
+
+def _clip(value: float) -> float:
+    return max(-1.0, min(value, 1.0))
+
+class SentimentScorer:
+    """Score sentiment polarity for batches of texts.
+
+    Uses the same tokens and assessment rules as TextBlob's PatternAnalyzer
+    (modifiers, negations, exclamation marks, emoticons), so scores match
+    ``TextBlob(text).sentiment.polarity``. The lexicon is loaded once into
+    NumPy arrays and results are cached by a hash of the text.
+    """
+
+    def __init__(self, cache_size: Optional[int] = None):
+        """Initialize sentiment scorer.
+
+        Args:
+            cache_size: Maximum cached results. If None, uses config value.
+        """
+        self.cache_size = cache_size if cache_size is not None else config.get("sentiment.cache_size", 10000)
+        self._cache: "OrderedDict[bytes, float]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    @property
+    def lexicon(self) -> SentimentLexicon:
+        return get_lexicon()
+
+    @staticmethod
+    def _key(text: str) -> bytes:
+        return hashlib.blake2b(text.encode("utf-8", "surrogatepass"), digest_size=16).digest()
+
+    def score(self, text: str) -> float:
+        """Score a single text.
+
+        Args:
+            text: Text to score
+
+        Returns:
+            Polarity (-1 to 1)
+        """
+        return self.score_batch([text])[0]
+
+    def score_batch(self, texts: Sequence[str]) -> List[float]:
+        """Score a batch of texts.
+
+        Args:
+            texts: Texts to score
+
+        Returns:
+            Polarity per text (-1 to 1), in input order
+        """
+        keys = [self._key(text) for text in texts]
+        scores: List[Optional[float]] = [None] * len(texts)
+        missing = []
+
+        with self._lock:
+            for index, key in enumerate(keys):
+                cached = self._cache.get(key)
+                if cached is not None:
+                    self._cache.move_to_end(key)
+                    scores[index] = cached
+                else:
+                    missing.append(index)
+
+        if missing:
+            computed = [self._score_text(texts[i]) for i in missing]
+
+            with self._lock:
+                for index, value in zip(missing, computed):
+                    scores[index] = value
+                    self._cache[keys[index]] = value
+                while len(self._cache) > self.cache_size:
+                    self._cache.popitem(last=False)
+
+        return scores
+
+    def _score_text(self, text: str) -> float:
+        """Score one text with TextBlob's assessment rules."""
+        lexicon = self.lexicon
+        tokens = tokenize(text)
+        ids = lexicon.ids(tokens)
+
+        known = lexicon.known
+        polarity = lexicon.polarity
+        intensity = lexicon.intensity
+        is_modifier = lexicon.is_modifier
+        is_negation = lexicon.is_negation
+        ends_with_ly = lexicon.ends_with_ly
+
+        # Each assessment is [polarity, intensity, negated]
+        assessments = []
+        modifier = None  # id of preceding modifier ("really good")
+        negation = False  # preceding negation ("not good")
+
+        for token, token_id in zip(tokens, ids):
+            if known[token_id]:
+                p = float(polarity[token_id])
+                i = float(intensity[token_id])
+                if modifier is None:
+                    assessments.append([p, i, False])
+                else:
+                    last = assessments[-1]
+                    last[0] = _clip(p * last[1])
+                    last[1] = i
+                if negation:
+                    last = assessments[-1]
+                    last[1] = 1.0 / last[1]
+                    last[2] = True
+                modifier = token_id if is_modifier[token_id] else None
+                negation = bool(is_negation[token_id])
+            else:
+                if is_negation[token_id]:
+                    negation = True
+                elif negation and len(token.strip("'")) > 1:
+                    negation = False
+                # Negation preceded by a modifier ("really not good")
+                if negation and modifier is not None and ends_with_ly[modifier]:
+                    assessments[-1][2] = True
+                    negation = False
+                elif modifier is not None and len(token) > 2:
+                    modifier = None
+                if token == "!" and assessments:
+                    assessments[-1][0] = _clip(assessments[-1][0] * 1.25)
+                if token == "(!)":
+                    assessments.append([0.0, 1.0, False])
+                if len(token) <= 5 and not token.isalpha() and token not in PUNCTUATION:
+                    face = _EMOTICON_POLARITY.get(token)
+                    if face is not None:
+                        assessments.append([face, 1.0, False])
+
+        if not assessments:
+            return 0.0
+        total = sum(p * -0.5 if negated else p for p, _, negated in assessments)
+        return total / len(assessments)
+
+__all__ = ["SentimentScorer", "SentimentLexicon", "get_lexicon", "tokenize"]
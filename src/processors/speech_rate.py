@@ -0,0 +1,266 @@
+"""Speaking-rate calibration for estimating voiceover duration before TTS."""
+
+import json
+import threading
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+from src.utils.logger import get_logger
+from src.utils.config_loader import config
+
+logger = get_logger(__name__)
+
+DEFAULT_WORDS_PER_MINUTE = 150
+
+# Characters are scaled down so both features have similar magnitudes
+CHARS_SCALE = 100.0
+
+# Small ridge penalty keeps the fit stable (words and chars are highly correlated)
+RIDGE = 1e-3
+
+def count_words_and_chars(text: str) -> Tuple[int, int]:
+    """Count words and characters the same way for recording and prediction.
+
+    Args:
+        text: Script text
+
+    Returns:
+        Tuple of (word count, character count)
+    """
+    return len(text.split()), len(text)
+
+def _solve_3x3(matrix: List[List[float]], vector: List[float]) -> Optional[List[float]]:
+    """Solve a 3x3 linear system with partial pivoting.
+
+    Args:
+        matrix: 3x3 coefficient matrix
+        vector: Right-hand side
+
+    Returns:
+        Solution vector or None if the system is singular
+    """
+    a = [row[:] + [vector[i]] for i, row in enumerate(matrix)]
+
+    for col in range(3):
+        pivot = max(range(col, 3), key=lambda r: abs(a[r][col]))
+        if abs(a[pivot][col]) < 1e-12:
+            return None
+        a[col], a[pivot] = a[pivot], a[col]
+
+        for r in range(col + 1, 3):
+            factor = a[r][col] / a[col][col]
+            for c in range(col, 4):
+                a[r][c] -= factor * a[col][c]
+
+    solution = [0.0, 0.0, 0.0]
+    for r in (2, 1, 0):
+        total = a[r][3] - sum(a[r][c] * solution[c] for c in range(r + 1, 3))
+        solution[r] = total / a[r][r]
+
+    return solution
+
+class SpeechRateModel:
+    """Per-voice speaking-rate model fitted from recorded TTS durations.
+
+    Every generated voiceover is recorded as (words, characters, duration)
+    for the voice that produced it. Once a voice has enough samples, duration
+    is predicted with a least-squares fit of ``a*words + b*chars + c``. Voices
+    with fewer samples use their observed seconds-per-word ratio, and unknown
+    voices fall back to the configured words-per-minute estimate.
+    """
+
+    def __init__(
+        self,
+        store_path: Optional[str] = None,
+        default_wpm: Optional[float] = None,
+        min_samples: Optional[int] = None,
+        max_samples_per_voice: int = 200
+    ):
+        """Initialize speech rate model.
+
+        Args:
+            store_path: Path to calibration JSON file. If None, uses config value.
+            default_wpm: Words per minute for uncalibrated voices
+            min_samples: Samples required before fitting the full linear model
+            max_samples_per_voice: Keep only the most recent N samples per voice
+        """
+        if store_path is None:
+            store_path = config.get("tts.calibration_file", "data/tts_calibration.json")
+            store_path = Path(__file__).parent.parent.parent / store_path
+
+        self.store_path = Path(store_path)
+        self.default_wpm = default_wpm or config.get(
+            "tts.default_words_per_minute", DEFAULT_WORDS_PER_MINUTE
+        )
+        self.min_samples = min_samples or config.get("tts.calibration_min_samples", 5)
+        self.max_samples_per_voice = max_samples_per_voice
+
+        self._lock = threading.Lock()
+        self.samples: Dict[str, List[List[float]]] = self._load()
+        self._fits: Dict[str, Optional[List[float]]] = {}
+
+    def __getstate__(self) -> Dict:
+        """Drop the lock when pickling (models are sent to batch worker processes)."""
+        state = self.__dict__.copy()
+        del state["_lock"]
+        return state
+
+    def __setstate__(self, state: Dict) -> None:
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+    # ========================================================================
+    # CALIBRATION STORE
+    # ========================================================================
+
+    def _load(self) -> Dict[str, List[List[float]]]:
+        """Load recorded samples from disk."""
+        if not self.store_path.exists():
+            return {}
+
+        try:
+            with open(self.store_path, 'r') as f:
+                data = json.load(f)
+            return {voice: list(samples) for voice, samples in data.get("voices", {}).items()}
+        except (OSError, ValueError) as e:
+            logger.warning(f"Failed to load TTS calibration from {self.store_path}: {e}")
+            return {}
+
+    def _save(self) -> None:
+        """Write recorded samples to disk atomically."""
+        try:
+            self.store_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.store_path.with_suffix(".tmp")
+            with open(tmp_path, 'w') as f:
+                json.dump({"voices": self.samples}, f)
+            tmp_path.replace(self.store_path)
+        except OSError as e:
+            logger.warning(f"Failed to save TTS calibration: {e}")
+
+    def record(self, voice: str, text: str, duration: float) -> None:
+        """Record an actual TTS duration for a voice.
+
+        Args:
+            voice: Voice identifier (e.g. 'gtts:en', 'en-US-AriaNeural')
+            text: Text that was spoken
+            duration: Measured audio duration in seconds
+        """
+        words, chars = count_words_and_chars(text)
+        self.record_counts(voice, words, chars, duration)
+
+    def record_counts(self, voice: str, words: int, chars: int, duration: float) -> None:
+        """Record an actual TTS duration from precomputed word and character counts.
+
+        Args:
+            voice: Voice identifier
+            words: Word count of the spoken text
+            chars: Character count of the spoken text
+            duration: Measured audio duration in seconds
+        """
+        if words == 0 or duration <= 0:
+            return
+
+        with self._lock:
+            samples = self.samples.setdefault(voice, [])
+            samples.append([words, chars, round(duration, 3)])
+            del samples[:-self.max_samples_per_voice]
+            self._fits.pop(voice, None)
+            self._save()
+
+        logger.debug(
+            f"Recorded TTS calibration for {voice}: {words} words, {chars} chars, {duration:.1f}s"
+        )
+
+    # ========================================================================
+    # MODEL
+    # ========================================================================
+
+    def _fit(self, voice: str) -> Optional[List[float]]:
+        """Fit duration = a*words + b*(chars/100) + c for a voice.
+
+        Returns:
+            Coefficients [a, b, c] or None if there are too few samples
+        """
+        if voice in self._fits:
+            return self._fits[voice]
+
+        samples = self.samples.get(voice, [])
+        coefficients = None
+
+        if len(samples) >= self.min_samples:
+            # Normal equations X^T X beta = X^T y with a ridge on the slopes
+            xtx = [[0.0] * 3 for _ in range(3)]
+            xty = [0.0] * 3
+            for words, chars, duration in samples:
+                row = (words, chars / CHARS_SCALE, 1.0)
+                for i in range(3):
+                    xty[i] += row[i] * duration
+                    for j in range(3):
+                        xtx[i][j] += row[i] * row[j]
+            xtx[0][0] += RIDGE * len(samples)
+            xtx[1][1] += RIDGE * len(samples)
+
+            coefficients = _solve_3x3(xtx, xty)
+
+            # A negative slope means the samples don't describe speech; ignore the fit
+            if coefficients and (coefficients[0] < 0 or coefficients[1] < 0):
+                coefficients = None
+
+        self._fits[voice] = coefficients
+        return coefficients
+
+    def seconds_per_word(self, voice: Optional[str] = None) -> float:
+        """Average seconds per word for a voice (ratio estimate).
+
+        Args:
+            voice: Voice identifier. If None or uncalibrated, uses the default rate.
+
+        Returns:
+            Seconds per word
+        """
+        samples = self.samples.get(voice, []) if voice else []
+        total_words = sum(s[0] for s in samples)
+        if total_words:
+            return sum(s[2] for s in samples) / total_words
+        return 60.0 / self.default_wpm
+
+    def predict_counts(self, words: int, chars: int, voice: Optional[str] = None) -> float:
+        """Predict duration from word and character counts.
+
+        Args:
+            words: Word count
+            chars: Character count
+            voice: Voice identifier
+
+        Returns:
+            Estimated duration in seconds
+        """
+        coefficients = self._fit(voice) if voice else None
+        if coefficients:
+            a, b, c = coefficients
+            return max(0.0, a * words + b * (chars / CHARS_SCALE) + c)
+        return words * self.seconds_per_word(voice)
+
+    def predict(self, text: str, voice: Optional[str] = None) -> float:
+        """Predict voiceover duration for text.
+
+        Args:
+            text: Script text
+            voice: Voice identifier
+
+        Returns:
+            Estimated duration in seconds
+        """
+        words, chars = count_words_and_chars(text)
+        return self.predict_counts(words, chars, voice)
+
+# Shared model instance (loaded lazily so importing this module stays cheap)
+_model: Optional[SpeechRateModel] = None
+
+def get_speech_rate_model() -> SpeechRateModel:
+    """Get the shared speech rate model."""
+    global _model
+    if _model is None:
+        _model = SpeechRateModel()
+    return _model
+
+__all__ = ["SpeechRateModel", "get_speech_rate_model", "count_words_and_chars", "DEFAULT_WORDS_PER_MINUTE"]
@@ -0,0 +1,195 @@
+"""Parse-once document model shared by the cleaner, script generator and enhancer."""
+
+import re
+from bisect import bisect_left
+from functools import cached_property
+from typing import List, Tuple, Union
+
+# Words are runs of non-whitespace (same as str.split())
+WORD_RE = re.compile(r'\S+')
+
+# Sentence end: terminal punctuation followed by whitespace or end of text
+SENTENCE_END_RE = re.compile(r'[.!?]+(?=\s|$)')
+
+# Metadata stripped before turning a story into a script
+TLDR_RE = re.compile(r'TL;DR:.*?(?=\n\n|\Z)', re.DOTALL | re.IGNORECASE)
+SEPARATOR_RE = re.compile(r'⸻+')
+
+PARAGRAPH_SEPARATOR = '\n\n'
+
+class StoryDocument:
+    """Story text tokenized once into paragraph, sentence and word offsets.
+
+    Offsets are computed lazily on first use and cached, so a document that is
+    passed between stages is only scanned once no matter how many word counts,
+    sentences or paragraphs are requested. Spans are (start, end) character
+    offsets into ``text``.
+    """
+
+    def __init__(self, text: str):
+        """Initialize document.
+
+        Args:
+            text: Story or script text
+        """
+        self.text = text
+
+    @classmethod
+    def for_script(cls, story: Union[str, "StoryDocument"]) -> "StoryDocument":
+        """Create a document with TL;DR and separator metadata removed.
+
+        Args:
+            story: Raw story text or document
+
+        Returns:
+            Stripped story document
+        """
+        text = story.text if isinstance(story, StoryDocument) else story
+        text = TLDR_RE.sub('', text)
+        if '⸻' in text:
+            text = SEPARATOR_RE.sub('', text)
+        return cls(text.strip())
+
+    @staticmethod
+    def of(text: Union[str, "StoryDocument"]) -> "StoryDocument":
+        """Return text as a document, reusing it if it already is one."""
+        return text if isinstance(text, StoryDocument) else StoryDocument(text)
+
+    def __str__(self) -> str:
+        return self.text
+
+    def __len__(self) -> int:
+        return len(self.text)
+
+    # ========================================================================
+    # WORDS
+    # ========================================================================
+
+    @cached_property
+    def _word_offsets(self) -> Tuple[List[int], List[int]]:
+        """Start and end offsets of every word, found in one scan."""
+        starts = []
+        ends = []
+        for match in WORD_RE.finditer(self.text):
+            starts.append(match.start())
+            ends.append(match.end())
+        return starts, ends
+
+    @property
+    def word_starts(self) -> List[int]:
+        """Start offset of every word."""
+        return self._word_offsets[0]
+
+    @property
+    def word_ends(self) -> List[int]:
+        """End offset of every word."""
+        return self._word_offsets[1]
+
+    @cached_property
+    def word_count(self) -> int:
+        """Number of words (equal to len(text.split()))."""
+        return len(self.word_starts)
+
+    def words_before(self, offset: int) -> int:
+        """Number of words starting before a character offset."""
+        return bisect_left(self.word_starts, offset)
+
+    def words_between(self, start: int, end: int) -> int:
+        """Number of words starting within [start, end)."""
+        return self.words_before(end) - self.words_before(start)
+
+    def first_words(self, count: int) -> str:
+        """First N words joined by single spaces."""
+        return ' '.join(self.text[s:e] for s, e in zip(self.word_starts[:count], self.word_ends[:count]))
+
+    # ========================================================================
+    # SENTENCES
+    # ========================================================================
+
+    @cached_property
+    def sentence_spans(self) -> List[Tuple[int, int, int]]:
+        """Sentences as (start, body_end, end) offsets.
+
+        ``body_end`` excludes the terminal punctuation, ``end`` includes it.
+        Text after the last terminal punctuation is a final sentence with
+        ``body_end == end``.
+        """
+        spans = []
+        text = self.text
+        start = 0
+        length = len(text)
+
+        for match in SENTENCE_END_RE.finditer(text):
+            spans.append((start, match.start(), match.end()))
+            start = match.end()
+            while start < length and text[start].isspace():
+                start += 1
+
+        if start < length:
+            spans.append((start, length, length))
+
+        return spans
+
+    @cached_property
+    def sentence_count(self) -> int:
+        """Number of sentences."""
+        return len(self.sentence_spans)
+
+    def sentences(self) -> List[str]:
+        """Sentence texts including terminal punctuation."""
+        return [self.text[start:end] for start, _, end in self.sentence_spans]
+
+    def first_sentence(self) -> str:
+        """First sentence without its terminal punctuation.
+
+        Matches ``re.split(r'[.!?]+\\s+', text)[0]``: punctuation at the very
+        end of the text is not a split point, so it is kept.
+        """
+        if not self.sentence_spans:
+            return self.text.strip()
+
+        start, body_end, end = self.sentence_spans[0]
+        if end == len(self.text):
+            return self.text.strip()
+        return self.text[start:body_end].strip()
+
+    # ========================================================================
+    # PARAGRAPHS
+    # ========================================================================
+
+    @cached_property
+    def paragraph_spans(self) -> List[Tuple[int, int]]:
+        """Non-empty paragraphs (split on blank lines, whitespace trimmed)."""
+        spans = []
+        text = self.text
+        position = 0
+        length = len(text)
+
+        while position <= length:
+            separator = text.find(PARAGRAPH_SEPARATOR, position)
+            end = length if separator == -1 else separator
+
+            start = position
+            while start < end and text[start].isspace():
+                start += 1
+            stop = end
+            while stop > start and text[stop - 1].isspace():
+                stop -= 1
+            if stop > start:
+                spans.append((start, stop))
+
+            if separator == -1:
+                break
+            position = separator + len(PARAGRAPH_SEPARATOR)
+
+        return spans
+
+    def paragraphs(self) -> List[str]:
+        """Paragraph texts."""
+        return [self.text[start:end] for start, end in self.paragraph_spans]
+
+    def paragraph_word_counts(self) -> List[int]:
+        """Word count of each paragraph."""
+        return [self.words_between(start, end) for start, end in self.paragraph_spans]
+
+__all__ = ["StoryDocument", "SENTENCE_END_RE", "TLDR_RE"]
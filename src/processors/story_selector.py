@@ -1,34 +1,110 @@
 """Story selection logic for choosing best stories to convert to videos."""
 
+import os
+import socket
 from typing import List, Dict, Optional
-from src.database.supabase_client import db
+from src.database.repository import db
+from src.database.write_behind import status_writer
 from src.utils.logger import get_logger
 from src.utils.config_loader import config
-from src.processors.text_cleaner import clean_story_for_video
+from src.processors.text_cleaner import clean_story_for_video, clean_stories_batch
+from src.processors.dedup import DedupIndex
 
 logger = get_logger(__name__)
 
 class StorySelector:
     """Select and process top stories for video creation."""
 
-    def __init__(self):
-        """Initialize story selector."""
+    def __init__(self, worker_id: Optional[str] = None):
+        """Initialize story selector.
+
+        Args:
+            worker_id: Identifies this worker's story claims. If None, uses
+                config value, or host:pid when unset.
+        """
         self.max_words = config.get("reddit.max_words", 1500)
-        logger.info("Story selector initialized")
+        self.worker_id = worker_id or config.get("processing.worker_id") or f"{socket.gethostname()}:{os.getpid()}"
+        self.lease_seconds = int(config.get("processing.claim_lease_minutes", 60) * 60)
+        logger.info(f"Story selector initialized (worker: {self.worker_id})")
 
-    def get_unprocessed_stories(self, limit: int = 100) -> List[Dict]:
+    def get_unprocessed_stories(self, limit: int = 100, columns: str = "*") -> List[Dict]:
         """Get stories that haven't been processed yet.
 
         Args:
             limit: Maximum number of stories to fetch
+            columns: Columns to fetch (e.g. "id, title, virality_score" to skip bodies)
 
         Returns:
             List of story dictionaries sorted by virality score
         """
-        stories = db.get_stories_by_status("scraped", limit=limit)
+        # Queued status updates must land first, or processed stories reappear
+        status_writer.flush()
+        stories = db.get_stories_by_status("scraped", limit=limit, columns=columns)
         logger.info(f"Found {len(stories)} unprocessed stories")
         return stories
 
+    def skip_duplicates(self, stories: List[Dict], count: int, index: Optional[DedupIndex] = None) -> List[Dict]:
+        """Take the first N stories that aren't near-duplicates of each other.
+
+        Duplicates of a higher-ranked candidate are rejected in the database so
+        they never reach enhancement, TTS or rendering.
+
+        Args:
+            stories: Candidate stories in priority order
+            count: Number of stories wanted
+            index: Stories already chosen (updated in place). If None, starts empty.
+
+        Returns:
+            Up to count distinct stories
+        """
+        if index is None:
+            index = DedupIndex()
+        selected = []
+
+        for story in stories:
+            signature = index.hasher.decode(story.get("minhash"))
+            if signature is None:
+                signature = index.hasher.signature(story["body"])
+
+            match = index.query(signature)
+            if match:
+                db.mark_story_duplicate(story["id"], match[0])
+                continue
+
+            index.add(story["id"], signature)
+            selected.append(story)
+            if len(selected) >= count:
+                break
+
+        return selected
+
+    def claim_top_stories(self, count: int) -> List[Dict]:
+        """Claim the top N distinct stories for this worker.
+
+        Stories are claimed atomically (marked 'selected' under a lease), so
+        concurrent workers never pick the same ones. Claimed near-duplicates
+        are rejected and replaced by further claims.
+
+        Args:
+            count: Number of stories wanted
+
+        Returns:
+            Up to count claimed stories, highest virality first
+        """
+        # Land queued 'processed' updates first, so stories past their lease aren't reclaimed
+        status_writer.flush()
+
+        index = DedupIndex()
+        claimed = []
+
+        while len(claimed) < count:
+            batch = db.claim_stories(self.worker_id, count - len(claimed), self.lease_seconds)
+            if not batch:
+                break
+            claimed.extend(self.skip_duplicates(batch, count - len(claimed), index))
+
+        return claimed
+
     def select_top_stories(self, count: int = 5) -> List[Dict]:
         """Select top N stories by virality score.
 
@@ -38,33 +114,23 @@ class StorySelector:
         Returns:
             List of selected story dictionaries with cleaned text
         """
-        # Get all scraped stories
-        stories = self.get_unprocessed_stories()
+        top_stories = self.claim_top_stories(count)
 
-        if not stories:
+        if not top_stories:
             logger.warning("No stories available for selection")
             return []
 
-        # Already sorted by virality_score (DESC) from database
-        top_stories = stories[:count]
-
         logger.info(f"Selected top {len(top_stories)} stories")
 
-        # Clean and prepare each story
+        # Clean and prepare each story (batched across worker processes for large counts)
         processed_stories = []
-        for story in top_stories:
-            # Clean text for TTS
-            cleaned = clean_story_for_video(story["title"], story["body"])
-
+        for story, cleaned in zip(top_stories, clean_stories_batch(top_stories)):
             # Add cleaned data to story
             story["cleaned_title"] = cleaned["title"]
             story["cleaned_body"] = cleaned["body"]
             story["full_text"] = cleaned["full_text"]
             story["word_count"] = cleaned["word_count"]
 
-            # Update status to 'selected'
-            db.update_story_status(story["id"], "selected")
-
             processed_stories.append(story)
 
             logger.info(
@@ -85,13 +151,11 @@ class StorySelector:
             Story dictionary with cleaned text or None
         """
         try:
-            result = db.client.table("stories").select("*").eq("id", story_id).execute()
-            if not result.data:
+            story = db.get_story(story_id)
+            if story is None:
                 logger.warning(f"Story {story_id} not found")
                 return None
 
-            story = result.data[0]
-
             # Clean text
             cleaned = clean_story_for_video(story["title"], story["body"])
             story["cleaned_title"] = cleaned["title"]
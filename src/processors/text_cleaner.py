@@ -1,11 +1,147 @@
 """Text cleaning utilities for preparing Reddit stories for TTS."""
 
 import re
-from typing import Dict
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
 from src.utils.logger import get_logger
+from src.utils.batching import process_in_chunks
+from src.processors.story_document import StoryDocument
 
 logger = get_logger(__name__)
 
+# ============================================================================
+# COMPILED CLEANING ENGINE
+# Patterns are compiled once at import. Passes that are independent of each
+# other are fused into a single regex so each call scans the text a handful
+# of times instead of ~60.
+# ============================================================================
+
+# Markdown passes (order matters: later passes see the output of earlier ones)
+_MARKDOWN_PASSES = [
+    ('**', re.compile(r'\*\*(.+?)\*\*'), r'\1'),  # Bold (**text**)
+    ('*', re.compile(r'\*(.+?)\*'), r'\1'),  # Italic (*text*)
+    ('~~', re.compile(r'~~(.+?)~~'), r'\1'),  # Strikethrough (~~text~~)
+    ('`', re.compile(r'`(.+?)`'), r'\1'),  # Inline code (`code`)
+    ('](', re.compile(r'\[(.+?)\]\(.+?\)'), r'\1'),  # Links [text](url)
+    ('>', re.compile(r'>\s?.+'), ''),  # Quotes (> text)
+    ('#', re.compile(r'#+\s+'), ''),  # Headers (# Header)
+]
+
+# Common contractions, expanded in this order
+CONTRACTIONS = {
+    "don't": "do not",
+    "can't": "cannot",
+    "won't": "will not",
+    "it's": "it is",
+    "i'm": "i am",
+    "you're": "you are",
+    "he's": "he is",
+    "she's": "she is",
+    "we're": "we are",
+    "they're": "they are",
+    "i've": "i have",
+    "you've": "you have",
+    "we've": "we have",
+    "they've": "they have",
+    "i'd": "i would",
+    "you'd": "you would",
+    "he'd": "he would",
+    "she'd": "she would",
+    "we'd": "we would",
+    "they'd": "they would",
+    "i'll": "i will",
+    "you'll": "you will",
+    "he'll": "he will",
+    "she'll": "she will",
+    "we'll": "we will",
+    "they'll": "they will",
+    "isn't": "is not",
+    "aren't": "are not",
+    "wasn't": "was not",
+    "weren't": "were not",
+    "hasn't": "has not",
+    "haven't": "have not",
+    "hadn't": "had not",
+    "doesn't": "does not",
+    "didn't": "did not",
+    "couldn't": "could not",
+    "shouldn't": "should not",
+    "wouldn't": "would not",
+    "mightn't": "might not",
+    "mustn't": "must not",
+}
+
+def _build_contraction_regex() -> "re.Pattern":
+    """Build one alternation regex for all contractions.
+
+    A contraction that contains an earlier one (e.g. "she's" contains "he's")
+    is left out: expanding the inner one already gives the same result, which
+    keeps the single pass identical to expanding each contraction in order.
+    """
+    keys = []
+    for key in CONTRACTIONS:
+        if not any(earlier in key for earlier in keys):
+            keys.append(key)
+
+    # Longest first so alternatives starting at the same position prefer the full match
+    keys.sort(key=len, reverse=True)
+    return re.compile('|'.join(re.escape(k) for k in keys), re.IGNORECASE)
+
+_CONTRACTION_RE = _build_contraction_regex()
+
+# Per-contraction patterns, only used when two contractions could overlap
+_CONTRACTION_PASSES = [
+    (re.compile(re.escape(contraction), re.IGNORECASE), expansion)
+    for contraction, expansion in CONTRACTIONS.items()
+]
+
+# Two apostrophes in one run of non-space characters (e.g. "I'don't") is the
+# only way contraction matches can overlap; such text takes the ordered passes
+_OVERLAP_RE = re.compile(r"'[^\s']*'")
+
+# Paragraph breaks become pauses, then URLs are removed. A URL directly before
+# a paragraph break also swallows the inserted period, like the separate passes did.
+_BREAK_URL_RE = re.compile(r'(?:http|www\.)\S*(\n\n+)|http\S+|www\.\S+|\n\n+')
+
+# Whitespace runs, repeated punctuation and characters TTS struggles with
+_WHITESPACE_PUNCT_RE = re.compile(r"(\s+)|([.!?])\2+|[^\w\s.,!?;'-]+")
+
+def _lookup_expansion(original: str) -> str:
+    """Find the expansion for a matched contraction."""
+    expansion = CONTRACTIONS.get(original.lower())
+    if expansion is None:
+        # Unicode case folding (e.g. long s) can match without lowering to the key
+        for pattern, candidate in _CONTRACTION_PASSES:
+            if pattern.fullmatch(original):
+                return candidate
+    return expansion
+
+def _expand_contraction(match: "re.Match") -> str:
+    """Expand a contraction (lowercase, like the original per-word passes)."""
+    return _lookup_expansion(match.group(0))
+
+def _expand_contraction_preserving_case(match: "re.Match") -> str:
+    """Expand a contraction keeping the case of the original word."""
+    original = match.group(0)
+    expansion = _lookup_expansion(original)
+    if original.isupper():
+        return expansion.upper()
+    if original[0].isupper():
+        return expansion[0].upper() + expansion[1:]
+    return expansion
+
+def _replace_break_or_url(match: "re.Match") -> str:
+    """Paragraph breaks become '. ', URLs are removed."""
+    if match.group(0).startswith('\n'):
+        return '. '
+    # URL followed by a break: the break's period would have been part of the URL
+    return ' ' if match.group(1) else ''
+
+def _replace_whitespace_punct(match: "re.Match") -> str:
+    """Collapse whitespace and repeated punctuation, drop unsupported characters."""
+    if match.group(1):
+        return ' '
+    return match.group(2) or ''
+
 def clean_reddit_markdown(text: str) -> str:
     """Remove Reddit markdown formatting.
 
@@ -15,105 +151,38 @@ def clean_reddit_markdown(text: str) -> str:
     Returns:
         Cleaned text without markdown
     """
-    # Remove bold (**text**)
-    text = re.sub(r'\*\*(.+?)\*\*', r'\1', text)
-
-    # Remove italic (*text*)
-    text = re.sub(r'\*(.+?)\*', r'\1', text)
-
-    # Remove strikethrough (~~text~~)
-    text = re.sub(r'~~(.+?)~~', r'\1', text)
-
-    # Remove inline code (`code`)
-    text = re.sub(r'`(.+?)`', r'\1', text)
-
-    # Remove links [text](url)
-    text = re.sub(r'\[(.+?)\]\(.+?\)', r'\1', text)
-
-    # Remove quotes (> text)
-    text = re.sub(r'>\s?.+', '', text)
-
-    # Remove headers (# Header)
-    text = re.sub(r'#+\s+', '', text)
+    for marker, pattern, replacement in _MARKDOWN_PASSES:
+        # Most stories have little or no markdown, so skip passes that can't match
+        if marker in text:
+            text = pattern.sub(replacement, text)
 
     return text
 
-def fix_formatting_for_tts(text: str) -> str:
+def fix_formatting_for_tts(text: str, preserve_case: bool = False) -> str:
     """Fix text formatting for better TTS pronunciation.
 
     Args:
         text: Cleaned text
+        preserve_case: Keep the capitalization of expanded contractions
+            ("Don't" -> "Do not") instead of lowercasing them
 
     Returns:
         TTS-optimized text
     """
     # Expand common contractions
-    contractions = {
-        "don't": "do not",
-        "can't": "cannot",
-        "won't": "will not",
-        "it's": "it is",
-        "i'm": "i am",
-        "you're": "you are",
-        "he's": "he is",
-        "she's": "she is",
-        "we're": "we are",
-        "they're": "they are",
-        "i've": "i have",
-        "you've": "you have",
-        "we've": "we have",
-        "they've": "they have",
-        "i'd": "i would",
-        "you'd": "you would",
-        "he'd": "he would",
-        "she'd": "she would",
-        "we'd": "we would",
-        "they'd": "they would",
-        "i'll": "i will",
-        "you'll": "you will",
-        "he'll": "he will",
-        "she'll": "she will",
-        "we'll": "we will",
-        "they'll": "they will",
-        "isn't": "is not",
-        "aren't": "are not",
-        "wasn't": "was not",
-        "weren't": "were not",
-        "hasn't": "has not",
-        "haven't": "have not",
-        "hadn't": "had not",
-        "doesn't": "does not",
-        "didn't": "did not",
-        "couldn't": "could not",
-        "shouldn't": "should not",
-        "wouldn't": "would not",
-        "mightn't": "might not",
-        "mustn't": "must not",
-    }
-
-    for contraction, expansion in contractions.items():
-        # Case-insensitive replacement
-        pattern = re.compile(re.escape(contraction), re.IGNORECASE)
-        text = pattern.sub(expansion, text)
+    if "'" in text:
+        expand = _expand_contraction_preserving_case if preserve_case else _expand_contraction
+        if _OVERLAP_RE.search(text):
+            for pattern, _ in _CONTRACTION_PASSES:
+                text = pattern.sub(expand, text)
+        else:
+            text = _CONTRACTION_RE.sub(expand, text)
 
-    # Replace newlines with periods (adds pauses in TTS)
-    text = re.sub(r'\n\n+', '. ', text)
-    text = re.sub(r'\n', ' ', text)
+    # Replace paragraph breaks with periods (adds pauses in TTS) and remove URLs
+    text = _BREAK_URL_RE.sub(_replace_break_or_url, text)
 
-    # Remove URLs
-    text = re.sub(r'http\S+', '', text)
-    text = re.sub(r'www\.\S+', '', text)
-
-    # Remove multiple spaces
-    text = re.sub(r'\s+', ' ', text)
-
-    # Fix multiple punctuation
-    text = re.sub(r'\.{2,}', '.', text)
-    text = re.sub(r'!{2,}', '!', text)
-    text = re.sub(r'\?{2,}', '?', text)
-
-    # Remove special characters that TTS struggles with
-    text = re.sub(r'[^\w\s.,!?;\'-]', '', text)
+    # Remove multiple spaces, fix multiple punctuation, remove special characters
+    text = _WHITESPACE_PUNCT_RE.sub(_replace_whitespace_punct, text)
 
     return text.strip()
 
@@ -136,16 +205,42 @@ def clean_story_for_video(title: str, body: str) -> Dict[str, str]:
     tts_body = fix_formatting_for_tts(clean_body)
 
     # Combine title and body with separator
-    full_text = f"{tts_title}. {tts_body}"
+    full_text = StoryDocument(f"{tts_title}. {tts_body}")
 
     logger.debug(f"Cleaned story: {len(full_text)} characters")
 
     return {
         "title": tts_title,
         "body": tts_body,
-        "full_text": full_text,
-        "word_count": len(full_text.split()),
+        "full_text": full_text.text,
+        "word_count": full_text.word_count,
         "char_count": len(full_text)
     }
 
-__all__ = ["clean_reddit_markdown", "fix_formatting_for_tts", "clean_story_for_video"]
+def _clean_chunk(chunk: List[Tuple[str, str]]) -> List[Dict[str, str]]:
+    """Clean a chunk of (title, body) pairs (runs in worker processes)."""
+    return [clean_story_for_video(title, body) for title, body in chunk]
+
+def clean_stories_batch(
+    stories: Iterable[Dict],
+    chunk_size: Optional[int] = None,
+    max_workers: Optional[int] = None
+) -> Iterator[Dict[str, str]]:
+    """Clean many stories, fanning out across a process pool.
+
+    Only title and body are sent to the workers. Results are streamed back in
+    input order, so this can be used to re-process a large backlog without
+    loading it all into memory.
+
+    Args:
+        stories: Iterable of story dictionaries with 'title' and 'body'
+        chunk_size: Stories per worker task. If None, uses config value.
+        max_workers: Worker processes. If None, uses config value.
+
+    Yields:
+        Cleaned story dictionaries (same format as clean_story_for_video)
+    """
+    pairs = ((story["title"], story["body"]) for story in stories)
+    return process_in_chunks(_clean_chunk, pairs, chunk_size, max_workers)
+
+__all__ = ["clean_reddit_markdown", "fix_formatting_for_tts", "clean_story_for_video", "clean_stories_batch"]
@@ -0,0 +1,177 @@
+"""Virality scoring for single stories and NumPy column batches."""
+
+from typing import Dict, List, Optional, Sequence
+import numpy as np
+from src.utils.logger import get_logger
+from src.utils.config_loader import config
+
+logger = get_logger(__name__)
+
+# Length score is 1.0 inside the optimal range and falls off linearly outside it
+OPTIMAL_MIN_WORDS = 300
+OPTIMAL_MAX_WORDS = 800
+LENGTH_FALLOFF_WORDS = 700
+
+# Caps keep a single runaway metric from dominating the score
+MAX_UPVOTE_VELOCITY = 100
+MAX_COMMENT_VELOCITY = 50
+MAX_AWARDS_SCORE = 50
+MIN_HOURS_OLD = 0.1
+
+def load_weights() -> Dict[str, float]:
+    """Load virality weights from config.
+
+    Returns:
+        Weight per component
+    """
+    return {
+        "upvote_velocity": config.get("virality.upvote_velocity_weight", 0.30),
+        "comment_velocity": config.get("virality.comment_velocity_weight", 0.25),
+        "upvote_ratio": config.get("virality.upvote_ratio_weight", 0.15),
+        "awards": config.get("virality.awards_weight", 0.15),
+        "length": config.get("virality.length_weight", 0.10),
+        "sentiment": config.get("virality.sentiment_weight", 0.05),
+    }
+
+class ViralityScorer:
+    """Score story virality from engagement, length and sentiment.
+
+    ``score`` handles one story dict; ``score_arrays`` takes one array per
+    metric and scores every story at once with the same formula, so both give
+    identical results.
+    """
+
+    def __init__(self, weights: Optional[Dict[str, float]] = None):
+        """Initialize virality scorer.
+
+        Args:
+            weights: Weight per component. If None, uses config values.
+        """
+        self.weights = weights or load_weights()
+
+    def score(self, post_data: Dict) -> float:
+        """Calculate virality score for a story.
+
+        Args:
+            post_data: Dictionary with post metrics (upvotes, comments,
+                upvote_ratio, awards, body or word_count, hours_old, sentiment_score)
+
+        Returns:
+            Virality score (0-100+)
+        """
+        # Extract metrics
+        upvotes = post_data.get("upvotes", 0)
+        comments = post_data.get("comments", 0)
+        upvote_ratio = post_data.get("upvote_ratio", 0)
+        awards = post_data.get("awards", 0)
+        word_count = post_data.get("word_count")
+        if word_count is None:
+            word_count = len(post_data.get("body", "").split())
+        hours_old = post_data.get("hours_old", 1)
+        sentiment_score = post_data.get("sentiment_score", 0)
+
+        # Calculate velocity metrics
+        upvote_velocity = upvotes / max(hours_old, MIN_HOURS_OLD)
+        comment_velocity = comments / max(hours_old, MIN_HOURS_OLD)
+
+        # Length score (optimal length: 300-800 words)
+        if OPTIMAL_MIN_WORDS <= word_count <= OPTIMAL_MAX_WORDS:
+            length_score = 1.0
+        elif word_count < OPTIMAL_MIN_WORDS:
+            length_score = word_count / OPTIMAL_MIN_WORDS
+        else:
+            length_score = max(0, 1 - (word_count - OPTIMAL_MAX_WORDS) / LENGTH_FALLOFF_WORDS)
+
+        # Sentiment score (absolute value - controversy matters)
+        sentiment_contribution = abs(sentiment_score)
+
+        # Weighted combination
+        virality = (
+            self.weights["upvote_velocity"] * min(upvote_velocity, MAX_UPVOTE_VELOCITY) +
+            self.weights["comment_velocity"] * min(comment_velocity, MAX_COMMENT_VELOCITY) +
+            self.weights["upvote_ratio"] * (upvote_ratio * 100) +
+            self.weights["awards"] * min(awards * 10, MAX_AWARDS_SCORE) +
+            self.weights["length"] * (length_score * 100) +
+            self.weights["sentiment"] * (sentiment_contribution * 100)
+        )
+
+        # Same rounding as score_arrays, so rescoring sees identical scores
+        return float(np.round(virality, 2))
+
+    def score_arrays(
+        self,
+        upvotes: Sequence[float],
+        comments: Sequence[float],
+        upvote_ratio: Sequence[float],
+        awards: Sequence[float],
+        word_count: Sequence[float],
+        hours_old: Sequence[float],
+        sentiment_score: Sequence[float]
+    ) -> np.ndarray:
+        """Calculate virality scores for many stories at once.
+
+        All arguments are equal-length arrays (or sequences) of one metric each.
+
+        Returns:
+            Array of virality scores rounded to 2 decimals
+        """
+        upvotes = np.asarray(upvotes, dtype=np.float64)
+        comments = np.asarray(comments, dtype=np.float64)
+        upvote_ratio = np.asarray(upvote_ratio, dtype=np.float64)
+        awards = np.asarray(awards, dtype=np.float64)
+        word_count = np.asarray(word_count, dtype=np.float64)
+        hours_old = np.maximum(np.asarray(hours_old, dtype=np.float64), MIN_HOURS_OLD)
+        sentiment_score = np.asarray(sentiment_score, dtype=np.float64)
+
+        upvote_velocity = upvotes / hours_old
+        comment_velocity = comments / hours_old
+
+        length_score = np.where(
+            word_count < OPTIMAL_MIN_WORDS,
+            word_count / OPTIMAL_MIN_WORDS,
+            np.maximum(0, 1 - (word_count - OPTIMAL_MAX_WORDS) / LENGTH_FALLOFF_WORDS)
+        )
+        length_score[(word_count >= OPTIMAL_MIN_WORDS) & (word_count <= OPTIMAL_MAX_WORDS)] = 1.0
+
+        virality = (
+            self.weights["upvote_velocity"] * np.minimum(upvote_velocity, MAX_UPVOTE_VELOCITY) +
+            self.weights["comment_velocity"] * np.minimum(comment_velocity, MAX_COMMENT_VELOCITY) +
+            self.weights["upvote_ratio"] * (upvote_ratio * 100) +
+            self.weights["awards"] * np.minimum(awards * 10, MAX_AWARDS_SCORE) +
+            self.weights["length"] * (length_score * 100) +
+            self.weights["sentiment"] * (np.abs(sentiment_score) * 100)
+        )
+
+        return np.round(virality, 2)
+
+    def score_batch(self, stories: List[Dict]) -> List[float]:
+        """Calculate virality scores for a list of story dicts.
+
+        Args:
+            stories: Story dictionaries (same keys as ``score``)
+
+        Returns:
+            Virality scores in input order
+        """
+        if not stories:
+            return []
+
+        def column(key: str, default: float) -> List[float]:
+            return [story.get(key, default) for story in stories]
+
+        word_counts = [
+            story["word_count"] if story.get("word_count") is not None else len(story.get("body", "").split())
+            for story in stories
+        ]
+
+        return self.score_arrays(
+            column("upvotes", 0),
+            column("comments", 0),
+            column("upvote_ratio", 0),
+            column("awards", 0),
+            word_counts,
+            column("hours_old", 1),
+            column("sentiment_score", 0),
+        ).tolist()
+
+__all__ = ["ViralityScorer", "load_weights"]
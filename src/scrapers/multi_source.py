@@ -0,0 +1,236 @@
+"""Concurrent multi-subreddit scraping with Async PRAW."""
+
+import asyncio
+import os
+from typing import Any, Dict, List, Optional
+import asyncpraw
+from aiohttp import ClientResponse
+from asyncprawcore import Requestor
+from dotenv import load_dotenv
+from src.scrapers.reddit_scraper import RedditScraper
+from src.utils.logger import get_logger
+from src.utils.config_loader import config
+from src.utils.rate_limiter import backoff_delay, get_bucket
+
+logger = get_logger(__name__)
+load_dotenv()
+
+class AsyncRateLimitedRequestor(Requestor):
+    """Async PRAW requestor sharing the 'reddit' token bucket.
+
+    Async counterpart of RateLimitedRequestor: waits for a token without
+    blocking the event loop, re-tunes the bucket from X-Ratelimit headers and
+    retries 429 responses with backoff.
+    """
+
+    async def request(self, *args: Any, timeout: float = None, **kwargs: Any) -> ClientResponse:
+        """Issue an HTTP request under the shared Reddit rate limit."""
+        bucket = get_bucket("reddit")
+        max_retries = config.get("rate_limits.max_retries", 5)
+
+        for attempt in range(max_retries + 1):
+            await bucket.acquire_async()
+            response = await super().request(*args, timeout=timeout, **kwargs)
+            bucket.update_from_headers(response.headers)
+
+            if response.status != 429 or attempt == max_retries:
+                return response
+
+            try:
+                server_delay = float(response.headers.get("retry-after") or response.headers.get("x-ratelimit-reset"))
+            except (TypeError, ValueError):
+                server_delay = None
+            response.release()
+
+            delay = backoff_delay(attempt, server_delay)
+            logger.warning(f"Reddit rate limited (429), retrying in {delay:.1f}s")
+            bucket.pause(delay)
+
+        return response
+
+def load_sources(scraper: RedditScraper) -> List[Dict]:
+    """Load subreddit sources from config, filling in defaults.
+
+    Each source may set subreddit, limit, listing ('top' or 'new'),
+    time_filter, min_upvotes, max_words and min_hours_old; anything missing
+    falls back to the top-level reddit.* values.
+
+    Args:
+        scraper: Scraper providing the default filters and limit
+
+    Returns:
+        List of source dictionaries
+    """
+    sources = config.get("reddit.sources") or [{"subreddit": scraper.subreddit_name}]
+    return [
+        {
+            "limit": scraper.posts_per_day,
+            "listing": scraper.listing,
+            "time_filter": "day",
+            **scraper.filters,
+            **source,
+        }
+        for source in sources
+    ]
+
+class MultiSourceScraper:
+    """Fetch many subreddits concurrently and merge them into one scored list.
+
+    All sources share one Async PRAW session and the process-wide Reddit
+    rate budget; candidates are filtered per source, then sentiment and
+    virality are scored in a single batch.
+    """
+
+    def __init__(self, sources: Optional[List[Dict]] = None, scraper: Optional[RedditScraper] = None):
+        """Initialize multi-source scraper.
+
+        Args:
+            sources: Source dictionaries (see load_sources). If None, uses config.
+            scraper: Scraper used for filtering, scoring and saving. If None, creates one.
+        """
+        self.scraper = scraper or RedditScraper()
+        self.sources = sources or load_sources(self.scraper)
+        self.max_concurrency = config.get("reddit.max_concurrent_sources", 4)
+
+        logger.info(f"Multi-source scraper initialized for {len(self.sources)} subreddits")
+
+    def _create_reddit(self) -> asyncpraw.Reddit:
+        """Create the Async PRAW session (must be called inside the event loop)."""
+        return asyncpraw.Reddit(
+            client_id=os.getenv("REDDIT_CLIENT_ID"),
+            client_secret=os.getenv("REDDIT_CLIENT_SECRET"),
+            user_agent=os.getenv("REDDIT_USER_AGENT", "content-bot/1.0"),
+            requestor_class=AsyncRateLimitedRequestor
+        )
+
+    async def fetch_source(
+        self,
+        reddit: asyncpraw.Reddit,
+        source: Dict,
+        semaphore: asyncio.Semaphore
+    ) -> List[Dict]:
+        """Fetch unscored candidates from one subreddit.
+
+        Args:
+            reddit: Async PRAW session
+            source: Source dictionary
+            semaphore: Limits how many listings are walked at once
+
+        Returns:
+            Candidate story dictionaries
+        """
+        name = source["subreddit"]
+        limit = source["limit"]
+        candidates = []
+
+        async with semaphore:
+            try:
+                subreddit = await reddit.subreddit(name)
+                walked = 0
+                cap = limit * 2
+                async for post in self.scraper.open_listing(subreddit, source, cap):
+                    walked += 1
+                    if self.scraper.reached_high_water_mark(post, source):
+                        complete = True
+                        break
+
+                    candidate = self.scraper.build_candidate(post, filters=source, subreddit=name)
+                    if candidate is None:
+                        continue
+
+                    candidates.append(candidate)
+                    if len(candidates) >= limit:
+                        complete = False
+                        break
+                else:
+                    complete = walked < cap  # The listing ran out before the cap
+                self.scraper.finish_walk(source, complete)
+
+            except Exception as e:
+                logger.error(f"Error fetching r/{name}: {e}")
+                self.scraper.finish_walk(source, complete=False)
+
+        logger.info(f"Fetched {len(candidates)} candidates from r/{name}")
+        return candidates
+
+    async def fetch_stories_async(self) -> List[Dict]:
+        """Fetch all sources concurrently and merge them.
+
+        Returns:
+            Scored story dictionaries, highest virality first
+        """
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        self.scraper.skipped_known = 0
+        self.scraper.get_known_ids()  # One query up front instead of inside the event loop
+        reddit = self._create_reddit()
+
+        try:
+            results = await asyncio.gather(
+                *(self.fetch_source(reddit, source, semaphore) for source in self.sources)
+            )
+        finally:
+            await reddit.close()
+
+        # The same post can be listed by more than one source (e.g. crossposted listings)
+        merged: Dict[str, Dict] = {}
+        for candidates in results:
+            for story in candidates:
+                merged.setdefault(story["reddit_id"], story)
+
+        stories = self.scraper.score_candidates(list(merged.values()))
+        stories.sort(key=lambda story: story["virality_score"], reverse=True)
+
+        logger.info(
+            f"Fetched {len(stories)} valid stories from {len(self.sources)} subreddits "
+            f"({self.scraper.skipped_known} already stored)"
+        )
+        return stories
+
+    def fetch_stories(self) -> List[Dict]:
+        """Fetch all sources (synchronous wrapper).
+
+        Returns:
+            Scored story dictionaries, highest virality first
+        """
+        return asyncio.run(self.fetch_stories_async())
+
+    def scrape_and_save(self) -> int:
+        """Fetch all sources and save the merged stories to the database.
+
+        Returns:
+            Number of stories saved
+        """
+        stories = self.fetch_stories()
+
+        if not stories:
+            self.scraper.state.save()
+            logger.warning("No new stories fetched")
+            return 0
+
+        # High-water marks only advance once posts are stored
+        saved_count = self.scraper.save_stories_to_db(stories)
+        if saved_count:
+            self.scraper.state.save()
+        else:
+            self.scraper.state.discard()
+        logger.info(f"Multi-source scrape complete: {saved_count} stories saved")
+        return saved_count
+
+__all__ = ["MultiSourceScraper", "AsyncRateLimitedRequestor", "load_sources"]
+
+# CLI interface
+if __name__ == "__main__":
+    import sys
+
+    scraper = MultiSourceScraper()
+
+    if "--dry-run" in sys.argv:
+        stories = scraper.fetch_stories()
+        for story in stories[:20]:
+            print(f"{story['virality_score']:7.2f}  r/{story['subreddit']:24s} {story['title'][:60]}")
+        print(f"✅ Fetched {len(stories)} stories (not saved)")
+        sys.exit(0)
+
+    print(f"Scraping {len(scraper.sources)} subreddits...")
+    count = scraper.scrape_and_save()
+    print(f"✅ Scraped and saved {count} stories")
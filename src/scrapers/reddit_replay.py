@@ -0,0 +1,213 @@
+"""Record Reddit API responses to fixtures and replay them offline."""
+
+import gzip
+import json
+import threading
+import time
+from collections import defaultdict, deque
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Deque, Dict, Optional, Tuple
+from urllib.parse import urlsplit
+import praw
+from prawcore import Requestor
+from requests import Response
+from requests.structures import CaseInsensitiveDict
+from src.scrapers.reddit_requestor import RateLimitedRequestor
+from src.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+# Response headers worth keeping (rate-limit state drives the token bucket)
+RECORDED_HEADERS = ("content-type", "x-ratelimit-remaining", "x-ratelimit-reset", "x-ratelimit-used")
+
+class FixtureMissError(LookupError):
+    """A replayed request has no recorded response."""
+
+def _request_key(method: str, url: str, params: Optional[Dict]) -> str:
+    """Identify a request by method, path and query parameters (not host or auth)."""
+    params = {str(k): str(v) for k, v in (params or {}).items()}
+    return f"{method.upper()} {urlsplit(url).path} {json.dumps(params, sort_keys=True)}"
+
+def _split_request(args: Tuple, kwargs: Dict) -> Tuple[str, str]:
+    """Get (method, url) from prawcore's request arguments."""
+    method = args[0] if len(args) > 0 else kwargs.get("method")
+    url = args[1] if len(args) > 1 else kwargs.get("url")
+    return method, url
+
+def fixture_recorded_at(path: str) -> datetime:
+    """Read when a fixture was recorded (UTC).
+
+    Replays pin the scraper's clock to this time so post ages, filters and
+    scores come out the same as during recording.
+
+    Args:
+        path: Fixture file
+
+    Returns:
+        Recording start time (naive UTC)
+    """
+    with gzip.open(path, "rt", encoding="utf-8") as f:
+        header = json.loads(f.readline())
+    return datetime.utcfromtimestamp(header["recorded_at"])
+
+class RecordingRequestor(RateLimitedRequestor):
+    """Rate-limited requestor that also appends every response to a fixture.
+
+    The fixture is gzip-compressed JSON lines: a header with the recording
+    time, then one record per response (method, path, params, status, a few
+    headers, body and elapsed time). Each record is written as its own gzip
+    member, so a fixture stays readable even if the run is killed. OAuth
+    tokens are redacted.
+
+    Usage:
+        praw.Reddit(..., requestor_class=RecordingRequestor,
+                    requestor_kwargs={"fixture_path": "fixtures/top_day.jsonl.gz"})
+    """
+
+    def __init__(self, *args: Any, fixture_path: str, **kwargs: Any):
+        """Initialize recording requestor.
+
+        Args:
+            fixture_path: Fixture file to create (overwritten)
+        """
+        super().__init__(*args, **kwargs)
+        self.fixture_path = Path(fixture_path)
+        self.fixture_path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+
+        with gzip.open(self.fixture_path, "wt", encoding="utf-8") as f:
+            f.write(json.dumps({"fixture": "reddit", "recorded_at": time.time()}) + "\n")
+
+        logger.info(f"Recording Reddit responses to {self.fixture_path}")
+
+    def request(self, *args: Any, timeout: float = None, **kwargs: Any) -> Response:
+        """Issue an HTTP request and record its response."""
+        response = super().request(*args, timeout=timeout, **kwargs)
+        method, url = _split_request(args, kwargs)
+
+        body = response.text
+        if urlsplit(url).path.endswith("/access_token") and response.status_code == 200:
+            token = response.json()
+            token["access_token"] = "REDACTED"
+            body = json.dumps(token)
+
+        record = {
+            "key": _request_key(method, url, kwargs.get("params")),
+            "status": response.status_code,
+            "headers": {name: response.headers[name] for name in RECORDED_HEADERS if name in response.headers},
+            "body": body,
+            "elapsed": response.elapsed.total_seconds(),
+        }
+
+        with self._lock, gzip.open(self.fixture_path, "at", encoding="utf-8") as f:
+            f.write(json.dumps(record) + "\n")
+
+        return response
+
+class ReplayRequestor(Requestor):
+    """Requestor that serves recorded responses instead of calling Reddit.
+
+    Requests are matched on method, path and query parameters; repeated
+    requests get the recorded responses in order (the last one repeats once
+    they run out). Replays run at full speed unless ``realtime`` is set, in
+    which case each response is delayed by its recorded latency.
+
+    Usage:
+        praw.Reddit(..., requestor_class=ReplayRequestor,
+                    requestor_kwargs={"fixture_path": "fixtures/top_day.jsonl.gz"})
+    """
+
+    def __init__(self, *args: Any, fixture_path: str, realtime: bool = False, **kwargs: Any):
+        """Initialize replay requestor.
+
+        Args:
+            fixture_path: Fixture file written by RecordingRequestor
+            realtime: Reproduce the recorded response latency
+        """
+        super().__init__(*args, **kwargs)
+        self.realtime = realtime
+        self._lock = threading.Lock()
+        self._responses: Dict[str, Deque[Dict]] = defaultdict(deque)
+        self._last: Dict[str, Dict] = {}
+
+        with gzip.open(fixture_path, "rt", encoding="utf-8") as f:
+            f.readline()  # Header
+            for line in f:
+                record = json.loads(line)
+                self._responses[record["key"]].append(record)
+
+        logger.info(f"Replaying {sum(map(len, self._responses.values()))} Reddit responses from {fixture_path}")
+
+    def request(self, *args: Any, timeout: float = None, **kwargs: Any) -> Response:
+        """Return the next recorded response for this request."""
+        method, url = _split_request(args, kwargs)
+        key = _request_key(method, url, kwargs.get("params"))
+
+        with self._lock:
+            queue = self._responses.get(key)
+            if queue:
+                self._last[key] = queue.popleft()
+            record = self._last.get(key)
+
+        if record is None:
+            raise FixtureMissError(f"No recorded response for {key}")
+
+        if self.realtime:
+            time.sleep(record["elapsed"])
+
+        response = Response()
+        response.status_code = record["status"]
+        response.headers = CaseInsensitiveDict(record["headers"])
+        response._content = record["body"].encode("utf-8")
+        response.encoding = "utf-8"
+        response.url = url
+        return response
+
+def create_recording_reddit(fixture_path: str) -> praw.Reddit:
+    """Create a live PRAW client (credentials from .env) that records to a fixture.
+
+    Args:
+        fixture_path: Fixture file to create
+
+    Returns:
+        PRAW client
+    """
+    from src.scrapers.reddit_scraper import create_reddit
+
+    return create_reddit(
+        requestor_class=RecordingRequestor,
+        requestor_kwargs={"fixture_path": fixture_path}
+    )
+
+def create_replay_reddit(fixture_path: str, realtime: bool = False) -> praw.Reddit:
+    """Create an offline PRAW client backed by a fixture (no credentials needed).
+
+    Only Reddit is replayed: code that also reads or writes the database
+    needs a repository too, e.g. ``RedditScraper(reddit=..., db=SQLiteClient(":memory:"))``
+    as the ``--replay`` CLI does for ``scrape_and_save``.
+
+    Args:
+        fixture_path: Fixture file written by RecordingRequestor
+        realtime: Reproduce the recorded response latency
+
+    Returns:
+        PRAW client
+    """
+    return praw.Reddit(
+        client_id="replay",
+        client_secret="replay",
+        user_agent="content-bot/replay",
+        check_for_updates=False,  # PRAW's PyPI version check would go to the network
+        requestor_class=ReplayRequestor,
+        requestor_kwargs={"fixture_path": fixture_path, "realtime": realtime}
+    )
+
+__all__ = [
+    "RecordingRequestor",
+    "ReplayRequestor",
+    "FixtureMissError",
+    "create_recording_reddit",
+    "create_replay_reddit",
+    "fixture_recorded_at",
+]
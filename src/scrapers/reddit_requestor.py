@@ -0,0 +1,47 @@
+"""PRAW requestor that shares the Reddit rate limit and retries 429 responses."""
+
+from typing import Any
+from prawcore import Requestor
+from requests import Response
+from src.utils.logger import get_logger
+from src.utils.config_loader import config
+from src.utils.rate_limiter import backoff_delay, get_bucket
+
+logger = get_logger(__name__)
+
+class RateLimitedRequestor(Requestor):
+    """Requestor that takes a 'reddit' token before every HTTP request.
+
+    The bucket is re-tuned from Reddit's X-Ratelimit-Remaining/Reset headers
+    after each response, so every client in the process (scraper, refresh
+    and backfill jobs) paces itself against the account's real quota. 429
+    responses are retried with backoff before PRAW sees them.
+
+    Usage:
+        praw.Reddit(..., requestor_class=RateLimitedRequestor)
+    """
+
+    def request(self, *args: Any, timeout: float = None, **kwargs: Any) -> Response:
+        """Issue an HTTP request under the shared Reddit rate limit."""
+        bucket = get_bucket("reddit")
+        max_retries = config.get("rate_limits.max_retries", 5)
+
+        for attempt in range(max_retries + 1):
+            bucket.acquire()
+            response = super().request(*args, timeout=timeout, **kwargs)
+            bucket.update_from_headers(response.headers)
+
+            if response.status_code != 429 or attempt == max_retries:
+                return response
+
+            try:
+                server_delay = float(response.headers.get("retry-after") or response.headers.get("x-ratelimit-reset"))
+            except (TypeError, ValueError):
+                server_delay = None
+            delay = backoff_delay(attempt, server_delay)
+            logger.warning(f"Reddit rate limited (429), retrying in {delay:.1f}s")
+            bucket.pause(delay)
+
+        return response
+
+__all__ = ["RateLimitedRequestor"]
@@ -1,29 +1,60 @@
 """Reddit scraper for fetching stories from r/cheating_stories."""
 
 import os
-import time
+import threading
+import uuid
 from datetime import datetime, timedelta
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Set
 from dotenv import load_dotenv
 import praw
-from textblob import TextBlob
-from src.database.supabase_client import db
+from src.database.repository import Repository, db as default_db
+from src.processors.sentiment import SentimentScorer
+from src.processors.virality import ViralityScorer
+from src.processors.dedup import DedupIndex
+from src.scrapers.reddit_requestor import RateLimitedRequestor
+from src.scrapers.scrape_state import ScrapeState
 from src.utils.logger import get_logger
 from src.utils.config_loader import config
 
 logger = get_logger(__name__)
 load_dotenv()
 
+def create_reddit(requestor_class=RateLimitedRequestor, requestor_kwargs: Optional[Dict] = None) -> praw.Reddit:
+    """Create a PRAW client from .env, paced by the shared Reddit rate limit.
+
+    PRAW clients are not thread-safe; threads should create one each (they
+    still share the process-wide rate budget through the requestor).
+
+    Args:
+        requestor_class: prawcore requestor (e.g. RecordingRequestor to capture fixtures)
+        requestor_kwargs: Extra arguments for the requestor
+
+    Returns:
+        PRAW client
+    """
+    return praw.Reddit(
+        client_id=os.getenv("REDDIT_CLIENT_ID"),
+        client_secret=os.getenv("REDDIT_CLIENT_SECRET"),
+        user_agent=os.getenv("REDDIT_USER_AGENT", "content-bot/1.0"),
+        requestor_class=requestor_class,
+        requestor_kwargs=requestor_kwargs
+    )
+
 class RedditScraper:
     """Scrape Reddit stories and calculate virality scores."""
 
-    def __init__(self):
-        """Initialize Reddit scraper with PRAW."""
-        self.reddit = praw.Reddit(
-            client_id=os.getenv("REDDIT_CLIENT_ID"),
-            client_secret=os.getenv("REDDIT_CLIENT_SECRET"),
-            user_agent=os.getenv("REDDIT_USER_AGENT", "content-bot/1.0")
-        )
+    def __init__(self, reddit: Optional[praw.Reddit] = None, db: Optional[Repository] = None):
+        """Initialize Reddit scraper.
+
+        Args:
+            reddit: PRAW client to use. If None, one is created from .env on first use.
+            db: Repository stories are checked against and saved to. If None, uses the global client.
+        """
+        self._reddit = reddit
+        self.db = db if db is not None else default_db
+
+        # Current UTC time (fixture replays pin it to the recording time)
+        self.clock = datetime.utcnow
 
         # Load configuration
         self.subreddit_name = config.get("reddit.subreddit", "cheating_stories")
@@ -31,19 +62,42 @@ class RedditScraper:
         self.min_upvotes = config.get("reddit.min_upvotes", 100)
         self.max_words = config.get("reddit.max_words", 1500)
         self.min_hours_old = config.get("reddit.min_hours_old", 1)
+        self.listing = config.get("reddit.listing", "top")
 
-        # Virality weights
-        self.weights = {
-            "upvote_velocity": config.get("virality.upvote_velocity_weight", 0.30),
-            "comment_velocity": config.get("virality.comment_velocity_weight", 0.25),
-            "upvote_ratio": config.get("virality.upvote_ratio_weight", 0.15),
-            "awards": config.get("virality.awards_weight", 0.15),
-            "length": config.get("virality.length_weight", 0.10),
-            "sentiment": config.get("virality.sentiment_weight", 0.05),
+        # Default candidate filters (multi-source scraping can override them per subreddit)
+        self.filters = {
+            "min_upvotes": self.min_upvotes,
+            "max_words": self.max_words,
+            "min_hours_old": self.min_hours_old,
         }
 
+        # Sentiment is scored in one batch per fetch
+        self.sentiment = SentimentScorer()
+
+        # Virality weights (from config)
+        self.virality = ViralityScorer()
+        self.weights = self.virality.weights
+
+        # Near-duplicate index (loaded from the database on first save)
+        self.dedup_index: Optional[DedupIndex] = None
+        self.dedup_lookback_days = config.get("dedup.lookback_days", 90)
+
+        # Incremental scraping: posts already stored are skipped before any work
+        self.known_ids: Optional[Set[str]] = None
+        self.known_ids_lookback_days = config.get("reddit.known_ids_lookback_days", 14)
+        self.state = ScrapeState()
+        self.skipped_known = 0
+        self._skipped_lock = threading.Lock()  # build_candidate runs on backfill worker threads
+
         logger.info(f"Reddit scraper initialized for r/{self.subreddit_name}")
 
+    @property
+    def reddit(self) -> praw.Reddit:
+        """PRAW client (created on first use)."""
+        if self._reddit is None:
+            self._reddit = create_reddit()
+        return self._reddit
+
     def test_connection(self) -> bool:
         """Test Reddit API connection.
 
@@ -68,41 +122,7 @@ class RedditScraper:
         Returns:
             Virality score (0-100+)
         """
-        # Extract metrics
-        upvotes = post_data.get("upvotes", 0)
-        comments = post_data.get("comments", 0)
-        upvote_ratio = post_data.get("upvote_ratio", 0)
-        awards = post_data.get("awards", 0)
-        word_count = len(post_data.get("body", "").split())
-        hours_old = post_data.get("hours_old", 1)
-        sentiment_score = post_data.get("sentiment_score", 0)
-
-        # Calculate velocity metrics
-        upvote_velocity = upvotes / max(hours_old, 0.1)
-        comment_velocity = comments / max(hours_old, 0.1)
-
-        # Length score (optimal length: 300-800 words)
-        if 300 <= word_count <= 800:
-            length_score = 1.0
-        elif word_count < 300:
-            length_score = word_count / 300
-        else:
-            length_score = max(0, 1 - (word_count - 800) / 700)
-
-        # Sentiment score (absolute value - controversy matters)
-        sentiment_contribution = abs(sentiment_score)
-
-        # Weighted combination
-        virality = (
-            self.weights["upvote_velocity"] * min(upvote_velocity, 100) +
-            self.weights["comment_velocity"] * min(comment_velocity, 50) +
-            self.weights["upvote_ratio"] * (upvote_ratio * 100) +
-            self.weights["awards"] * min(awards * 10, 50) +
-            self.weights["length"] * (length_score * 100) +
-            self.weights["sentiment"] * (sentiment_contribution * 100)
-        )
-
-        return round(virality, 2)
+        return self.virality.score(post_data)
 
     def calculate_sentiment(self, text: str) -> float:
         """Calculate sentiment polarity of text.
@@ -113,12 +133,176 @@ class RedditScraper:
         Returns:
             Sentiment score (-1 to 1, where -1 is negative, 1 is positive)
         """
+        return self.calculate_sentiment_batch([text])[0]
+
+    def calculate_sentiment_batch(self, texts: List[str]) -> List[float]:
+        """Calculate sentiment polarity for many texts at once.
+
+        Args:
+            texts: Story texts
+
+        Returns:
+            Sentiment scores (-1 to 1), in input order
+        """
         try:
-            blob = TextBlob(text)
-            return blob.sentiment.polarity
+            return self.sentiment.score_batch(texts)
         except Exception as e:
             logger.warning(f"Failed to calculate sentiment: {e}")
-            return 0.0
+            return [0.0] * len(texts)
+
+    def get_known_ids(self) -> Set[str]:
+        """Reddit IDs stored within the lookback window (loaded once, in one query).
+
+        Returns:
+            Set of known reddit_ids
+        """
+        if self.known_ids is None:
+            since = (self.clock() - timedelta(days=self.known_ids_lookback_days)).isoformat()
+            self.known_ids = self.db.get_known_reddit_ids(since)
+            logger.info(f"Loaded {len(self.known_ids)} known Reddit IDs")
+        return self.known_ids
+
+    def open_listing(self, subreddit, source: Dict, limit: int):
+        """Get the listing generator for a source ('top' or 'new').
+
+        Args:
+            subreddit: PRAW or Async PRAW subreddit
+            source: Source dictionary (listing, time_filter)
+            limit: Maximum posts to walk
+
+        Returns:
+            Listing generator (sync or async, matching the subreddit)
+        """
+        if source.get("listing", "top") == "new":
+            return subreddit.new(limit=limit)
+        return subreddit.top(time_filter=source.get("time_filter", "day"), limit=limit)
+
+    def reached_high_water_mark(self, post, source: Dict) -> bool:
+        """Check whether a 'new' listing has reached posts seen on a previous run.
+
+        Posts old enough to be evaluated also advance the subreddit's mark
+        (applied when the scrape is saved).
+
+        Args:
+            post: Reddit submission
+            source: Source dictionary (subreddit, listing, min_hours_old)
+
+        Returns:
+            True if the rest of the listing can be skipped
+        """
+        if source.get("listing", "top") != "new":
+            return False
+
+        mark = self.state.high_water_mark(source["subreddit"])
+        if mark is not None and post.created_utc <= mark:
+            return True
+
+        hours_old = (self.clock() - datetime.utcfromtimestamp(post.created_utc)).total_seconds() / 3600
+        if hours_old >= source.get("min_hours_old", self.min_hours_old):
+            self.state.observe(source["subreddit"], post.created_utc)
+        return False
+
+    def finish_walk(self, source: Dict, complete: bool) -> None:
+        """Keep or drop the mark a 'new' listing walk observed.
+
+        The new mark may only be saved if every post between it and the old
+        mark was evaluated; a walk that stopped early (enough candidates, or
+        the fetch cap) would otherwise skip the rest on every later run.
+
+        Args:
+            source: Source dictionary (subreddit, listing)
+            complete: True if the walk reached the old mark or exhausted the listing
+        """
+        if source.get("listing", "top") != "new" or complete:
+            return
+        self.state.discard(source["subreddit"])
+        logger.info(f"r/{source['subreddit']}: stopped before the high-water mark, keeping the old mark")
+
+    def build_candidate(
+        self,
+        post,
+        filters: Optional[Dict] = None,
+        subreddit: Optional[str] = None
+    ) -> Optional[Dict]:
+        """Filter a post and turn it into an unscored story dict.
+
+        Works with PRAW and Async PRAW submissions alike.
+
+        Args:
+            post: Reddit submission
+            filters: min_upvotes, max_words and min_hours_old. If None, uses config values.
+            subreddit: Source subreddit name. If None, uses the scraper's subreddit.
+
+        Returns:
+            Story dictionary, or None if the post is filtered out
+        """
+        filters = filters or self.filters
+        subreddit = subreddit or self.subreddit_name
+
+        # Already stored (refresh_engagement keeps their metrics current)
+        if post.id in self.get_known_ids():
+            with self._skipped_lock:
+                self.skipped_known += 1
+            return None
+
+        # Skip non-text posts
+        if not post.is_self:
+            return None
+
+        # Skip removed/deleted posts
+        if post.removed_by_category or post.selftext in ["[removed]", "[deleted]"]:
+            return None
+
+        # Calculate post age (stored as scraped_at - created_utc, see save_stories_to_db)
+        created_time = datetime.utcfromtimestamp(post.created_utc)
+        fetched_at = self.clock()
+        hours_old = (fetched_at - created_time) / timedelta(hours=1)
+
+        # Skip very new posts (might not have enough engagement yet)
+        if hours_old < filters["min_hours_old"]:
+            return None
+
+        # Skip if too few upvotes
+        if post.score < filters["min_upvotes"]:
+            return None
+
+        # Skip if too long
+        word_count = len(post.selftext.split())
+        if word_count > filters["max_words"]:
+            logger.debug(f"Skipping post {post.id}: too long ({word_count} words)")
+            return None
+
+        return {
+            "reddit_id": post.id,
+            "subreddit": subreddit,
+            "title": post.title,
+            "body": post.selftext,
+            "author": str(post.author) if post.author else "[deleted]",
+            "created_utc": created_time.isoformat(),
+            "upvotes": post.score,
+            "comments": post.num_comments,
+            "upvote_ratio": post.upvote_ratio,
+            "awards": post.total_awards_received,
+            "word_count": word_count,
+            "hours_old": hours_old,
+            "fetched_at": fetched_at,
+        }
+
+    def score_candidates(self, stories: List[Dict]) -> List[Dict]:
+        """Add sentiment and virality scores to candidates (one batch for all).
+
+        Args:
+            stories: Story dictionaries from build_candidate
+
+        Returns:
+            The same stories, scored in place
+        """
+        sentiments = self.calculate_sentiment_batch([story["body"] for story in stories])
+        for story, sentiment_score in zip(stories, sentiments):
+            story["sentiment_score"] = sentiment_score
+        for story, virality_score in zip(stories, self.virality.score_batch(stories)):
+            story["virality_score"] = virality_score
+        return stories
 
     def fetch_stories(self, limit: Optional[int] = None) -> List[Dict]:
         """Fetch top stories from subreddit.
@@ -133,78 +317,65 @@ class RedditScraper:
             limit = self.posts_per_day
 
         subreddit = self.reddit.subreddit(self.subreddit_name)
+        source = {"subreddit": self.subreddit_name, "listing": self.listing, "time_filter": "day"}
         stories = []
-        cutoff_time = datetime.utcnow() - timedelta(hours=24)
+        self.skipped_known = 0
 
-        logger.info(f"Fetching top {limit} posts from r/{self.subreddit_name}")
+        logger.info(f"Fetching {self.listing} {limit} posts from r/{self.subreddit_name}")
 
         try:
-            for post in subreddit.top("day", limit=limit * 2):  # Fetch extra for filtering
-                # Skip non-text posts
-                if not post.is_self:
-                    continue
-
-                # Skip removed/deleted posts
-                if post.removed_by_category or post.selftext in ["[removed]", "[deleted]"]:
-                    continue
-
-                # Calculate post age
-                created_time = datetime.utcfromtimestamp(post.created_utc)
-                hours_old = (datetime.utcnow() - created_time).total_seconds() / 3600
-
-                # Skip very new posts (might not have enough engagement yet)
-                if hours_old < self.min_hours_old:
-                    continue
-
-                # Skip if too few upvotes
-                if post.score < self.min_upvotes:
-                    continue
+            walked = 0
+            cap = limit * 2  # Fetch extra for filtering
+            for post in self.open_listing(subreddit, source, cap):
+                walked += 1
+                if self.reached_high_water_mark(post, source):
+                    complete = True
+                    break
 
-                # Skip if too long
-                word_count = len(post.selftext.split())
-                if word_count > self.max_words:
-                    logger.debug(f"Skipping post {post.id}: too long ({word_count} words)")
+                # Sentiment and virality are scored below in one batch
+                story_data = self.build_candidate(post)
+                if story_data is None:
                     continue
 
-                # Calculate sentiment
-                sentiment_score = self.calculate_sentiment(post.selftext)
-
-                # Prepare story data
-                story_data = {
-                    "reddit_id": post.id,
-                    "title": post.title,
-                    "body": post.selftext,
-                    "author": str(post.author) if post.author else "[deleted]",
-                    "created_utc": created_time.isoformat(),
-                    "upvotes": post.score,
-                    "comments": post.num_comments,
-                    "upvote_ratio": post.upvote_ratio,
-                    "awards": post.total_awards_received,
-                    "sentiment_score": sentiment_score,
-                    "hours_old": hours_old,
-                }
-
-                # Calculate virality score
-                story_data["virality_score"] = self.calculate_virality_score(story_data)
-
                 stories.append(story_data)
 
                 # Stop if we have enough stories
                 if len(stories) >= limit:
+                    complete = False
                     break
+            else:
+                complete = walked < cap  # The listing ran out before the cap
+            self.finish_walk(source, complete)
 
-                # Rate limiting (1 request per second)
-                time.sleep(1)
+            self.score_candidates(stories)
 
-            logger.info(f"Fetched {len(stories)} valid stories")
+            logger.info(f"Fetched {len(stories)} valid stories ({self.skipped_known} already stored)")
             return stories
 
         except Exception as e:
             logger.error(f"Error fetching stories: {e}")
+            self.state.discard()
             return []
 
+    def get_dedup_index(self) -> DedupIndex:
+        """Get the near-duplicate index, loading recent signatures on first use.
+
+        Returns:
+            Dedup index of stories scraped within the lookback window
+        """
+        if self.dedup_index is None:
+            self.dedup_index = DedupIndex()
+            since = (self.clock() - timedelta(days=self.dedup_lookback_days)).isoformat()
+            for page in self.db.iter_story_pages(columns="id, minhash", scraped_after=since):
+                self.dedup_index.add_stories(page)
+            logger.info(f"Loaded {len(self.dedup_index)} story signatures for dedup")
+
+        return self.dedup_index
+
     def save_stories_to_db(self, stories: List[Dict]) -> int:
-        """Save stories to Supabase database.
+        """Save stories to Supabase database in bulk.
+
+        New posts are inserted, posts already stored get their metrics refreshed.
 
         Args:
             stories: List of story dictionaries
@@ -212,22 +383,87 @@ class RedditScraper:
         Returns:
             Number of stories successfully saved
         """
-        saved_count = 0
+        if not stories:
+            return 0
 
-        for story in stories:
-            # Remove temporary fields not in database schema
-            db_story = {k: v for k, v in story.items() if k not in ["hours_old"]}
-            db_story["status"] = "scraped"
-            db_story["scraped_at"] = datetime.now().isoformat()
+        index = self.get_dedup_index()
+        # New posts of this batch, indexed separately until their insert is confirmed
+        batch_index = DedupIndex(hasher=index.hasher, bands=index.bands, threshold=index.threshold)
 
-            result = db.insert_story(db_story)
-            if result:
-                saved_count += 1
+        try:
+            existing = self.db.get_existing_stories([story["reddit_id"] for story in stories])
+        except Exception as e:
+            logger.error(f"Failed to look up existing stories: {e}")
+            return 0
 
-            # Rate limiting
-            time.sleep(0.5)
+        rows = []
+        held = []  # (row, id of the in-batch original) written once the original is stored
+        signatures = {}
+        duplicate_count = 0
 
-        logger.info(f"Saved {saved_count}/{len(stories)} stories to database")
+        for story in stories:
+            # Remove temporary fields not in database schema
+            db_story = {k: v for k, v in story.items() if k not in ["hours_old", "fetched_at"]}
+
+            # Stored posts only get their metrics refreshed
+            if story["reddit_id"] not in existing:
+                # IDs are assigned here so in-batch duplicates can reference each other
+                db_story["id"] = str(uuid.uuid4())
+                db_story["status"] = "scraped"
+                # The fetch time the score's age was measured at (UTC like created_utc):
+                # rescoring recomputes that age as scraped_at - created_utc
+                db_story["scraped_at"] = story.get("fetched_at", self.clock()).isoformat()
+                db_story["duplicate_of"] = None  # Bulk inserts need the same keys on every row
+
+                # Reposts/cross-posts are stored but rejected before any expensive stage
+                signature = index.hasher.signature(story["body"])
+                db_story["minhash"] = index.hasher.encode(signature)
+                signatures[db_story["id"]] = signature
+
+                stored_match = index.query(signature)
+                match = stored_match or batch_index.query(signature)
+                if match is None:
+                    batch_index.add(db_story["id"], signature)
+                else:
+                    duplicate_id, similarity = match
+                    db_story["status"] = "rejected"
+                    duplicate_count += 1
+                    logger.info(
+                        f"Story {story['reddit_id']} is a near-duplicate of {duplicate_id} "
+                        f"(similarity {similarity:.2f})"
+                    )
+                    if stored_match is None:
+                        held.append((db_story, duplicate_id))
+                        continue
+                    db_story["duplicate_of"] = duplicate_id
+
+            rows.append(db_story)
+
+        outcomes = self.db.upsert_stories(rows, existing=existing)
+        inserted = {o["id"] for o in outcomes if o["outcome"] == "inserted"}
+
+        if held:
+            # duplicate_of may only reference originals that were actually stored
+            # (their insert can fail, or lose the reddit_id race to another writer)
+            for db_story, original_id in held:
+                if original_id in inserted:
+                    db_story["duplicate_of"] = original_id
+            held_outcomes = self.db.upsert_stories([db_story for db_story, _ in held], existing=existing)
+            inserted.update(o["id"] for o in held_outcomes if o["outcome"] == "inserted")
+            outcomes.extend(held_outcomes)
+
+        # Only stored rows may become duplicate_of targets of later batches
+        for story_id in inserted:
+            if story_id in signatures:
+                index.add(story_id, signatures[story_id])
+
+        self.get_known_ids().update(o["reddit_id"] for o in outcomes if o["outcome"] != "skipped")
+        saved_count = sum(1 for outcome in outcomes if outcome["outcome"] in ("inserted", "updated"))
+
+        logger.info(
+            f"Saved {saved_count}/{len(stories)} stories to database "
+            f"({duplicate_count} near-duplicates rejected)"
+        )
         return saved_count
 
     def scrape_and_save(self, limit: Optional[int] = None) -> int:
@@ -245,11 +481,16 @@ class RedditScraper:
         stories = self.fetch_stories(limit)
 
         if not stories:
-            logger.warning("No stories fetched")
+            self.state.save()
+            logger.warning("No new stories fetched")
             return 0
 
-        # Save to database
+        # Save to database (high-water marks only advance once posts are stored)
         saved_count = self.save_stories_to_db(stories)
+        if saved_count:
+            self.state.save()
+        else:
+            self.state.discard()
 
         logger.info(f"Scrape complete: {saved_count} stories saved")
         return saved_count
@@ -257,8 +498,40 @@ class RedditScraper:
 # CLI interface
 if __name__ == "__main__":
     import sys
+    import time
+
+    # Offline end-to-end run from a fixture, at full speed (add --realtime for
+    # recorded latency): stories are saved to a throwaway in-memory database
+    if "--replay" in sys.argv:
+        import tempfile
+        from pathlib import Path
+        from src.database.sqlite_client import SQLiteClient
+        from src.scrapers.reddit_replay import create_replay_reddit, fixture_recorded_at
+
+        fixture = sys.argv[sys.argv.index("--replay") + 1]
+        scraper = RedditScraper(
+            reddit=create_replay_reddit(fixture, realtime="--realtime" in sys.argv),
+            db=SQLiteClient(":memory:")
+        )
+        recorded_at = fixture_recorded_at(fixture)
+        scraper.clock = lambda: recorded_at
+
+        with tempfile.TemporaryDirectory() as state_dir:
+            # High-water marks of the real runs neither limit nor record the replay
+            scraper.state = ScrapeState(Path(state_dir) / "scraper_state.json")
+
+            start = time.perf_counter()
+            count = scraper.scrape_and_save()
+            print(f"✅ Replayed and saved {count} stories in {time.perf_counter() - start:.3f}s")
+        sys.exit(0)
+
+    # Live run that also records Reddit responses to a fixture
+    if "--record" in sys.argv:
+        from src.scrapers.reddit_replay import create_recording_reddit
 
-    scraper = RedditScraper()
+        scraper = RedditScraper(reddit=create_recording_reddit(sys.argv[sys.argv.index("--record") + 1]))
+    else:
+        scraper = RedditScraper()
 
     # Test connection if --test flag
     if "--test" in sys.argv:
@@ -0,0 +1,103 @@
+"""Persistent scraper state: per-subreddit high-water marks."""
+
+import json
+import threading
+from pathlib import Path
+from typing import Dict, Optional
+from src.utils.logger import get_logger
+from src.utils.config_loader import config
+
+logger = get_logger(__name__)
+
+class ScrapeState:
+    """Per-subreddit high-water marks stored in a small JSON file.
+
+    The mark is the newest ``created_utc`` among posts a 'new' listing walk
+    evaluated (old enough to pass min_hours_old). The next walk stops once it
+    reaches the mark, since everything older was already seen.
+    Marks only move forward and are written by ``save()``, so an aborted run
+    doesn't skip posts it never stored; a walk that stopped before the old
+    mark discards its observation for the same reason.
+    """
+
+    def __init__(self, path: Optional[str] = None):
+        """Initialize scrape state.
+
+        Args:
+            path: Path to state JSON file. If None, uses config value.
+        """
+        if path is None:
+            path = config.get("reddit.state_file", "data/state/scraper_state.json")
+            path = Path(__file__).parent.parent.parent / path
+
+        self.path = Path(path)
+        self._lock = threading.Lock()
+        self._marks: Dict[str, float] = self._load()
+        self._pending: Dict[str, float] = {}
+
+    def _load(self) -> Dict[str, float]:
+        """Load high-water marks from disk."""
+        if not self.path.exists():
+            return {}
+
+        try:
+            with open(self.path, 'r') as f:
+                data = json.load(f)
+            return {name: float(mark) for name, mark in data.get("high_water_marks", {}).items()}
+        except (OSError, ValueError) as e:
+            logger.warning(f"Failed to load scraper state from {self.path}: {e}")
+            return {}
+
+    def high_water_mark(self, subreddit: str) -> Optional[float]:
+        """Newest evaluated created_utc for a subreddit (saved runs only).
+
+        Args:
+            subreddit: Subreddit name
+
+        Returns:
+            Unix timestamp or None if the subreddit was never scraped
+        """
+        return self._marks.get(subreddit.lower())
+
+    def observe(self, subreddit: str, created_utc: float) -> None:
+        """Record an evaluated post (applied on the next save).
+
+        Args:
+            subreddit: Subreddit name
+            created_utc: Post creation time (Unix timestamp)
+        """
+        key = subreddit.lower()
+        with self._lock:
+            if created_utc > self._pending.get(key, self._marks.get(key, 0.0)):
+                self._pending[key] = created_utc
+
+    def discard(self, subreddit: Optional[str] = None) -> None:
+        """Forget marks observed since the last save (e.g. the run failed).
+
+        Args:
+            subreddit: Only forget this subreddit's mark. If None, forgets all.
+        """
+        with self._lock:
+            if subreddit is None:
+                self._pending = {}
+            else:
+                self._pending.pop(subreddit.lower(), None)
+
+    def save(self) -> None:
+        """Apply observed marks and write them to disk atomically."""
+        with self._lock:
+            if not self._pending:
+                return
+            self._marks.update(self._pending)
+            self._pending = {}
+
+            try:
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                tmp_path = self.path.with_suffix(".tmp")
+                with open(tmp_path, 'w') as f:
+                    json.dump({"high_water_marks": self._marks}, f, indent=2)
+                tmp_path.replace(self.path)
+            except OSError as e:
+                logger.warning(f"Failed to save scraper state: {e}")
+
+__all__ = ["ScrapeState"]
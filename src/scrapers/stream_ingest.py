@@ -0,0 +1,310 @@
+"""Near-real-time ingestion from subreddit submission streams."""
+
+import heapq
+import time
+from typing import Dict, List, Optional, Set, Tuple
+from src.scrapers.multi_source import load_sources
+from src.scrapers.reddit_scraper import RedditScraper
+from src.utils.batching import chunked
+from src.utils.logger import get_logger
+from src.utils.config_loader import config
+from src.utils.rate_limiter import backoff_delay
+
+logger = get_logger(__name__)
+
+# reddit.info() accepts at most 100 fullnames per request
+INFO_BATCH_SIZE = 100
+
+class StreamIngestor:
+    """Ingest new posts as they are submitted instead of once a day.
+
+    New submissions from all sources arrive through one multireddit stream
+    and wait in a min-heap keyed by the time they become old enough
+    (created_utc + min_hours_old). Only (ready_at, reddit_id, subreddit)
+    tuples are queued and the queue is capped at max_pending, so memory stays
+    bounded however busy the subreddits are. Matured posts are re-fetched
+    100 at a time with ``reddit.info()`` (the stream only sees them at
+    creation, with no engagement yet), filtered, and saved in micro-batches.
+
+    A matured post that is still short of min_upvotes goes back in the queue
+    and is re-checked with exponential backoff until it is max_age_hours
+    old, so late risers are not lost. Known IDs and dedup signatures are
+    reloaded from the database every reload_hours, which keeps them to their
+    lookback windows on a stream that never restarts.
+    """
+
+    def __init__(
+        self,
+        sources: Optional[List[Dict]] = None,
+        scraper: Optional[RedditScraper] = None,
+        max_pending: Optional[int] = None,
+        flush_size: Optional[int] = None,
+        flush_interval: Optional[float] = None,
+        recheck_interval: Optional[float] = None,
+        max_age_hours: Optional[float] = None,
+        reload_hours: Optional[float] = None
+    ):
+        """Initialize stream ingestor.
+
+        Args:
+            sources: Source dictionaries (see load_sources). If None, uses config.
+            scraper: Scraper used for filtering, scoring and saving. If None, creates one.
+            max_pending: Maximum posts waiting to mature. If None, uses config value.
+            flush_size: Save once this many stories are ready. If None, uses config value.
+            flush_interval: Save ready stories at least this often (seconds). If None, uses config value.
+            recheck_interval: First re-check delay (seconds) for matured posts below
+                min_upvotes, doubled on each retry. If None, uses config value.
+            max_age_hours: Stop re-checking posts older than this. If None, uses config value.
+            reload_hours: Reload known IDs and dedup signatures this often. If None, uses config value.
+        """
+        self.scraper = scraper or RedditScraper()
+        self.sources = sources or load_sources(self.scraper)
+        self.sources_by_name = {source["subreddit"].lower(): source for source in self.sources}
+
+        self.max_pending = max_pending or config.get("reddit.stream.max_pending", 5000)
+        self.flush_size = flush_size or config.get("reddit.stream.flush_size", 25)
+        self.flush_interval = flush_interval or config.get("reddit.stream.flush_interval_seconds", 300)
+        self.recheck_interval = recheck_interval or config.get("reddit.stream.recheck_interval_seconds", 1800)
+        self.max_age_hours = max_age_hours or config.get("reddit.stream.max_age_hours", 24)
+        self.reload_hours = reload_hours or config.get("reddit.stream.reload_hours", 6)
+
+        # (ready_at, reddit_id, subreddit, re-checks so far)
+        self._pending: List[Tuple[float, str, str, int]] = []
+        self._pending_ids: Set[str] = set()
+        self._batch: List[Dict] = []
+        self._last_flush = time.monotonic()
+        self._last_reload = time.monotonic()
+        self.stats = {"seen": 0, "queued": 0, "dropped": 0, "rechecked": 0, "candidates": 0, "saved": 0}
+
+        logger.info(f"Stream ingestor initialized for {len(self.sources)} subreddits")
+
+    def enqueue(self, post) -> bool:
+        """Queue a new submission until it is old enough to score.
+
+        Args:
+            post: Reddit submission from the stream
+
+        Returns:
+            True if the post was queued
+        """
+        self.stats["seen"] += 1
+
+        if not post.is_self or post.id in self._pending_ids or post.id in self.scraper.get_known_ids():
+            return False
+
+        name = post.subreddit.display_name.lower()
+        source = self.sources_by_name.get(name)
+        if source is None:
+            return False
+
+        ready_at = post.created_utc + source.get("min_hours_old", self.scraper.min_hours_old) * 3600
+        if not self._push(ready_at, post.id, name, 0):
+            return False
+        self.stats["queued"] += 1
+        return True
+
+    def _push(self, ready_at: float, reddit_id: str, name: str, rechecks: int) -> bool:
+        """Add a post to the pending heap unless it is full."""
+        if len(self._pending) >= self.max_pending:
+            self.stats["dropped"] += 1
+            logger.warning(f"Pending queue full ({self.max_pending}), dropping post {reddit_id}")
+            return False
+
+        heapq.heappush(self._pending, (ready_at, reddit_id, name, rechecks))
+        self._pending_ids.add(reddit_id)
+        return True
+
+    def _recheck_later(self, post, source: Dict, rechecks: int, now: float) -> bool:
+        """Re-queue a matured post that is only short of min_upvotes.
+
+        Args:
+            post: Re-fetched Reddit submission
+            source: Source dictionary (filters)
+            rechecks: Re-checks already done for this post
+            now: Current Unix time
+
+        Returns:
+            True if the post was queued again
+        """
+        if post.score >= source["min_upvotes"] or post.id in self.scraper.get_known_ids():
+            return False
+        if post.removed_by_category or post.selftext in ["[removed]", "[deleted]"]:
+            return False
+        if len(post.selftext.split()) > source["max_words"]:
+            return False
+
+        ready_at = now + self.recheck_interval * 2 ** rechecks
+        if ready_at - post.created_utc > self.max_age_hours * 3600:
+            return False
+
+        if not self._push(ready_at, post.id, source["subreddit"].lower(), rechecks + 1):
+            return False
+        self.stats["rechecked"] += 1
+        return True
+
+    def pop_due(self, now: Optional[float] = None) -> List[Tuple[str, str, int]]:
+        """Remove posts that have reached their source's minimum age (or re-check time).
+
+        Args:
+            now: Current Unix time. If None, uses the clock.
+
+        Returns:
+            (reddit_id, subreddit, re-checks so far) tuples, oldest first
+        """
+        now = time.time() if now is None else now
+        due = []
+
+        while self._pending and self._pending[0][0] <= now:
+            _, reddit_id, name, rechecks = heapq.heappop(self._pending)
+            self._pending_ids.discard(reddit_id)
+            due.append((reddit_id, name, rechecks))
+
+        return due
+
+    def process_due(self, now: Optional[float] = None) -> int:
+        """Re-fetch matured posts and add those passing the filters to the batch.
+
+        Args:
+            now: Current Unix time. If None, uses the clock.
+
+        Returns:
+            Number of new candidates
+        """
+        now = time.time() if now is None else now
+        due = self.pop_due(now)
+        if not due:
+            return 0
+
+        names = {reddit_id: name for reddit_id, name, _ in due}
+        rechecks = {reddit_id: count for reddit_id, _, count in due}
+        candidates = 0
+
+        for chunk in chunked(list(names), INFO_BATCH_SIZE):
+            try:
+                posts = list(self.scraper.reddit.info(fullnames=[f"t3_{reddit_id}" for reddit_id in chunk]))
+            except Exception as e:
+                logger.error(f"Failed to look up {len(chunk)} matured posts: {e}")
+                continue
+
+            for post in posts:
+                source = self.sources_by_name[names[post.id]]
+                candidate = self.scraper.build_candidate(post, filters=source, subreddit=source["subreddit"])
+                if candidate is not None:
+                    self._batch.append(candidate)
+                    candidates += 1
+                else:
+                    self._recheck_later(post, source, rechecks[post.id], now)
+
+        self.stats["candidates"] += candidates
+        return candidates
+
+    def flush(self, force: bool = False) -> int:
+        """Score and save the ready batch if it is large or old enough.
+
+        Args:
+            force: Save whatever is ready regardless of size and interval
+
+        Returns:
+            Number of stories saved
+        """
+        if not self._batch:
+            self._last_flush = time.monotonic()
+            return 0
+
+        interval_elapsed = time.monotonic() - self._last_flush >= self.flush_interval
+        if not (force or interval_elapsed or len(self._batch) >= self.flush_size):
+            return 0
+
+        stories, self._batch = self._batch, []
+        self._last_flush = time.monotonic()
+
+        saved_count = self.scraper.save_stories_to_db(self.scraper.score_candidates(stories))
+        self.stats["saved"] += saved_count
+        logger.info(f"Stream flush: {saved_count}/{len(stories)} stories saved, {len(self._pending)} pending")
+        return saved_count
+
+    def reload_lookups(self, force: bool = False) -> bool:
+        """Reload known IDs and dedup signatures if reload_hours have passed.
+
+        Both only grow while the stream runs; reloading trims them back to
+        their lookback windows (stories saved by this stream are included).
+
+        Args:
+            force: Reload regardless of the interval
+
+        Returns:
+            True if they were reloaded
+        """
+        if not force and time.monotonic() - self._last_reload < self.reload_hours * 3600:
+            return False
+
+        self.scraper.known_ids = None
+        self.scraper.dedup_index = None
+        self.scraper.get_known_ids()
+        self.scraper.get_dedup_index()
+        self._last_reload = time.monotonic()
+        return True
+
+    def _stream(self):
+        """Open one submission stream over every source (None when idle)."""
+        multireddit = "+".join(source["subreddit"] for source in self.sources)
+        return self.scraper.reddit.subreddit(multireddit).stream.submissions(pause_after=0)
+
+    def run(self, max_runtime: Optional[float] = None) -> Dict[str, int]:
+        """Ingest continuously until interrupted or max_runtime elapses.
+
+        Args:
+            max_runtime: Stop after this many seconds. If None, runs until interrupted.
+
+        Returns:
+            Ingestion counters
+        """
+        deadline = None if max_runtime is None else time.monotonic() + max_runtime
+        attempt = 0
+
+        logger.info(f"Streaming r/{'+'.join(self.sources_by_name)}")
+
+        try:
+            while deadline is None or time.monotonic() < deadline:
+                try:
+                    for post in self._stream():
+                        attempt = 0
+                        if post is not None:
+                            self.enqueue(post)
+
+                        self.process_due()
+                        self.flush()
+                        self.reload_lookups()
+
+                        if deadline is not None and time.monotonic() >= deadline:
+                            break
+
+                except Exception as e:
+                    # Reconnect after network errors or Reddit outages
+                    delay = backoff_delay(attempt)
+                    attempt += 1
+                    logger.error(f"Submission stream failed: {e}; reconnecting in {delay:.1f}s")
+                    time.sleep(delay)
+        finally:
+            self.flush(force=True)
+            logger.info(f"Stream ingestion stopped: {self.stats} ({len(self._pending)} still pending)")
+
+        return self.stats
+
+__all__ = ["StreamIngestor"]
+
+# CLI interface
+if __name__ == "__main__":
+    import argparse
+    import sys
+
+    parser = argparse.ArgumentParser(description="Ingest new Reddit posts in near real time")
+    parser.add_argument("--max-runtime", type=float, default=None, help="Stop after this many seconds")
+    args = parser.parse_args()
+
+    try:
+        stats = StreamIngestor().run(max_runtime=args.max_runtime)
+        print(f"✅ Saved {stats['saved']} stories ({stats['queued']} queued, {stats['dropped']} dropped)")
+    except KeyboardInterrupt:
+        print("\n\n❌ Stream ingestion stopped by user.")
+        sys.exit(1)
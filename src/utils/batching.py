@@ -0,0 +1,100 @@
+"""Chunked batch processing with optional process-pool fan-out."""
+
+import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+from typing import Any, Callable, Iterable, Iterator, List, Optional
+from src.utils.logger import get_logger
+from src.utils.config_loader import config
+
+logger = get_logger(__name__)
+
+def chunked(items: Iterable[Any], chunk_size: int) -> Iterator[List[Any]]:
+    """Split an iterable into lists of at most chunk_size items.
+
+    Args:
+        items: Any iterable (consumed lazily)
+        chunk_size: Maximum items per chunk
+
+    Yields:
+        Lists of items
+    """
+    iterator = iter(items)
+    while True:
+        chunk = list(islice(iterator, chunk_size))
+        if not chunk:
+            return
+        yield chunk
+
+def process_in_chunks(
+    func: Callable[[List[Any]], List[Any]],
+    items: Iterable[Any],
+    chunk_size: Optional[int] = None,
+    max_workers: Optional[int] = None
+) -> Iterator[Any]:
+    """Apply a chunk function across a process pool and stream results in order.
+
+    Input is read lazily and only a bounded number of chunks are in flight at
+    once, so arbitrarily large backlogs can be streamed without holding them in
+    memory. If everything fits in a single chunk, or max_workers is 1, chunks
+    are processed in the current process instead of starting a pool.
+
+    Args:
+        func: Picklable module-level function mapping a list of items to a list of results
+        items: Items to process
+        chunk_size: Items per chunk. If None, uses config value.
+        max_workers: Worker processes. If None, uses config value (0 = CPU count).
+
+    Yields:
+        Results in input order
+    """
+    if chunk_size is None:
+        chunk_size = config.get("processing.batch_chunk_size", 64)
+    if max_workers is None:
+        max_workers = config.get("processing.max_workers", 0)
+    if not max_workers:
+        max_workers = os.cpu_count() or 1
+
+    chunks = chunked(items, chunk_size)
+    first = next(chunks, None)
+    if first is None:
+        return
+    second = next(chunks, None)
+
+    # Small batches aren't worth the process start-up cost
+    if second is None or max_workers <= 1:
+        yield from func(first)
+        if second is not None:
+            yield from func(second)
+            for chunk in chunks:
+                yield from func(chunk)
+        return
+
+    # Keep a couple of chunks queued per worker so workers never sit idle
+    max_in_flight = max_workers * 2
+    processed = 0
+
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        pending = deque([executor.submit(func, first), executor.submit(func, second)])
+
+        try:
+            for chunk in chunks:
+                while len(pending) >= max_in_flight:
+                    results = pending.popleft().result()
+                    processed += len(results)
+                    yield from results
+                pending.append(executor.submit(func, chunk))
+
+            while pending:
+                results = pending.popleft().result()
+                processed += len(results)
+                yield from results
+        finally:
+            # Consumer stopped early (or a chunk failed): don't run the rest
+            for future in pending:
+                future.cancel()
+
+    logger.info(f"Processed {processed} items in chunks of {chunk_size} across {max_workers} workers")
+
+__all__ = ["chunked", "process_in_chunks"]
@@ -0,0 +1,218 @@
+"""Shared HTTP connection pool with keep-alive, optional HTTP/2 and pool statistics."""
+
+import atexit
+import threading
+import time
+from typing import Any, Dict, Optional
+import httpx
+from src.utils.lazy import LazyProxy
+from src.utils.logger import get_logger
+from src.utils.config_loader import config
+
+logger = get_logger(__name__)
+
+def _h2_available() -> bool:
+    try:
+        import h2  # noqa: F401
+        return True
+    except ImportError:
+        return False
+
+class PoolStats:
+    """Thread-safe counters for one connection pool.
+
+    A request is "reused" when it is sent on a kept-alive connection and
+    "new" when the pool had to open a TCP connection for it. Wait time runs
+    from handing the request to the pool until its headers go out on a
+    reused connection (or until a new connection starts connecting), so it
+    covers time spent queued behind ``max_connections``.
+    """
+
+    def __init__(self):
+        self.requests = 0
+        self.new_connections = 0
+        self.errors = 0
+        self.total_wait = 0.0
+        self.max_wait = 0.0
+        self.total_connect = 0.0
+        self.by_host: Dict[str, Dict[str, int]] = {}
+        self._lock = threading.Lock()
+
+    def record(self, host: str, new_connection: bool, wait: float, connect: float, failed: bool) -> None:
+        with self._lock:
+            self.requests += 1
+            self.total_wait += wait
+            self.max_wait = max(self.max_wait, wait)
+            if failed:
+                self.errors += 1
+            if new_connection:
+                self.new_connections += 1
+                self.total_connect += connect
+
+            host_stats = self.by_host.setdefault(host, {"requests": 0, "new_connections": 0})
+            host_stats["requests"] += 1
+            host_stats["new_connections"] += int(new_connection)
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Current statistics as a plain dict."""
+        with self._lock:
+            reused = self.requests - self.new_connections
+            return {
+                "requests": self.requests,
+                "new_connections": self.new_connections,
+                "reused": reused,
+                "reuse_rate": round(reused / self.requests, 3) if self.requests else 0.0,
+                "errors": self.errors,
+                "avg_wait_ms": round(self.total_wait / self.requests * 1000, 2) if self.requests else 0.0,
+                "max_wait_ms": round(self.max_wait * 1000, 2),
+                "avg_connect_ms": (
+                    round(self.total_connect / self.new_connections * 1000, 2) if self.new_connections else 0.0
+                ),
+                "by_host": {host: dict(counts) for host, counts in self.by_host.items()},
+            }
+
+class _RequestTrace:
+    """httpcore ``trace`` extension that times one request through the pool."""
+
+    def __init__(self, inner=None):
+        self.inner = inner
+        self.started = time.monotonic()
+        self.acquired: Optional[float] = None
+        self.connect_started: Optional[float] = None
+        self.connect_time = 0.0
+        self.new_connection = False
+
+    def __call__(self, event: str, info: Dict[str, Any]) -> None:
+        now = time.monotonic()
+        if event == "connection.connect_tcp.started":
+            self.new_connection = True
+            self.connect_started = now
+            if self.acquired is None:
+                self.acquired = now
+        elif event.endswith(".send_request_headers.started"):
+            if self.acquired is None:
+                self.acquired = now
+            if self.connect_started is not None and not self.connect_time:
+                # TCP connect + TLS (+ HTTP/2 preface) until the first request goes out
+                self.connect_time = now - self.connect_started
+
+        if self.inner is not None:
+            self.inner(event, info)
+
+class PooledTransport(httpx.BaseTransport):
+    """Thread-safe httpx transport shared by every client in the process.
+
+    Wraps one ``httpx.HTTPTransport`` (one httpcore connection pool) so that
+    Supabase, Anthropic and dashboard clients reuse kept-alive connections
+    per origin instead of each opening their own. ``close()`` from a client
+    is ignored; the pool is closed once at interpreter exit.
+    """
+
+    def __init__(
+        self,
+        max_connections: Optional[int] = None,
+        max_keepalive_connections: Optional[int] = None,
+        keepalive_expiry: Optional[float] = None,
+        http2: Optional[bool] = None
+    ):
+        """Initialize the pool.
+
+        Args:
+            max_connections: Open connections across all hosts (requests wait
+                for a free one beyond this). If None, uses config value.
+            max_keepalive_connections: Idle connections kept open. If None,
+                uses config value.
+            keepalive_expiry: Seconds an idle connection is kept. If None,
+                uses config value.
+            http2: Negotiate HTTP/2 where the server supports it (needs the
+                ``h2`` package). If None, uses config value.
+        """
+        self.max_connections = max_connections or config.get("http_pool.max_connections", 20)
+        self.max_keepalive_connections = max_keepalive_connections or config.get(
+            "http_pool.max_keepalive_connections", 10
+        )
+        self.keepalive_expiry = keepalive_expiry or config.get("http_pool.keepalive_expiry_seconds", 30.0)
+
+        if http2 is None:
+            http2 = config.get("http_pool.http2", True)
+        if http2 and not _h2_available():
+            logger.debug("h2 not installed - HTTP pool uses HTTP/1.1 keep-alive only")
+            http2 = False
+        self.http2 = http2
+
+        self._transport = httpx.HTTPTransport(
+            http2=self.http2,
+            limits=httpx.Limits(
+                max_connections=self.max_connections,
+                max_keepalive_connections=self.max_keepalive_connections,
+                keepalive_expiry=self.keepalive_expiry,
+            ),
+        )
+        self.stats = PoolStats()
+        self._closed = False
+        atexit.register(self.shutdown)
+
+        logger.info(
+            f"HTTP pool initialized (max_connections: {self.max_connections}, "
+            f"keepalive: {self.max_keepalive_connections}, http2: {self.http2})"
+        )
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        trace = _RequestTrace(request.extensions.get("trace"))
+        request.extensions["trace"] = trace
+        failed = True
+        try:
+            response = self._transport.handle_request(request)
+            failed = False
+            return response
+        finally:
+            acquired = trace.acquired if trace.acquired is not None else time.monotonic()
+            self.stats.record(
+                request.url.host,
+                trace.new_connection,
+                acquired - trace.started,
+                trace.connect_time,
+                failed,
+            )
+
+    def close(self) -> None:
+        """Ignored: clients sharing the pool must not close it for the others."""
+
+    def shutdown(self) -> None:
+        """Close every pooled connection (called at interpreter exit)."""
+        if self._closed:
+            return
+        self._closed = True
+        stats = self.stats.snapshot()
+        if stats["requests"]:
+            logger.info(
+                f"HTTP pool: {stats['requests']} requests, {stats['new_connections']} connections, "
+                f"reuse rate {stats['reuse_rate']:.0%}, avg wait {stats['avg_wait_ms']}ms"
+            )
+        self._transport.close()
+
+# Global connection pool (created on first use)
+http_pool = LazyProxy(PooledTransport)
+
+def get_transport() -> PooledTransport:
+    """Return the process-wide pooled transport (the real object, for httpx clients)."""
+    return http_pool._resolve()
+
+def client(**kwargs) -> httpx.Client:
+    """Create an ``httpx.Client`` that sends through the shared pool.
+
+    Args:
+        **kwargs: Passed to ``httpx.Client`` (base_url, headers, timeout...)
+
+    Returns:
+        Client whose ``close()`` leaves the shared connections open
+    """
+    return httpx.Client(transport=get_transport(), **kwargs)
+
+def pool_stats() -> Dict[str, Any]:
+    """Statistics of the shared pool (empty counters if it was never used)."""
+    if not http_pool.is_initialized:
+        return PoolStats().snapshot()
+    return http_pool.stats.snapshot()
+
+__all__ = ["PooledTransport", "PoolStats", "http_pool", "get_transport", "client", "pool_stats"]
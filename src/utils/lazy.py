@@ -0,0 +1,57 @@
+"""Lazy initialization helpers for module-level singletons."""
+
+import threading
+from typing import Any, Callable
+
+class LazyProxy:
+    """Stand-in for a module-level object that is built on first use.
+
+    Importing a module that exposes ``db = LazyProxy(SupabaseClient)`` costs
+    nothing: the client (and its network setup and env checks) is created the
+    first time an attribute is read, once, even across threads. Attribute
+    writes go to the real object too.
+
+    Usage:
+        db = LazyProxy(SupabaseClient)
+        db.get_story(story_id)  # SupabaseClient() is created here
+    """
+
+    def __init__(self, factory: Callable[[], Any]):
+        """Initialize proxy.
+
+        Args:
+            factory: Zero-argument callable that builds the real object
+        """
+        object.__setattr__(self, "_factory", factory)
+        object.__setattr__(self, "_instance", None)
+        object.__setattr__(self, "_lock", threading.Lock())
+
+    def _resolve(self) -> Any:
+        """Build the real object if needed and return it."""
+        instance = object.__getattribute__(self, "_instance")
+        if instance is None:
+            with object.__getattribute__(self, "_lock"):
+                instance = object.__getattribute__(self, "_instance")
+                if instance is None:
+                    instance = object.__getattribute__(self, "_factory")()
+                    object.__setattr__(self, "_instance", instance)
+        return instance
+
+    @property
+    def is_initialized(self) -> bool:
+        """Whether the real object has been built yet."""
+        return object.__getattribute__(self, "_instance") is not None
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._resolve(), name)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        setattr(self._resolve(), name, value)
+
+    def __repr__(self) -> str:
+        if not self.is_initialized:
+            factory = object.__getattribute__(self, "_factory")
+            return f"<LazyProxy for {getattr(factory, '__name__', factory)} (not initialized)>"
+        return repr(self._resolve())
+
+__all__ = ["LazyProxy"]
@@ -0,0 +1,290 @@
+"""Shared outbound rate limiting: token buckets per service with 429 retry/backoff."""
+
+import functools
+import random
+import threading
+import time
+from typing import Any, Callable, Dict, Mapping, Optional, TypeVar
+from src.utils.logger import get_logger
+from src.utils.config_loader import config
+
+logger = get_logger(__name__)
+
+T = TypeVar("T")
+
+# Defaults used when a service has no rate_limits entry in config
+DEFAULT_LIMITS = {
+    "reddit": {"requests_per_second": 1.5, "burst": 10},
+    "supabase": {"requests_per_second": 20, "burst": 40},
+    "anthropic": {"requests_per_second": 0.8, "burst": 4},
+    "tts": {"requests_per_second": 2, "burst": 4},
+}
+
+class RateLimitExceeded(Exception):
+    """Raised when a call is still rate limited after all retries."""
+
+class TokenBucket:
+    """Thread-safe token bucket.
+
+    Tokens refill continuously at ``rate`` per second up to ``capacity``;
+    each request takes one token and waits if none are left. Services that
+    report their quota in ``X-Ratelimit-Remaining``/``X-Ratelimit-Reset``
+    headers (Reddit) re-tune the bucket after every response, and a 429
+    pauses the bucket for everyone sharing it.
+    """
+
+    def __init__(self, name: str, rate: float, capacity: float):
+        """Initialize token bucket.
+
+        Args:
+            name: Service name (for logging)
+            rate: Tokens added per second
+            capacity: Maximum tokens (burst size)
+        """
+        self.name = name
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.paused_until = 0.0
+        self.total_wait = 0.0
+
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self, now: float) -> None:
+        self.tokens = min(self.capacity, self.tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def _try_take(self, tokens: float, waited: float) -> float:
+        """Take tokens if available.
+
+        Returns:
+            0.0 if taken, otherwise seconds to wait before trying again
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+
+            if now >= self.paused_until and self.tokens >= tokens:
+                self.tokens -= tokens
+                self.total_wait += waited
+                return 0.0
+
+            if now < self.paused_until:
+                return self.paused_until - now
+            return max((tokens - self.tokens) / max(self.rate, 1e-6), 1e-3)
+
+    def acquire(self, tokens: float = 1.0) -> float:
+        """Take tokens, waiting until they are available.
+
+        Args:
+            tokens: Tokens to take
+
+        Returns:
+            Seconds spent waiting
+        """
+        waited = 0.0
+        while True:
+            delay = self._try_take(tokens, waited)
+            if not delay:
+                return waited
+            time.sleep(delay)
+            waited += delay
+
+    async def acquire_async(self, tokens: float = 1.0) -> float:
+        """Take tokens without blocking the event loop (same bucket as acquire).
+
+        Args:
+            tokens: Tokens to take
+
+        Returns:
+            Seconds spent waiting
+        """
+        import asyncio  # Only needed inside an event loop, where it is already loaded
+
+        waited = 0.0
+        while True:
+            delay = self._try_take(tokens, waited)
+            if not delay:
+                return waited
+            await asyncio.sleep(delay)
+            waited += delay
+
+    def pause(self, seconds: float) -> None:
+        """Stop handing out tokens for a while (e.g. after a 429).
+
+        Args:
+            seconds: Pause duration
+        """
+        with self._lock:
+            self.paused_until = max(self.paused_until, time.monotonic() + seconds)
+            self.tokens = 0.0
+
+    def update_from_headers(self, headers: Mapping[str, str]) -> None:
+        """Re-tune the bucket from X-Ratelimit-Remaining/Reset response headers.
+
+        The remaining quota is spread evenly over the time left in the
+        window, so a burst early in the window can't exhaust it.
+
+        Args:
+            headers: Response headers (case-insensitive mapping)
+        """
+        remaining = headers.get("x-ratelimit-remaining")
+        reset = headers.get("x-ratelimit-reset")
+        if remaining is None or reset is None:
+            return
+
+        try:
+            remaining = float(remaining)
+            reset = max(float(reset), 1.0)
+        except ValueError:
+            return
+
+        with self._lock:
+            self._refill(time.monotonic())
+            if remaining < 1:
+                self.tokens = 0.0
+                self.paused_until = max(self.paused_until, time.monotonic() + reset)
+                logger.warning(f"{self.name} quota exhausted, pausing {reset:.0f}s until reset")
+            else:
+                self.rate = remaining / reset
+                self.tokens = min(self.tokens, remaining)
+
+# ============================================================================
+# REGISTRY
+# ============================================================================
+
+_buckets: Dict[str, TokenBucket] = {}
+_buckets_lock = threading.Lock()
+
+def get_bucket(service: str) -> TokenBucket:
+    """Get the shared token bucket for a service (created from config on first use).
+
+    Args:
+        service: Service name ('reddit', 'supabase', 'anthropic', 'tts', ...)
+
+    Returns:
+        Token bucket shared by every caller in this process
+    """
+    with _buckets_lock:
+        bucket = _buckets.get(service)
+        if bucket is None:
+            defaults = DEFAULT_LIMITS.get(service, {"requests_per_second": 5, "burst": 10})
+            rate = config.get(f"rate_limits.{service}.requests_per_second", defaults["requests_per_second"])
+            burst = config.get(f"rate_limits.{service}.burst", defaults["burst"])
+            bucket = TokenBucket(service, float(rate), float(burst))
+            _buckets[service] = bucket
+        return bucket
+
+# ============================================================================
+# RETRIES
+# ============================================================================
+
+def retry_after(error: BaseException) -> Optional[float]:
+    """Check whether an error is a rate-limit response.
+
+    Works with requests/httpx/prawcore/anthropic/gTTS errors that carry a
+    response or status code, and postgrest errors that carry the code.
+
+    Args:
+        error: Exception raised by a client library
+
+    Returns:
+        Seconds to wait (0.0 if the server didn't say), or None if not a 429
+    """
+    # Not `or`: requests.Response is falsy for error statuses
+    response = getattr(error, "response", None)
+    if response is None:
+        response = getattr(error, "rsp", None)
+    status = getattr(error, "status_code", None) or getattr(response, "status_code", None)
+    if status is None and str(getattr(error, "code", "")) == "429":
+        status = 429
+    if status != 429:
+        return None
+
+    headers = getattr(response, "headers", None)
+    if headers is None:
+        headers = {}
+    value = headers.get("retry-after") or headers.get("x-ratelimit-reset")
+    try:
+        return float(value) if value is not None else 0.0
+    except ValueError:
+        return 0.0
+
+def backoff_delay(attempt: int, server_delay: Optional[float] = None) -> float:
+    """Exponential backoff with jitter, or the server's requested delay if longer.
+
+    Args:
+        attempt: Retry number (0 for the first retry)
+        server_delay: Delay requested by the server (Retry-After)
+
+    Returns:
+        Seconds to wait
+    """
+    base = config.get("rate_limits.backoff_base_seconds", 1.0)
+    cap = config.get("rate_limits.backoff_max_seconds", 60.0)
+    delay = min(cap, base * (2 ** attempt)) * (0.5 + random.random() / 2)
+    return max(delay, server_delay or 0.0)
+
+def call_with_rate_limit(service: str, func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+    """Call func under a service's rate limit, retrying 429 responses with backoff.
+
+    Errors that aren't rate limits are raised immediately.
+
+    Args:
+        service: Service name
+        func: Function making one outbound request
+        *args: Positional arguments for func
+        **kwargs: Keyword arguments for func
+
+    Returns:
+        func's return value
+
+    Raises:
+        RateLimitExceeded: If still rate limited after the configured retries
+    """
+    bucket = get_bucket(service)
+    max_retries = config.get("rate_limits.max_retries", 5)
+
+    for attempt in range(max_retries + 1):
+        bucket.acquire()
+        try:
+            return func(*args, **kwargs)
+        except Exception as e:
+            server_delay = retry_after(e)
+            if server_delay is None:
+                raise
+            if attempt == max_retries:
+                raise RateLimitExceeded(f"{service} still rate limited after {max_retries} retries") from e
+
+            delay = backoff_delay(attempt, server_delay)
+            logger.warning(f"{service} rate limited (429), retrying in {delay:.1f}s")
+            bucket.pause(delay)
+
+    raise RateLimitExceeded(f"{service} still rate limited")  # Not reached
+
+def rate_limited(service: str) -> Callable[[Callable[..., T]], Callable[..., T]]:
+    """Decorator form of call_with_rate_limit.
+
+    Args:
+        service: Service name
+
+    Returns:
+        Decorator
+    """
+    def decorator(func: Callable[..., T]) -> Callable[..., T]:
+        @functools.wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> T:
+            return call_with_rate_limit(service, func, *args, **kwargs)
+        return wrapper
+    return decorator
+
+__all__ = [
+    "TokenBucket",
+    "RateLimitExceeded",
+    "get_bucket",
+    "retry_after",
+    "backoff_delay",
+    "call_with_rate_limit",
+    "rate_limited",
+]
@@ -15,6 +15,14 @@ except ImportError:
     st.error("Supabase library not installed. Run: pip install supabase")
     st.stop()
 
+# Shared HTTP connection pool from the pipeline (when deployed with the src/ dependencies)
+try:
+    from src.database.supabase_client import create_pooled_client
+    from src.utils.http_pool import pool_stats
+except ImportError:
+    create_pooled_client = None
+    pool_stats = None
+
 # Page config
 st.set_page_config(
     page_title="Video Approval Dashboard",
@@ -26,6 +34,13 @@ st.set_page_config(
 SUPABASE_URL = os.getenv("SUPABASE_URL", "")
 SUPABASE_KEY = os.getenv("SUPABASE_KEY", "")
 
+@st.cache_resource
+def _create_supabase_client():
+    """Create the Supabase client shared by every session (keeps its connections alive)."""
+    if create_pooled_client is not None:
+        return create_pooled_client(SUPABASE_URL, SUPABASE_KEY)
+    return create_client(SUPABASE_URL, SUPABASE_KEY)
+
 def get_supabase_client():
     """Get Supabase client with error handling."""
     if not SUPABASE_URL or not SUPABASE_KEY:
@@ -39,7 +54,7 @@ DASHBOARD_PASSWORD=your_password
         st.stop()
 
     try:
-        return create_client(SUPABASE_URL, SUPABASE_KEY)
+        return _create_supabase_client()
     except Exception as e:
         st.error(f"❌ Failed to connect to Supabase: {e}")
         st.info("Check that your Supabase credentials are correct.")
@@ -80,35 +95,86 @@ page = st.sidebar.radio("Navigation", [
     "⚙️ Settings"
 ])
 
+# Videos loaded per page ("Load more" fetches the next one)
+PAGE_SIZE = 20
+
 # Helper functions
-def get_pending_videos():
-    """Get videos pending approval."""
+# Column each status is listed by (newest first); others use created_at
+SORT_COLUMNS = {'approved': 'approved_at'}
+
+def fetch_videos_page(status, columns, after=None):
+    """Fetch one page of videos, newest first.
+
+    Keyset pagination on (sort column, id): after is the last video already
+    shown, so each page is an index range scan instead of an OFFSET. Rows
+    without a sort timestamp come last.
+    """
+    column = SORT_COLUMNS.get(status, 'created_at')
+    db = get_supabase_client()
+    query = db.table('videos').select(columns).eq('status', status) \
+        .order(f'{column}.desc.nullslast,id.desc').limit(PAGE_SIZE)
+    if after:
+        stamp, last_id = after
+        if stamp is None:
+            query = query.is_(column, 'null').lt('id', last_id)
+        else:
+            # postgrest-py < 0.14 has no .or_(): add the or=(...) parameter directly
+            query.params = query.params.add(
+                'or', f'({column}.lt."{stamp}",and({column}.eq."{stamp}",id.lt.{last_id}),{column}.is.null)'
+            )
+    return query.execute().data
+
+def get_videos(status, columns):
+    """Videos loaded so far for a status (first page on first call)."""
+    key = f"videos_{status}"
+    if key not in st.session_state:
+        st.session_state[key] = {"columns": columns, "videos": [], "after": None, "done": False}
+        load_more_videos(status)
+    return st.session_state[key]
+
+def load_more_videos(status):
+    """Append the next page of videos for a status."""
+    state = st.session_state[f"videos_{status}"]
     try:
-        # Get Supabase client
-        db = get_supabase_client()
-
-        # Join videos with stories to get story details
-        response = db.table('videos').select(
-            'id, video_url, duration, created_at, status, story_id, '
-            'stories(title, virality_score, body, reddit_id)'
-        ).eq('status', 'pending_approval').order('created_at', desc=True).execute()
-        return response.data
+        page = fetch_videos_page(status, state["columns"], state["after"])
     except Exception as e:
         st.error(f"Error fetching videos: {e}")
-        return []
+        return
+    state["videos"].extend(page)
+    state["done"] = len(page) < PAGE_SIZE
+    if page:
+        column = SORT_COLUMNS.get(status, 'created_at')
+        state["after"] = (page[-1][column], page[-1]['id'])
+
+def reset_videos():
+    """Forget loaded pages (after an approval changes what each page holds)."""
+    for status in ('pending_approval', 'approved'):
+        st.session_state.pop(f"videos_{status}", None)
+
+def get_pending_videos():
+    """Get videos pending approval."""
+    return get_videos(
+        'pending_approval',
+        'id, video_url, duration, created_at, status, story_id, '
+        'stories(title, virality_score, body, reddit_id)'
+    )
 
 def get_approved_videos():
     """Get approved videos."""
-    try:
-        db = get_supabase_client()
-        response = db.table('videos').select(
-            'id, video_url, duration, created_at, approved_at, story_id, '
-            'stories(title, virality_score)'
-        ).eq('status', 'approved').order('approved_at', desc=True).execute()
-        return response.data
-    except Exception as e:
-        st.error(f"Error fetching videos: {e}")
-        return []
+    return get_videos(
+        'approved',
+        'id, created_at, approved_at, stories(title)'
+    )
+
+def get_published_platforms(video_ids):
+    """Published platforms per video, for a page of videos in one request."""
+    db = get_supabase_client()
+    posts = db.table('platform_posts').select('video_id, platform').in_('video_id', video_ids) \
+        .eq('status', 'published').execute()
+    platforms = {}
+    for post in posts.data:
+        platforms.setdefault(post['video_id'], []).append(post['platform'])
+    return platforms
 
 def approve_video(video_id):
     """Approve a video."""
@@ -119,6 +185,7 @@ def approve_video(video_id):
             'approved_at': datetime.now().isoformat()
         }).eq('id', video_id).execute()
         st.success("Video approved!")
+        reset_videos()
         st.rerun()
     except Exception as e:
         st.error(f"Error approving video: {e}")
@@ -131,6 +198,7 @@ def reject_video(video_id):
             'status': 'rejected'
         }).eq('id', video_id).execute()
         st.success("Video rejected!")
+        reset_videos()
         st.rerun()
     except Exception as e:
         st.error(f"Error rejecting video: {e}")
@@ -139,12 +207,14 @@ def reject_video(video_id):
 if page == "📥 Pending Approval":
     st.title("📥 Videos Pending Approval")
 
-    videos = get_pending_videos()
+    loaded = get_pending_videos()
+    videos = loaded["videos"]
 
     if not videos:
         st.info("No videos pending approval. Run the video generator to create new videos!")
     else:
-        st.write(f"**{len(videos)} video(s) awaiting your review**")
+        more = "" if loaded["done"] else "+"
+        st.write(f"**{len(videos)}{more} video(s) awaiting your review**")
         st.write("---")
 
         for video in videos:
@@ -196,18 +266,29 @@ if page == "📥 Pending Approval":
 
                 st.write("---")
 
+        if not loaded["done"] and st.button("Load more"):
+            load_more_videos('pending_approval')
+            st.rerun()
+
 # PAGE 2: Approved Videos
 elif page == "✅ Approved Videos":
     st.title("✅ Approved Videos")
 
-    videos = get_approved_videos()
+    loaded = get_approved_videos()
+    videos = loaded["videos"]
 
     if not videos:
         st.info("No approved videos yet. Approve some videos from the Pending Approval page!")
     else:
-        st.write(f"**{len(videos)} approved video(s) ready for upload**")
+        more = "" if loaded["done"] else "+"
+        st.write(f"**{len(videos)}{more} approved video(s) ready for upload**")
         st.write("---")
 
+        try:
+            published = get_published_platforms([video['id'] for video in videos])
+        except Exception:
+            published = {}
+
         for video in videos:
             col1, col2, col3 = st.columns([3, 1, 1])
 
@@ -217,20 +298,16 @@ elif page == "✅ Approved Videos":
                 st.caption(f"Approved: {video['approved_at'][:10] if video.get('approved_at') else 'N/A'}")
             with col3:
                 # Check if already uploaded
-                try:
-                    db = get_supabase_client()
-                    posts = db.table('platform_posts').select('platform, status').eq('video_id', video['id']).execute()
-                    if posts.data:
-                        platforms = [p['platform'] for p in posts.data if p['status'] == 'published']
-                        if platforms:
-                            st.success(f"Posted: {', '.join(platforms)}")
-                        else:
-                            st.info("Ready to upload")
-                    else:
-                        st.info("Ready to upload")
-                except:
+                platforms = published.get(video['id'])
+                if platforms:
+                    st.success(f"Posted: {', '.join(platforms)}")
+                else:
                     st.info("Ready to upload")
 
+        if not loaded["done"] and st.button("Load more"):
+            load_more_videos('approved')
+            st.rerun()
+
 # PAGE 3: Analytics
 elif page == "📊 Analytics":
     st.title("📊 Analytics Dashboard")
@@ -238,14 +315,20 @@ elif page == "📊 Analytics":
     # Get metrics
     try:
         db = get_supabase_client()
-        total_stories = db.table('stories').select('id', count='exact').execute()
-        total_videos = db.table('videos').select('id', count='exact').execute()
-        approved_videos = db.table('videos').select('id', count='exact').eq('status', 'approved').execute()
-        pending_videos = db.table('videos').select('id', count='exact').eq('status', 'pending_approval').execute()
+
+        # Per-day rollup rows (kept current by triggers), newest first
+        daily = db.table('daily_story_counts').select(
+            'day, stories_scraped, stories_selected, high_virality_stories'
+        ).order('day', desc=True).execute().data
+
+        # Counts come from the response header; limit(1) avoids transferring every id
+        total_videos = db.table('videos').select('id', count='exact').limit(1).execute()
+        approved_videos = db.table('videos').select('id', count='exact').eq('status', 'approved').limit(1).execute()
+        pending_videos = db.table('videos').select('id', count='exact').eq('status', 'pending_approval').limit(1).execute()
 
         col1, col2, col3, col4 = st.columns(4)
         with col1:
-            st.metric("Total Stories", total_stories.count if total_stories.count else 0)
+            st.metric("Total Stories", sum(row['stories_scraped'] for row in daily))
         with col2:
             st.metric("Total Videos", total_videos.count if total_videos.count else 0)
         with col3:
@@ -255,6 +338,28 @@ elif page == "📊 Analytics":
 
         st.write("---")
 
+        # Platform performance (aggregated from daily per-platform rollups)
+        platforms = db.table('platform_performance').select(
+            'platform, total_views, avg_views, avg_engagement_rate, max_views'
+        ).execute()
+
+        if platforms.data:
+            import pandas as pd
+            st.subheader("📱 Platform Performance")
+            df = pd.DataFrame(platforms.data)
+            df.columns = ['Platform', 'Total Views', 'Avg Views', 'Avg Engagement', 'Max Views']
+            df['Avg Views'] = df['Avg Views'].round(0)
+            df['Avg Engagement'] = df['Avg Engagement'].round(3)
+            st.dataframe(df, use_container_width=True, hide_index=True)
+
+        # Daily pipeline activity (last 30 scrape days)
+        if daily:
+            import pandas as pd
+            st.subheader("🗓️ Daily Pipeline")
+            df = pd.DataFrame(daily[:30]).set_index('day').sort_index()
+            df.columns = ['Scraped', 'Selected', 'High Virality']
+            st.bar_chart(df)
+
         # Recent stories
         st.subheader("📈 Recent Stories")
         stories = db.table('stories').select('title, virality_score, created_utc, status').order('created_utc', desc=True).limit(10).execute()
@@ -288,6 +393,20 @@ elif page == "⚙️ Settings":
     st.write(f"**Supabase Key:** {'✅ Set' if SUPABASE_KEY else '❌ Missing'}")
     st.write(f"**Dashboard Password:** {'✅ Set' if os.getenv('DASHBOARD_PASSWORD') else '❌ Using default (admin123)'}")
 
+    if pool_stats is not None:
+        st.write("---")
+        st.subheader("Connection Pool")
+        stats = pool_stats()
+        col1, col2, col3, col4 = st.columns(4)
+        with col1:
+            st.metric("Requests", stats['requests'])
+        with col2:
+            st.metric("Connections Opened", stats['new_connections'])
+        with col3:
+            st.metric("Reuse Rate", f"{stats['reuse_rate']:.0%}")
+        with col4:
+            st.metric("Avg Wait", f"{stats['avg_wait_ms']} ms")
+
 # Footer
 st.sidebar.write("---")
 st.sidebar.caption("Built with Streamlit + Vercel")